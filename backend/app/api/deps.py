@@ -6,28 +6,37 @@ from app.services.mcp.manager import MCPManager
 from app.services.llm.ollama_client import OllamaClient
 from app.services.chat.orchestrator import ChatOrchestrator
 from app.services.chat.conversation import ConversationManager
+from app.services.health.prober import HealthProber
+from app.services.artifacts import ArtifactStore
 
 # Global instances (initialized on startup)
 _mcp_manager: Optional[MCPManager] = None
 _ollama_client: Optional[OllamaClient] = None
 _conversation_manager: Optional[ConversationManager] = None
 _chat_orchestrator: Optional[ChatOrchestrator] = None
+_health_prober: Optional[HealthProber] = None
+_artifact_store: Optional[ArtifactStore] = None
 
 
 def init_dependencies(
     mcp_manager: MCPManager,
     ollama_client: OllamaClient,
     conversation_manager: ConversationManager,
+    health_prober: HealthProber,
+    artifact_store: ArtifactStore,
 ) -> None:
     """Initialize global dependencies.
 
     Called during app startup.
     """
     global _mcp_manager, _ollama_client, _conversation_manager, _chat_orchestrator
+    global _health_prober, _artifact_store
 
     _mcp_manager = mcp_manager
     _ollama_client = ollama_client
     _conversation_manager = conversation_manager
+    _health_prober = health_prober
+    _artifact_store = artifact_store
     _chat_orchestrator = ChatOrchestrator(
         mcp_manager=mcp_manager,
         ollama_client=ollama_client,
@@ -61,3 +70,17 @@ def get_chat_orchestrator() -> ChatOrchestrator:
     if _chat_orchestrator is None:
         raise RuntimeError("Chat orchestrator not initialized")
     return _chat_orchestrator
+
+
+def get_health_prober() -> HealthProber:
+    """Get health prober instance."""
+    if _health_prober is None:
+        raise RuntimeError("Health prober not initialized")
+    return _health_prober
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get artifact store instance."""
+    if _artifact_store is None:
+        raise RuntimeError("Artifact store not initialized")
+    return _artifact_store
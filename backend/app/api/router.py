@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.api.routes import health, models, chat, mcp_servers
+from app.api.routes import health, models, chat, mcp_servers, artifacts
 
 api_router = APIRouter()
 
@@ -11,3 +11,4 @@ api_router.include_router(health.router)
 api_router.include_router(models.router)
 api_router.include_router(chat.router)
 api_router.include_router(mcp_servers.router)
+api_router.include_router(artifacts.router)
@@ -0,0 +1,99 @@
+"""Full tool result (artifact) endpoints."""
+
+import re
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import get_artifact_store
+from app.services.artifacts import ArtifactStore
+
+router = APIRouter(prefix="/artifacts", tags=["Artifacts"])
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _not_found(store: ArtifactStore, artifact_id: str) -> HTTPException:
+    """Build the error for a missing artifact: 410 if it expired, else 404."""
+    if store.is_expired(artifact_id):
+        return HTTPException(status_code=410, detail=f"Artifact '{artifact_id}' has expired")
+    return HTTPException(status_code=404, detail=f"Artifact '{artifact_id}' not found")
+
+
+@router.get("/{artifact_id}/meta")
+async def get_artifact_meta(
+    artifact_id: str,
+    store: ArtifactStore = Depends(get_artifact_store),
+) -> dict:
+    """Get artifact size and content type."""
+    meta = store.get_meta(artifact_id)
+    if meta is None:
+        raise _not_found(store, artifact_id)
+    return {
+        "id": meta.artifact_id,
+        "size": meta.size,
+        "content_type": meta.content_type,
+        "expires_at": meta.expires_at,
+    }
+
+
+@router.get("/{artifact_id}")
+async def get_artifact(
+    artifact_id: str,
+    offset: int = Query(0, ge=0, description="First byte to return"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum bytes to return"),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    store: ArtifactStore = Depends(get_artifact_store),
+) -> StreamingResponse:
+    """Stream a full tool result.
+
+    Supports paging with `offset`/`limit` and standard `Range: bytes=` requests
+    (single range only).
+    """
+    meta = store.get_meta(artifact_id)
+    if meta is None:
+        raise _not_found(store, artifact_id)
+
+    status_code = 200
+    start, end = offset, meta.size if limit is None else min(offset + limit, meta.size)
+
+    if range_header:
+        match = _RANGE_RE.match(range_header.strip())
+        if not match or match.groups() == ("", ""):
+            raise HTTPException(status_code=416, detail="Unsupported Range header")
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last) + 1, meta.size) if last else meta.size
+        else:
+            # Suffix range: last N bytes
+            start, end = max(meta.size - int(last), 0), meta.size
+        status_code = 206
+
+    if start >= meta.size and meta.size > 0 or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail=f"Range not satisfiable (size {meta.size})",
+            headers={"Content-Range": f"bytes */{meta.size}"},
+        )
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(end - start),
+        "X-Artifact-Size": str(meta.size),
+    }
+    if status_code == 206:
+        headers["Content-Range"] = f"bytes {start}-{max(end - 1, start)}/{meta.size}"
+
+    try:
+        content = store.iter_range(artifact_id, start, end)
+    except KeyError:
+        raise _not_found(store, artifact_id)
+
+    return StreamingResponse(
+        content,
+        status_code=status_code,
+        media_type=meta.content_type,
+        headers=headers,
+    )
@@ -1,11 +1,16 @@
 """Chat endpoints with SSE streaming support."""
 
+import json
+from contextlib import aclosing
+
 from fastapi import APIRouter, Depends, HTTPException
 from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import get_chat_orchestrator
 from app.api.schemas.chat import ChatRequest, ChatResponse
 from app.services.chat.orchestrator import ChatOrchestrator
+from app.services.llm.admission import AdmissionTimeoutError
+from app.services.llm.ollama_client import LLMTimeoutError
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
@@ -19,7 +24,16 @@ async def chat(
 
     Returns complete response after all tool executions.
     """
-    return await orchestrator.chat(request)
+    try:
+        return await orchestrator.chat(request)
+    except AdmissionTimeoutError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
 
 
 @router.post("/stream")
@@ -38,19 +52,23 @@ async def chat_stream(
     """
 
     async def event_generator():
-        try:
-            async for event in orchestrator.chat_stream(request):
+        # On client disconnect the SSE response cancels this generator; the
+        # orchestrator stream is closed explicitly so that cancellation reaches
+        # the Ollama stream and running tool calls right away
+        stream = orchestrator.chat_stream(request)
+        async with aclosing(stream):
+            try:
+                async for event in stream:
+                    yield {
+                        "event": event.type,
+                        "data": event.model_dump_json(),
+                    }
+            except Exception as e:
                 yield {
-                    "event": event.type,
-                    "data": event.model_dump_json(),
+                    "event": "error",
+                    "data": json.dumps({"code": "STREAM_ERROR", "message": str(e)}),
                 }
-        except Exception as e:
-            yield {
-                "event": "error",
-                "data": f'{{"code": "STREAM_ERROR", "message": "{str(e)}"}}',
-            }
-        finally:
-            yield {"data": "[DONE]"}
+        yield {"data": "[DONE]"}
 
     return EventSourceResponse(
         event_generator(),
@@ -4,43 +4,48 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 
 from app.api.schemas.health import HealthResponse, ComponentStatus
-from app.api.deps import get_mcp_manager, get_ollama_client
-from app.services.mcp.manager import MCPManager
-from app.services.llm.ollama_client import OllamaClient
+from app.api.deps import get_health_prober
+from app.services.health.prober import HealthProber
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
 @router.get("", response_model=HealthResponse)
 async def health(
-    mcp_manager: MCPManager = Depends(get_mcp_manager),
-    ollama_client: OllamaClient = Depends(get_ollama_client),
+    prober: HealthProber = Depends(get_health_prober),
 ) -> HealthResponse:
-    """Aggregated health of all components."""
-    # Check Ollama
-    ollama_healthy = await ollama_client.is_healthy()
-
-    # Check MCP servers
-    mcp_status = await mcp_manager.get_health_status()
-
-    components = {
-        "ollama": ComponentStatus(
-            status="healthy" if ollama_healthy else "unhealthy",
-            details={"base_url": ollama_client.base_url},
-        ),
-    }
-
-    for name, status in mcp_status.items():
-        components[f"mcp:{name}"] = ComponentStatus(
-            status="healthy" if status["connected"] else "unhealthy",
-            details=status,
+    """Aggregated health of all components.
+
+    Served from the background prober's latest results.
+    """
+    if not prober.has_run:
+        return HealthResponse(
+            status="unhealthy",
+            components={
+                "prober": ComponentStatus(
+                    status="unhealthy",
+                    details={"reason": "First health probe pending"},
+                ),
+            },
+        )
+
+    components = {}
+    for key, result in prober.components.items():
+        components[key] = ComponentStatus(
+            status="healthy" if result.healthy else "unhealthy",
+            details={
+                **result.details,
+                "latency_ms": result.latency_ms,
+                "latency_history_ms": prober.get_latency_history(key),
+                "checked_at": result.checked_at.isoformat(),
+            },
         )
 
     # Determine overall status
-    all_healthy = ollama_healthy and all(
-        s["connected"] for s in mcp_status.values()
+    ollama_healthy = prober.components["ollama"].healthy
+    has_mcp_issues = not all(
+        r.healthy for k, r in prober.components.items() if k.startswith("mcp:")
     )
-    has_mcp_issues = not all(s["connected"] for s in mcp_status.values())
 
     if not ollama_healthy:
         overall_status = "unhealthy"
@@ -63,20 +68,25 @@ async def liveness() -> dict:
 
 @router.get("/ready")
 async def readiness(
-    mcp_manager: MCPManager = Depends(get_mcp_manager),
-    ollama_client: OllamaClient = Depends(get_ollama_client),
+    prober: HealthProber = Depends(get_health_prober),
 ) -> JSONResponse:
-    """Kubernetes readiness probe."""
-    ollama_healthy = await ollama_client.is_healthy()
+    """Kubernetes readiness probe.
 
-    if not ollama_healthy:
+    Served from the background prober's latest results.
+    """
+    if not prober.has_run:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "not ready", "reason": "First health probe pending"},
+        )
+
+    if not prober.components["ollama"].healthy:
         return JSONResponse(
             status_code=503,
             content={"status": "not ready", "reason": "Ollama unavailable"},
         )
 
-    mcp_status = await mcp_manager.get_health_status()
-    if not any(s["connected"] for s in mcp_status.values()):
+    if not any(r.healthy for k, r in prober.components.items() if k.startswith("mcp:")):
         return JSONResponse(
             status_code=503,
             content={"status": "not ready", "reason": "No MCP servers connected"},
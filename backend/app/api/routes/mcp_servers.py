@@ -17,6 +17,34 @@ async def list_servers(
     return mcp_manager.get_servers_info()
 
 
+@router.post("/reload")
+async def reload_servers(
+    mcp_manager: MCPManager = Depends(get_mcp_manager),
+) -> dict:
+    """Reload mcp_servers.json and reconcile registered servers.
+
+    Only added, removed and changed servers are touched.
+    """
+    try:
+        summary = await mcp_manager.reload_config()
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid MCP config: {e}")
+    return {"status": "success", **summary}
+
+
+@router.get("/metrics")
+async def get_servers_metrics(
+    mcp_manager: MCPManager = Depends(get_mcp_manager),
+) -> dict:
+    """Concurrency, queue and circuit breaker metrics for all servers."""
+    return {
+        "servers": mcp_manager.get_server_metrics(),
+        "tool_cache": mcp_manager.get_cache_stats(),
+    }
+
+
 @router.get("/{server_name}")
 async def get_server(
     server_name: str,
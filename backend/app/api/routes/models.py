@@ -33,6 +33,26 @@ async def list_installed_models(
         raise HTTPException(status_code=503, detail=f"Ollama unavailable: {e}")
 
 
+@router.get("/queue")
+async def get_queue_metrics(
+    ollama: OllamaClient = Depends(get_ollama_client),
+) -> dict:
+    """Get per-model admission queue depth, in-flight count and wait times."""
+    return {"models": ollama.admission.metrics()}
+
+
+@router.get("/metrics")
+async def get_llm_metrics(
+    ollama: OllamaClient = Depends(get_ollama_client),
+) -> dict:
+    """Get LLM request, retry and timeout counters, response cache and endpoint state."""
+    return {
+        "requests": ollama.get_metrics(),
+        "cache": ollama.cache.stats() if ollama.cache else None,
+        "endpoints": ollama.pool.status(),
+    }
+
+
 @router.get("/{model_name:path}")
 async def get_model_info(
     model_name: str,
@@ -27,6 +27,7 @@ class ChatRequest(BaseModel):
     rag_sources: List[str] = Field(default_factory=list)
     sub_agents: List[str] = Field(default_factory=list)
     enabled_mcp_servers: Optional[List[str]] = None  # None = all enabled
+    llm_cache: bool = True  # False bypasses the LLM response cache lookup
 
 
 class ChatResponse(BaseModel):
@@ -65,7 +66,14 @@ class StreamToolResultEvent(BaseModel):
     """Tool result received event."""
 
     type: Literal["tool_result"] = "tool_result"
-    tool_result: Dict[str, Any]  # {id, name, success, preview, duration_ms}
+    tool_result: Dict[str, Any]  # {id, name, success, preview, duration_ms, mcp_server, cached, artifact_id, result_size}
+
+
+class StreamQueuedEvent(BaseModel):
+    """Waiting for an LLM slot event."""
+
+    type: Literal["queued"] = "queued"
+    queue: Dict[str, Any]  # {position, model}
 
 
 class StreamDoneEvent(BaseModel):
@@ -79,13 +87,14 @@ class StreamErrorEvent(BaseModel):
     """Stream error event."""
 
     type: Literal["error"] = "error"
-    error: Dict[str, str]  # {code, message}
+    error: Dict[str, str]  # {code, message, status?}
 
 
 StreamEvent = Union[
     StreamContentEvent,
     StreamToolCallEvent,
     StreamToolResultEvent,
+    StreamQueuedEvent,
     StreamDoneEvent,
     StreamErrorEvent,
 ]
@@ -19,10 +19,13 @@ class ToolExecution(BaseModel):
     name: str
     arguments: Dict[str, Any]
     result_preview: str
-    result_full: Optional[Any] = None
+    artifact_id: Optional[str] = None  # Full result, served by /artifacts/{id}
+    result_size: int = 0  # Full result size in bytes
     duration_ms: int
     success: bool
     server_name: str
+    cached: bool = False
+    reused: bool = False  # Earlier result of the same call in this conversation
 
 
 class MCPServerInfo(BaseModel):
@@ -31,6 +34,7 @@ class MCPServerInfo(BaseModel):
     name: str
     transport: str
     connected: bool
+    state: str = "connected"  # connected | idle | disconnected
     enabled: bool
     tools_count: int
     tools: List[str] = []
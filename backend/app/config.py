@@ -1,6 +1,6 @@
 """Centralized configuration management using Pydantic Settings."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -9,11 +9,19 @@ class MCPServerConfig(BaseSettings):
     """Configuration for a single MCP server."""
 
     name: str
-    transport: str = "stdio"  # "stdio" | "http"
+    transport: str = "stdio"  # "stdio" | "inprocess" | "http"
     command: Optional[str] = None  # For stdio transport
     args: List[str] = Field(default_factory=list)
+    module: Optional[str] = None  # For inprocess transport: dotted name or .py path
     url: Optional[str] = None  # For HTTP transport
     enabled: bool = True
+    cache_ttl: Dict[str, int] = Field(default_factory=dict)  # Tool name -> result TTL (seconds)
+    max_concurrency: Optional[int] = None  # Max in-flight calls (None = MCP_MAX_CONCURRENT_CALLS)
+    queue_timeout: Optional[float] = None  # Seconds to wait for a slot (None = MCP_QUEUE_TIMEOUT)
+    lazy: Optional[bool] = None  # Spawn on first call (None = MCP_LAZY_START)
+    idle_timeout: Optional[float] = None  # Seconds idle before a lazy server stops (None = MCP_IDLE_TIMEOUT)
+    result_max_tokens: Dict[str, int] = Field(default_factory=dict)  # Tool name -> rendered result budget
+    memoize_exclude: List[str] = Field(default_factory=list)  # Non-deterministic tools never reused within a conversation
 
     class Config:
         extra = "allow"
@@ -23,10 +31,31 @@ class OllamaSettings(BaseSettings):
     """Ollama LLM configuration."""
 
     base_url: str = "http://192.168.1.146:11434"  # DGX Spark
+    endpoints: List[str] = Field(default_factory=list)  # Several hosts to balance over; empty uses base_url
     default_model: str = "devstral-small-2:latest"  # Best for tool calling
-    request_timeout: int = 120  # seconds (faster with GPU)
-    num_ctx: int = 8192  # Context window size
-    num_predict: int = 2048  # Max tokens to generate
+    request_timeout: int = 120  # seconds without data before a request is aborted (faster with GPU)
+    connect_timeout: float = 5.0  # seconds to connect to an endpoint
+    first_token_timeout: float = 60.0  # seconds for a stream's first chunk (load + prompt eval)
+    stream_stall_timeout: float = 30.0  # seconds allowed between two stream chunks
+    max_retries: int = 2  # Retry rounds over the endpoints after connection errors
+    retry_backoff_base: float = 0.5  # seconds, doubled each round (full jitter)
+    retry_backoff_max: float = 5.0  # seconds
+    num_ctx: int = 16384  # Largest context window a request may use
+    num_ctx_buckets: List[int] = Field(default_factory=lambda: [4096, 8192, 16384])  # Allowed num_ctx sizes
+    num_ctx_shrink_after: int = 8  # Consecutive requests fitting a smaller bucket before num_ctx shrinks back (0 = never)
+    num_predict: int = 2048  # Max tokens to generate for a final answer
+    num_predict_tools: int = 512  # Max tokens for a turn expected to call tools
+    temperature: Optional[float] = None  # Sampling temperature, None = model default
+    max_concurrent_requests: int = 2  # Concurrent requests per model and endpoint admitted to Ollama
+    model_concurrency: Dict[str, int] = Field(default_factory=dict)  # Per-model override
+    queue_timeout: float = 60.0  # seconds a request may wait for a slot
+    endpoint_failure_threshold: int = 2  # Consecutive failures before an endpoint is ejected
+    endpoint_eject_seconds: float = 30.0  # How long an ejected endpoint is skipped
+    sticky_max_imbalance: int = 2  # Extra in-flight requests tolerated to keep a conversation on its endpoint
+    keep_alive: str = "30m"  # How long Ollama keeps a model loaded after a request ("-1" = forever)
+    keep_alive_refresh_interval: float = 600.0  # seconds between keep-alive refreshes of idle models (0 = off)
+    warmup_on_startup: bool = True  # Preload warm models on every endpoint at startup
+    warm_models: List[str] = Field(default_factory=list)  # Kept loaded in addition to default_model
 
     class Config:
         env_prefix = "OLLAMA_"
@@ -37,6 +66,23 @@ class MCPSettings(BaseSettings):
 
     config_file: Optional[str] = "config/mcp_servers.json"
     connection_timeout: int = 30  # seconds
+    heartbeat_interval: float = 10.0  # seconds between liveness pings
+    heartbeat_timeout: float = 5.0  # seconds
+    reconnect_initial_delay: float = 0.1  # seconds, doubled on each failed respawn
+    reconnect_max_delay: float = 30.0  # seconds
+    max_concurrent_calls: int = 4  # per server
+    queue_timeout: float = 30.0  # seconds
+    breaker_failure_threshold: int = 5  # consecutive failures before opening
+    breaker_reset_timeout: float = 30.0  # seconds before a trial call
+    lazy_start: bool = False  # Spawn servers on first call instead of at startup
+    idle_timeout: float = 300.0  # seconds before an idle lazy server is stopped
+    tool_schema_cache_file: Optional[str] = "data/mcp_tool_schemas.json"
+    config_watch_interval: float = 2.0  # seconds between config file checks (0 = disabled)
+    validate_arguments: bool = True  # Check/coerce tool arguments against inputSchema
+    tool_cache_enabled: bool = True
+    tool_cache_max_entries: int = 512
+    tool_cache_max_bytes: int = 32 * 1024 * 1024  # 32 MB of result text
+    result_max_tokens: int = 1000  # Default token budget of a tool result shown to the LLM
 
     class Config:
         env_prefix = "MCP_"
@@ -45,14 +91,64 @@ class MCPSettings(BaseSettings):
 class ConversationSettings(BaseSettings):
     """Conversation management configuration."""
 
-    max_history_messages: int = 50
+    max_history_messages: int = 50  # User and assistant messages kept (tool calls and results not counted)
     ttl_hours: int = 24
     max_tool_iterations: int = 10
+    max_parallel_tool_calls: int = 4  # Tool calls of one LLM turn run concurrently up to this cap
+    tool_history_turns: int = 3  # User turns whose tool calls/results are kept in history (0 = none)
+    tool_history_max_tokens: int = 500  # Budget of each tool result kept in history
+    context_safety_tokens: int = 256  # Margin kept free in the context window
+    compacted_tool_result_tokens: int = 60  # Budget of an old tool result once compacted
+    # Schemas fetched at the start of new conversations ([] = disabled)
+    schema_prefetch_tables: List[str] = Field(
+        default_factory=lambda: ["operations", "engagements", "qpv_insee", "dictionnaire"]
+    )
+    schema_prefetch_tool: str = "get_table_schema"
+    schema_prefetch_ttl: int = 3600  # seconds prefetched schemas are reused across conversations
+    tool_memo_max_entries: int = 64  # Tool results reused within a conversation (0 = disabled)
 
     class Config:
         env_prefix = "CONVERSATION_"
 
 
+class HealthSettings(BaseSettings):
+    """Background health probing configuration."""
+
+    probe_interval: float = 10.0  # seconds between probes
+    probe_timeout: float = 5.0  # seconds per component check
+    history_size: int = 60  # latency samples kept per component
+
+    class Config:
+        env_prefix = "HEALTH_"
+
+
+class ArtifactSettings(BaseSettings):
+    """Full tool result storage configuration."""
+
+    memory_max_bytes: int = 64 * 1024 * 1024  # in-memory budget before spilling to disk
+    ttl_seconds: int = 3600
+    spill_dir: str = "data/artifacts"
+
+    class Config:
+        env_prefix = "ARTIFACT_"
+
+
+class LLMCacheSettings(BaseSettings):
+    """LLM response cache configuration (for repeated deterministic traffic)."""
+
+    enabled: bool = False
+    require_zero_temperature: bool = True  # Only cache when OLLAMA_TEMPERATURE=0
+    max_entries: int = 256  # in memory
+    max_bytes: int = 16 * 1024 * 1024  # in memory
+    disk_dir: str = "data/llm_cache"  # empty disables the disk tier
+    disk_max_bytes: int = 256 * 1024 * 1024
+    ttl_seconds: int = 7 * 24 * 3600  # 0 = never expire
+    replay: str = "paced"  # "paced" (original timing) or "instant" for streamed hits
+
+    class Config:
+        env_prefix = "LLM_CACHE_"
+
+
 class Settings(BaseSettings):
     """Main application settings."""
 
@@ -66,6 +162,9 @@ class Settings(BaseSettings):
     ollama: OllamaSettings = Field(default_factory=OllamaSettings)
     mcp: MCPSettings = Field(default_factory=MCPSettings)
     conversation: ConversationSettings = Field(default_factory=ConversationSettings)
+    health: HealthSettings = Field(default_factory=HealthSettings)
+    artifacts: ArtifactSettings = Field(default_factory=ArtifactSettings)
+    llm_cache: LLMCacheSettings = Field(default_factory=LLMCacheSettings)
 
     # SSE Configuration
     sse_retry_ms: int = 3000
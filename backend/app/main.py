@@ -9,10 +9,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from app import __version__
 from app.config import settings
 from app.api.router import api_router
-from app.api.deps import init_dependencies
+from app.api.deps import get_chat_orchestrator, init_dependencies
 from app.services.mcp.manager import MCPManager
 from app.services.llm.ollama_client import OllamaClient
+from app.services.llm.warmup import ModelWarmer
 from app.services.chat.conversation import ConversationManager
+from app.services.health.prober import HealthProber
+from app.services.artifacts import ArtifactStore
 
 # Configure logging
 logging.basicConfig(
@@ -28,20 +31,34 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting MCP-HIVE-SmartHub v{__version__}")
 
     # Initialize services
-    mcp_manager = MCPManager()
+    artifact_store = ArtifactStore()
+    mcp_manager = MCPManager(artifact_store=artifact_store)
     ollama_client = OllamaClient()
     conversation_manager = ConversationManager()
 
     # Initialize MCP connections
     await mcp_manager.initialize()
 
+    # Probe component health in the background
+    health_prober = HealthProber(mcp_manager, ollama_client)
+    await health_prober.start()
+
+    # Preload models and keep them loaded in the background
+    model_warmer = ModelWarmer(ollama_client)
+    await model_warmer.start()
+
     # Store in app state for cleanup
     app.state.mcp_manager = mcp_manager
     app.state.ollama_client = ollama_client
     app.state.conversation_manager = conversation_manager
+    app.state.health_prober = health_prober
+    app.state.model_warmer = model_warmer
+    app.state.artifact_store = artifact_store
 
     # Initialize dependencies for injection
-    init_dependencies(mcp_manager, ollama_client, conversation_manager)
+    init_dependencies(
+        mcp_manager, ollama_client, conversation_manager, health_prober, artifact_store
+    )
 
     logger.info("All services initialized")
 
@@ -49,7 +66,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down services...")
+    await health_prober.stop()
+    await model_warmer.stop()
+    await get_chat_orchestrator().close()
     await mcp_manager.shutdown()
+    await ollama_client.close()
+    artifact_store.close()
     logger.info("Shutdown complete")
 
 
@@ -0,0 +1,5 @@
+"""Artifact services module."""
+
+from app.services.artifacts.store import ArtifactStore, ArtifactMeta
+
+__all__ = ["ArtifactStore", "ArtifactMeta"]
@@ -0,0 +1,253 @@
+"""Content-addressed store for full tool results.
+
+Artifacts live in a bounded in-memory LRU and spill to disk when evicted
+(or straight away when too large), so full results stay retrievable by the
+UI without pinning them in memory. Every artifact expires after a TTL.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bound on remembered expired ids (to tell "expired" from "unknown")
+MAX_EXPIRED_IDS = 4096
+
+
+@dataclass
+class ArtifactMeta:
+    """Metadata of a stored artifact."""
+
+    artifact_id: str
+    size: int
+    content_type: str
+    created_at: float
+    expires_at: float
+
+
+class ArtifactStore:
+    """Bounded memory + disk artifact store with TTL."""
+
+    def __init__(
+        self,
+        memory_max_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        """Initialize artifact store.
+
+        Args:
+            memory_max_bytes: Memory budget. Defaults to settings value.
+            spill_dir: Directory for spilled artifacts. Defaults to settings value.
+            ttl_seconds: Artifact lifetime. Defaults to settings value.
+        """
+        self.memory_max_bytes = memory_max_bytes or settings.artifacts.memory_max_bytes
+        self.ttl_seconds = ttl_seconds or settings.artifacts.ttl_seconds
+        # One subdirectory per process: workers never touch each other's files
+        self.spill_dir = Path(spill_dir or settings.artifacts.spill_dir) / str(os.getpid())
+
+        self._meta: Dict[str, ArtifactMeta] = {}
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._expired: "OrderedDict[str, None]" = OrderedDict()
+
+    def put(self, data: bytes, content_type: str = "text/plain") -> ArtifactMeta:
+        """Store content, deduplicated by its hash.
+
+        Args:
+            data: Artifact content.
+            content_type: MIME type.
+
+        Returns:
+            Artifact metadata.
+        """
+        self._purge_expired()
+
+        artifact_id = hashlib.sha256(data).hexdigest()[:32]
+        now = time.time()
+        meta = self._meta.get(artifact_id)
+        if meta:
+            meta.expires_at = now + self.ttl_seconds
+            if artifact_id in self._memory:
+                self._memory.move_to_end(artifact_id)
+            return meta
+
+        self._expired.pop(artifact_id, None)
+        meta = ArtifactMeta(
+            artifact_id=artifact_id,
+            size=len(data),
+            content_type=content_type,
+            created_at=now,
+            expires_at=now + self.ttl_seconds,
+        )
+        self._meta[artifact_id] = meta
+
+        if len(data) > self.memory_max_bytes // 4:
+            self._spill(artifact_id, data)
+        else:
+            self._memory[artifact_id] = data
+            self._memory_bytes += len(data)
+            self._evict()
+
+        return meta
+
+    def get_meta(self, artifact_id: str) -> Optional[ArtifactMeta]:
+        """Get artifact metadata.
+
+        Args:
+            artifact_id: Artifact identifier.
+
+        Returns:
+            Metadata, or None if unknown or expired.
+        """
+        meta = self._meta.get(artifact_id)
+        if meta and meta.expires_at <= time.time():
+            self._expire(artifact_id)
+            return None
+        return meta
+
+    def is_expired(self, artifact_id: str) -> bool:
+        """Check whether an artifact existed but expired (or was lost).
+
+        Args:
+            artifact_id: Artifact identifier.
+
+        Returns:
+            True if the artifact is known to be gone.
+        """
+        return artifact_id in self._expired
+
+    def iter_range(
+        self,
+        artifact_id: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """Open a byte range of an artifact for streaming.
+
+        The content is resolved before returning, so a missing artifact is
+        reported here rather than midway through a response, and later
+        eviction or expiry does not cut the stream short.
+
+        Args:
+            artifact_id: Artifact identifier.
+            start: First byte (inclusive).
+            end: Last byte (exclusive). None = end of artifact.
+            chunk_size: Bytes per yielded chunk.
+
+        Returns:
+            Iterator of content chunks.
+
+        Raises:
+            KeyError: If the artifact is unknown, expired or its file is gone.
+        """
+        meta = self.get_meta(artifact_id)
+        if meta is None:
+            raise KeyError(artifact_id)
+        end = meta.size if end is None else min(end, meta.size)
+
+        data = self._memory.get(artifact_id)
+        if data is not None:
+            self._memory.move_to_end(artifact_id)
+            return self._iter_bytes(data, start, end, chunk_size)
+
+        try:
+            f = open(self._path(artifact_id), "rb")
+        except FileNotFoundError:
+            logger.warning(f"Spilled artifact {artifact_id} is missing on disk")
+            self._expire(artifact_id)
+            raise KeyError(artifact_id)
+        return self._iter_file(f, start, end, chunk_size)
+
+    @staticmethod
+    def _iter_bytes(data: bytes, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        """Yield a range of in-memory content."""
+        for offset in range(start, end, chunk_size):
+            yield data[offset:min(offset + chunk_size, end)]
+
+    @staticmethod
+    def _iter_file(f: BinaryIO, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        """Yield a range of an open file, closing it when done."""
+        with f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def stats(self) -> Dict[str, int]:
+        """Get store statistics.
+
+        Returns:
+            Dict of counters.
+        """
+        return {
+            "artifacts": len(self._meta),
+            "in_memory": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "spilled": len(self._meta) - len(self._memory),
+        }
+
+    def close(self) -> None:
+        """Drop all artifacts and remove spilled files."""
+        self._meta.clear()
+        self._memory.clear()
+        self._memory_bytes = 0
+        self._expired.clear()
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def _path(self, artifact_id: str) -> Path:
+        """Path of a spilled artifact."""
+        return self.spill_dir / artifact_id
+
+    def _spill(self, artifact_id: str, data: bytes) -> None:
+        """Write an artifact to disk."""
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._path(artifact_id).write_bytes(data)
+        except OSError as e:
+            logger.warning(f"Could not spill artifact {artifact_id}: {e}")
+            self._meta.pop(artifact_id, None)
+
+    def _evict(self) -> None:
+        """Spill least recently used artifacts until within the memory budget."""
+        while self._memory_bytes > self.memory_max_bytes and self._memory:
+            artifact_id, data = self._memory.popitem(last=False)
+            self._memory_bytes -= len(data)
+            self._spill(artifact_id, data)
+
+    def _delete(self, artifact_id: str) -> None:
+        """Remove an artifact from memory and disk."""
+        self._meta.pop(artifact_id, None)
+        data = self._memory.pop(artifact_id, None)
+        if data is not None:
+            self._memory_bytes -= len(data)
+        else:
+            self._path(artifact_id).unlink(missing_ok=True)
+
+    def _expire(self, artifact_id: str) -> None:
+        """Remove an artifact and remember that it existed."""
+        self._delete(artifact_id)
+        self._expired[artifact_id] = None
+        self._expired.move_to_end(artifact_id)
+        while len(self._expired) > MAX_EXPIRED_IDS:
+            self._expired.popitem(last=False)
+
+    def _purge_expired(self) -> None:
+        """Remove all expired artifacts."""
+        now = time.time()
+        for artifact_id in [a for a, m in self._meta.items() if m.expires_at <= now]:
+            self._expire(artifact_id)
@@ -0,0 +1,198 @@
+"""Token-aware fitting of conversation messages into the model context."""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.mcp.render import render_text
+
+logger = logging.getLogger(__name__)
+
+# Initial characters-per-token guess, refined per model from Ollama's counts
+DEFAULT_CHARS_PER_TOKEN = 3.5
+# Per-message overhead of the chat template (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class ContextBudgeter:
+    """Fits messages into the context window with the least prefill.
+
+    Token counts are estimated from character counts with a per-model
+    ratio calibrated against the prompt token counts reported by Ollama.
+    When a request does not fit, the oldest tool results are compacted
+    first, then the oldest turns are dropped. The system prompt and the
+    current turn are always kept.
+    """
+
+    def __init__(self):
+        """Initialize context budgeter."""
+        self._chars_per_token: Dict[str, float] = {}
+
+    def estimate(self, messages: List[Dict[str, Any]], model: str) -> int:
+        """Estimate the prompt tokens of messages.
+
+        Args:
+            messages: Chat messages.
+            model: Model name.
+
+        Returns:
+            Estimated token count.
+        """
+        ratio = self._chars_per_token.get(model, DEFAULT_CHARS_PER_TOKEN)
+        return sum(self._message_tokens(m, ratio) for m in messages)
+
+    def estimate_tools(self, tools: Optional[List[Dict[str, Any]]], model: str) -> int:
+        """Estimate the prompt tokens taken by tool definitions.
+
+        Args:
+            tools: Tools in Ollama format.
+            model: Model name.
+
+        Returns:
+            Estimated token count.
+        """
+        if not tools:
+            return 0
+        ratio = self._chars_per_token.get(model, DEFAULT_CHARS_PER_TOKEN)
+        return int(len(json.dumps(tools, ensure_ascii=False)) / ratio)
+
+    def observe(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        prompt_tokens: int,
+    ) -> None:
+        """Calibrate the model's ratio from an actual prompt token count.
+
+        Args:
+            model: Model name.
+            messages: Messages that were sent.
+            tools: Tools that were sent.
+            prompt_tokens: Prompt tokens reported by Ollama.
+        """
+        if prompt_tokens <= 0:
+            return
+        chars = sum(self._message_chars(m) for m in messages)
+        if tools:
+            chars += len(json.dumps(tools, ensure_ascii=False))
+        content_tokens = prompt_tokens - MESSAGE_OVERHEAD_TOKENS * len(messages)
+        if content_tokens <= 0:
+            return
+        sample = chars / content_tokens
+        # Ollama only counts tokens it had to evaluate: a reused prompt
+        # cache makes a request look cheaper than it is, so such samples
+        # (implausibly many characters per token) are ignored
+        if not 1.0 <= sample <= 6.0:
+            return
+        current = self._chars_per_token.get(model)
+        self._chars_per_token[model] = sample if current is None else 0.8 * current + 0.2 * sample
+
+    def fit(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Select the messages to send so the prompt fits the budget.
+
+        The input list is not modified; compacted messages are copies.
+
+        Args:
+            messages: Full message list (system prompt first, current turn last).
+            model: Model name.
+            tools: Tools sent with the request.
+            max_tokens: Prompt budget. Defaults to num_ctx minus the
+                generation reserve and safety margin.
+
+        Returns:
+            Tuple of (messages to send, estimated prompt tokens incl. tools).
+        """
+        if max_tokens is None:
+            max_tokens = (
+                settings.ollama.num_ctx
+                - settings.ollama.num_predict
+                - settings.conversation.context_safety_tokens
+            )
+        budget = max_tokens - self.estimate_tools(tools, model)
+
+        system = [m for m in messages[:1] if m["role"] == "system"]
+        turns = self._split_turns(messages[len(system):])
+        current = turns.pop() if turns else []
+
+        used = self.estimate(system + current, model) + sum(
+            self.estimate(t, model) for t in turns
+        )
+        if used <= budget:
+            return list(messages), used + self.estimate_tools(tools, model)
+
+        # 1. Compact tool results of past turns, oldest first
+        for i, turn in enumerate(turns):
+            if used <= budget:
+                break
+            compacted = self._compact_turn(turn)
+            used += self.estimate(compacted, model) - self.estimate(turn, model)
+            turns[i] = compacted
+
+        # 2. Drop past turns, oldest first
+        while turns and used > budget:
+            used -= self.estimate(turns.pop(0), model)
+
+        # 3. Compact tool results of the current turn except the latest ones
+        if used > budget and current:
+            last_tool_turn = max(
+                (i for i, m in enumerate(current) if m.get("tool_calls")), default=0
+            )
+            head = self._compact_turn(current[:last_tool_turn])
+            used += self.estimate(head, model) - self.estimate(current[:last_tool_turn], model)
+            current = head + current[last_tool_turn:]
+            if used > budget:
+                logger.warning(
+                    f"Current turn alone exceeds the context budget "
+                    f"(~{used} > {budget} tokens)"
+                )
+
+        fitted = system + [m for turn in turns for m in turn] + current
+        logger.debug(
+            f"Context fitted: {len(messages)} -> {len(fitted)} messages, ~{used} tokens"
+        )
+        return fitted, used + self.estimate_tools(tools, model)
+
+    @staticmethod
+    def _split_turns(messages: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group messages into turns, each starting at a user message."""
+        turns: List[List[Dict[str, Any]]] = []
+        for message in messages:
+            if message["role"] == "user" or not turns:
+                turns.append([])
+            turns[-1].append(message)
+        return turns
+
+    @staticmethod
+    def _compact_turn(turn: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Replace the tool results of a turn with short summaries."""
+        max_tokens = settings.conversation.compacted_tool_result_tokens
+        compacted = []
+        for message in turn:
+            if message["role"] == "tool" and not message.get("compacted"):
+                message = {
+                    **message,
+                    "content": render_text(message["content"], max_tokens),
+                    "compacted": True,
+                }
+            compacted.append(message)
+        return compacted
+
+    @staticmethod
+    def _message_chars(message: Dict[str, Any]) -> int:
+        """Count the characters of a message sent to the model."""
+        chars = len(message.get("content") or "")
+        if message.get("tool_calls"):
+            chars += len(json.dumps(message["tool_calls"], ensure_ascii=False))
+        return chars
+
+    def _message_tokens(self, message: Dict[str, Any], ratio: float) -> int:
+        """Estimate the tokens of one message."""
+        return int(self._message_chars(message) / ratio) + MESSAGE_OVERHEAD_TOKENS
@@ -4,9 +4,11 @@ import asyncio
 import logging
 from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.config import settings
+from app.services.mcp.render import render_text
+from app.api.schemas.mcp import ToolExecution
 
 logger = logging.getLogger(__name__)
 
@@ -53,13 +55,6 @@ class ConversationManager:
             content: Message content.
             metadata: Optional metadata (tokens, tools, etc.).
         """
-        if conversation_id not in self._conversations:
-            self._conversations[conversation_id] = {
-                "messages": [],
-                "created_at": datetime.now(),
-                "last_accessed": datetime.now(),
-            }
-
         message = {
             "role": role,
             "content": content,
@@ -68,14 +63,125 @@ class ConversationManager:
         if metadata:
             message["metadata"] = metadata
 
-        self._conversations[conversation_id]["messages"].append(message)
-        self._conversations[conversation_id]["last_accessed"] = datetime.now()
+        self._append(conversation_id, message)
 
-        # Trim to max history
-        messages = self._conversations[conversation_id]["messages"]
+    def add_tool_turn(
+        self,
+        conversation_id: str,
+        results: List[Tuple[Dict[str, Any], ToolExecution]],
+    ) -> None:
+        """Add an assistant tool-calling turn and its results to conversation.
+
+        Results are stored in compact form (shortened preview, full result
+        referenced by artifact id) so follow-up questions can reuse what
+        earlier tool calls discovered.
+
+        Args:
+            conversation_id: Conversation identifier.
+            results: (tool call, execution) pairs in call order.
+        """
+        if settings.conversation.tool_history_turns <= 0 or not results:
+            return
+
+        timestamp = datetime.now().isoformat()
+        self._append(conversation_id, {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {"function": {"name": tc["name"], "arguments": tc["arguments"]}}
+                for tc, _ in results
+            ],
+            "timestamp": timestamp,
+        })
+        for tc, execution in results:
+            self._append(conversation_id, {
+                "role": "tool",
+                "tool_name": tc["name"],
+                "content": render_text(
+                    execution.result_preview,
+                    settings.conversation.tool_history_max_tokens,
+                ),
+                "timestamp": timestamp,
+                "metadata": {
+                    "success": execution.success,
+                    "server_name": execution.server_name,
+                    "artifact_id": execution.artifact_id,
+                },
+            })
+
+    def _append(self, conversation_id: str, message: Dict[str, Any]) -> None:
+        """Append a message, then apply tool retention and history limits.
+
+        Args:
+            conversation_id: Conversation identifier.
+            message: Message to append.
+        """
+        if conversation_id not in self._conversations:
+            self._conversations[conversation_id] = {
+                "messages": [],
+                "created_at": datetime.now(),
+                "last_accessed": datetime.now(),
+            }
+
+        conv = self._conversations[conversation_id]
+        conv["messages"].append(message)
+        conv["last_accessed"] = datetime.now()
+
+        messages = conv["messages"]
+        if message["role"] == "user":
+            messages = self._prune_tool_messages(messages)
+
+        # Trim to max history. Tool interactions have their own limits and do
+        # not count; cutting at a conversational message leaves no orphans.
         max_messages = settings.conversation.max_history_messages
-        if len(messages) > max_messages:
-            self._conversations[conversation_id]["messages"] = messages[-max_messages:]
+        conversational = [
+            i for i, m in enumerate(messages) if not self._is_tool_interaction(m)
+        ]
+        if len(conversational) > max_messages:
+            messages = messages[conversational[-max_messages]:] if max_messages > 0 else []
+        conv["messages"] = messages
+
+    @staticmethod
+    def _is_tool_interaction(message: Dict[str, Any]) -> bool:
+        """Whether a message is a tool call turn or a tool result."""
+        return message["role"] == "tool" or bool(message.get("tool_calls"))
+
+    @staticmethod
+    def _prune_tool_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop tool interactions older than the retained user turns.
+
+        Args:
+            messages: Conversation messages.
+
+        Returns:
+            Pruned messages.
+        """
+        keep_turns = settings.conversation.tool_history_turns
+        user_indexes = [i for i, m in enumerate(messages) if m["role"] == "user"]
+        if len(user_indexes) <= keep_turns:
+            return messages
+
+        cutoff = user_indexes[-keep_turns] if keep_turns > 0 else len(messages)
+        return [
+            m for i, m in enumerate(messages)
+            if i >= cutoff or not ConversationManager._is_tool_interaction(m)
+        ]
+
+    def get_tool_memo(self, conversation_id: str) -> Dict[Any, ToolExecution]:
+        """Get the tool results memoized for a conversation.
+
+        The dict is owned by the conversation and dropped with it.
+
+        Args:
+            conversation_id: Conversation identifier.
+
+        Returns:
+            Mutable dict of call key -> execution.
+        """
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
+            return {}
+        return conv.setdefault("tool_memo", {})
 
     def get_history(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get full conversation for API response.
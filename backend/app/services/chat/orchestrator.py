@@ -1,21 +1,33 @@
 """Chat Orchestrator - Main chat logic with tool calling."""
 
+import asyncio
 import logging
 import uuid
+from contextlib import aclosing
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, Tuple
 
 from app.config import settings
+from app.services.mcp.cache import make_cache_key
 from app.services.mcp.manager import MCPManager
-from app.services.llm.ollama_client import OllamaClient
+from app.services.llm.admission import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdmissionTimeoutError,
+)
+from app.services.llm.ollama_client import ChatChunk, LLMTimeoutError, OllamaClient
 from app.services.llm.tool_converter import mcp_tools_to_ollama_format
+from app.services.chat.context import ContextBudgeter
 from app.services.chat.conversation import ConversationManager
+from app.services.chat.prefetch import PrefetchResults, SchemaPrefetcher
+from app.services.chat.tool_batch import ToolBatch
 from app.api.schemas.chat import (
     ChatRequest,
     ChatResponse,
     StreamContentEvent,
     StreamToolCallEvent,
     StreamToolResultEvent,
+    StreamQueuedEvent,
     StreamDoneEvent,
     StreamErrorEvent,
     TokenUsage,
@@ -47,6 +59,7 @@ StreamEvent = (
     StreamContentEvent
     | StreamToolCallEvent
     | StreamToolResultEvent
+    | StreamQueuedEvent
     | StreamDoneEvent
     | StreamErrorEvent
 )
@@ -78,6 +91,12 @@ class ChatOrchestrator:
         self.mcp = mcp_manager
         self.llm = ollama_client
         self.conversations = conversation_manager
+        self.context = ContextBudgeter()
+        self.prefetcher = SchemaPrefetcher(mcp_manager)
+
+        # Ollama tool payloads memoized per server subset, with the registry
+        # version of those servers they were built from
+        self._tool_bundles: Dict[FrozenSet[str], Tuple[Tuple, Optional[List[Dict[str, Any]]]]] = {}
 
     async def chat(self, request: ChatRequest) -> ChatResponse:
         """Non-streaming chat with tool execution loop.
@@ -90,65 +109,93 @@ class ChatOrchestrator:
         """
         start_time = datetime.now()
 
-        # Get or create conversation
+        # Get or create conversation (the system prompt is not stored)
         conv_id = request.conversation_id or str(uuid.uuid4())
-        messages = self.conversations.get_messages(conv_id)
-
-        # Add system prompt if this is a new conversation
-        if not messages:
-            messages.append({"role": "system", "content": SYSTEM_PROMPT})
+        history = self.conversations.get_messages(conv_id)
+        messages = [{"role": "system", "content": SYSTEM_PROMPT}, *history]
 
         # Add user message
         messages.append({"role": "user", "content": request.message})
         self.conversations.add_message(conv_id, "user", request.message)
 
         # Get available tools
-        tools = self.mcp.get_all_tools(enabled_only=True)
-        ollama_tools = mcp_tools_to_ollama_format(tools) if tools else None
+        servers = self._resolve_servers(request)
+        ollama_tools = self._get_tool_bundle(servers)
+        model = request.model or settings.ollama.default_model
+
+        # New conversations start with the main table schemas: injected now
+        # if cached, otherwise fetched alongside the first LLM call
+        prefetch_task: Optional[asyncio.Task] = None
+        prefetched = self.prefetcher.get_cached(servers) if not history else None
+        if not history and prefetched is None:
+            prefetch_task = asyncio.create_task(self.prefetcher.fetch(servers))
 
         tool_executions: List[ToolExecution] = []
         total_prompt_tokens = 0
         total_completion_tokens = 0
         final_content = ""
 
+        if prefetched:
+            self._record_prefetch(conv_id, messages, prefetched, tool_executions)
+            prefetched = None
+
         # Tool execution loop
         max_iterations = settings.conversation.max_tool_iterations
-        for iteration in range(max_iterations):
-            logger.debug(f"Chat iteration {iteration + 1}/{max_iterations}")
+        try:
+            for iteration in range(max_iterations):
+                logger.debug(f"Chat iteration {iteration + 1}/{max_iterations}")
+
+                prompt, prompt_tokens = self.context.fit(messages, model, ollama_tools)
+                phase = self._phase(ollama_tools, iteration)
+                # Cached responses do not use the model: no slot needed
+                entry = (
+                    self.llm.lookup(prompt, model, ollama_tools, phase)
+                    if request.llm_cache else None
+                )
+                if entry is not None:
+                    result = self.llm.replay(entry)
+                else:
+                    async with self.llm.admission.slot(model, conv_id, PRIORITY_BATCH):
+                        result = await self.llm.chat(
+                            messages=prompt,
+                            model=model,
+                            tools=ollama_tools,
+                            conversation_id=conv_id,
+                            prompt_tokens=prompt_tokens,
+                            phase=phase,
+                            cache=False,
+                        )
+                self.context.observe(model, prompt, ollama_tools, result.prompt_tokens)
 
-            result = await self.llm.chat(
-                messages=messages,
-                model=request.model,
-                tools=ollama_tools,
-            )
+                total_prompt_tokens += result.prompt_tokens
+                total_completion_tokens += result.completion_tokens
+
+                if not result.tool_calls:
+                    # No more tools, we have final response
+                    final_content = result.content
+                    break
 
-            total_prompt_tokens += result.prompt_tokens
-            total_completion_tokens += result.completion_tokens
-
-            if not result.tool_calls:
-                # No more tools, we have final response
-                final_content = result.content
-                break
-
-            # Execute tool calls
-            for tc in result.tool_calls:
-                logger.info(f"Executing tool: {tc['name']}")
-                execution = await self.mcp.call_tool(tc["name"], tc["arguments"])
-                tool_executions.append(execution)
-
-                # Add tool interaction to messages
-                messages.append({
-                    "role": "assistant",
-                    "content": "",
-                    "tool_calls": [{"function": tc}],
-                })
-                messages.append({
-                    "role": "tool",
-                    "content": execution.result_preview,
-                })
-        else:
-            final_content = "Maximum tool iterations reached. Please refine your query."
-            logger.warning(f"Max iterations reached for conversation {conv_id}")
+                # Execute the turn's tool calls concurrently
+                batch = self._new_tool_batch(conv_id, servers)
+                for tc in result.tool_calls:
+                    batch.submit(tc)
+                await batch.wait()
+
+                results = batch.results()
+                tool_executions.extend(execution for _, execution in results)
+                self._append_tool_turn(messages, results)
+                self.conversations.add_tool_turn(conv_id, results)
+
+                if prefetch_task is not None:
+                    prefetched, prefetch_task = await prefetch_task, None
+                if prefetched:
+                    self._record_prefetch(conv_id, messages, prefetched, tool_executions)
+                    prefetched = None
+            else:
+                final_content = "Maximum tool iterations reached. Please refine your query."
+                logger.warning(f"Max iterations reached for conversation {conv_id}")
+        finally:
+            self._cancel_prefetch(prefetch_task)
 
         # Save assistant response
         self.conversations.add_message(
@@ -170,7 +217,7 @@ class ChatOrchestrator:
         return ChatResponse(
             content=final_content,
             conversation_id=conv_id,
-            model=request.model or settings.ollama.default_model,
+            model=model,
             tools_used=[e.name for e in tool_executions],
             tool_executions=tool_executions,
             total_duration_ms=duration_ms,
@@ -194,17 +241,22 @@ class ChatOrchestrator:
         start_time = datetime.now()
 
         conv_id = request.conversation_id or str(uuid.uuid4())
-        messages = self.conversations.get_messages(conv_id)
-
-        # Add system prompt if this is a new conversation
-        if not messages:
-            messages.append({"role": "system", "content": SYSTEM_PROMPT})
+        history = self.conversations.get_messages(conv_id)
+        messages = [{"role": "system", "content": SYSTEM_PROMPT}, *history]
 
         messages.append({"role": "user", "content": request.message})
         self.conversations.add_message(conv_id, "user", request.message)
 
-        tools = self.mcp.get_all_tools(enabled_only=True)
-        ollama_tools = mcp_tools_to_ollama_format(tools) if tools else None
+        servers = self._resolve_servers(request)
+        ollama_tools = self._get_tool_bundle(servers)
+        model = request.model or settings.ollama.default_model
+
+        # New conversations start with the main table schemas: injected now
+        # if cached, otherwise fetched alongside the first LLM call
+        prefetch_task: Optional[asyncio.Task] = None
+        prefetched = self.prefetcher.get_cached(servers) if not history else None
+        if not history and prefetched is None:
+            prefetch_task = asyncio.create_task(self.prefetcher.fetch(servers))
 
         tool_executions: List[ToolExecution] = []
         total_prompt_tokens = 0
@@ -214,83 +266,95 @@ class ChatOrchestrator:
         max_iterations = settings.conversation.max_tool_iterations
 
         try:
-            for iteration in range(max_iterations):
-                pending_tool_calls: List[Dict[str, Any]] = []
-
-                # Stream LLM response
-                async for chunk in await self.llm.chat(
-                    messages=messages,
-                    model=request.model,
-                    tools=ollama_tools,
-                    stream=True,
+            if prefetched:
+                for event in self._record_prefetch(
+                    conv_id, messages, prefetched, tool_executions
                 ):
-                    # Stream content tokens
-                    if chunk.content:
-                        accumulated_content += chunk.content
-                        yield StreamContentEvent(
-                            type="content",
-                            content=chunk.content,
-                        )
-
-                    # Collect tool calls
-                    if chunk.tool_calls:
-                        for tc in chunk.tool_calls:
-                            tc_id = str(uuid.uuid4())
-                            pending_tool_calls.append({
-                                "id": tc_id,
-                                **tc,
-                            })
-                            yield StreamToolCallEvent(
-                                type="tool_call",
-                                tool_call={
-                                    "id": tc_id,
-                                    "name": tc["name"],
-                                    "arguments": tc["arguments"],
-                                    "mcp_server": self._get_server_for_tool(tc["name"]),
-                                },
-                            )
-
-                    # Capture token counts from final chunk
-                    if chunk.done:
-                        total_prompt_tokens += chunk.prompt_tokens
-                        total_completion_tokens += chunk.completion_tokens
-
-                if not pending_tool_calls:
-                    # No tools called, we're done
-                    break
+                    yield event
+                prefetched = None
 
-                # Execute each tool and stream results
-                for tc in pending_tool_calls:
-                    execution = await self.mcp.call_tool(tc["name"], tc["arguments"])
-                    tool_executions.append(execution)
-
-                    yield StreamToolResultEvent(
-                        type="tool_result",
-                        tool_result={
-                            "id": tc["id"],
-                            "name": tc["name"],
-                            "success": execution.success,
-                            "preview": execution.result_preview,
-                            "duration_ms": execution.duration_ms,
-                            "mcp_server": execution.server_name,
-                        },
+            for iteration in range(max_iterations):
+                # Tool calls are dispatched as soon as they are streamed, so
+                # their latency overlaps with the rest of the generation
+                batch = self._new_tool_batch(conv_id, servers)
+                try:
+                    prompt, prompt_tokens = self.context.fit(messages, model, ollama_tools)
+                    generation = self._generate(
+                        conv_id,
+                        model,
+                        prompt,
+                        ollama_tools,
+                        prompt_tokens,
+                        self._phase(ollama_tools, iteration),
+                        request.llm_cache,
                     )
-
-                    # Update messages for next LLM call
-                    messages.append({
-                        "role": "assistant",
-                        "content": "",
-                        "tool_calls": [{
-                            "function": {
-                                "name": tc["name"],
-                                "arguments": tc["arguments"],
-                            }
-                        }],
-                    })
-                    messages.append({
-                        "role": "tool",
-                        "content": execution.result_preview,
-                    })
+                    async with aclosing(generation):
+                        async for chunk in generation:
+                            if isinstance(chunk, StreamQueuedEvent):
+                                yield chunk
+                                continue
+
+                            # Stream content tokens
+                            if chunk.content:
+                                accumulated_content += chunk.content
+                                yield StreamContentEvent(
+                                    type="content",
+                                    content=chunk.content,
+                                )
+
+                            # Dispatch tool calls
+                            for tc in chunk.tool_calls:
+                                tc_id = str(uuid.uuid4())
+                                batch.submit({"id": tc_id, **tc})
+                                yield StreamToolCallEvent(
+                                    type="tool_call",
+                                    tool_call={
+                                        "id": tc_id,
+                                        "name": tc["name"],
+                                        "arguments": tc["arguments"],
+                                        "mcp_server": self._get_server_for_tool(tc["name"]),
+                                    },
+                                )
+
+                            # Report calls that finished while the model is still generating
+                            for tc, execution in batch.drain():
+                                yield self._tool_result_event(tc, execution)
+
+                            # Capture token counts from final chunk
+                            if chunk.done:
+                                total_prompt_tokens += chunk.prompt_tokens
+                                total_completion_tokens += chunk.completion_tokens
+                                self.context.observe(
+                                    model, prompt, ollama_tools, chunk.prompt_tokens
+                                )
+
+                    if not len(batch):
+                        # No tools called, we're done
+                        break
+
+                    async for tc, execution in batch.as_completed():
+                        yield self._tool_result_event(tc, execution)
+                except (asyncio.CancelledError, GeneratorExit):
+                    # Keep the tool results that completed before the disconnect
+                    self.conversations.add_tool_turn(conv_id, batch.completed_results())
+                    raise
+                finally:
+                    batch.cancel()
+
+                # History keeps the order the model emitted the calls in
+                results = batch.results()
+                tool_executions.extend(execution for _, execution in results)
+                self._append_tool_turn(messages, results)
+                self.conversations.add_tool_turn(conv_id, results)
+
+                if prefetch_task is not None:
+                    prefetched, prefetch_task = await prefetch_task, None
+                if prefetched:
+                    for event in self._record_prefetch(
+                        conv_id, messages, prefetched, tool_executions
+                    ):
+                        yield event
+                    prefetched = None
 
             # Save final response
             self.conversations.add_message(
@@ -313,7 +377,7 @@ class ChatOrchestrator:
                 type="done",
                 metadata={
                     "conversation_id": conv_id,
-                    "model": request.model or settings.ollama.default_model,
+                    "model": model,
                     "total_duration_ms": duration_ms,
                     "tokens": {
                         "prompt": total_prompt_tokens,
@@ -323,6 +387,48 @@ class ChatOrchestrator:
                 },
             )
 
+        except (asyncio.CancelledError, GeneratorExit):
+            # Client went away: generation and tool calls are already stopped,
+            # record what the user saw of the turn
+            logger.info(f"Stream cancelled by client for conversation {conv_id}")
+            self.conversations.add_message(
+                conv_id,
+                "assistant",
+                accumulated_content,
+                metadata={
+                    "tokens": {
+                        "prompt": total_prompt_tokens,
+                        "completion": total_completion_tokens,
+                        "total": total_prompt_tokens + total_completion_tokens,
+                    },
+                    "tools_used": [e.name for e in tool_executions],
+                    "status": "cancelled",
+                },
+            )
+            raise
+
+        except AdmissionTimeoutError as e:
+            logger.warning(f"Stream rejected: {e}")
+            yield StreamErrorEvent(
+                type="error",
+                error={
+                    "code": "QUEUE_TIMEOUT",
+                    "message": str(e),
+                    "status": "503",
+                },
+            )
+
+        except LLMTimeoutError as e:
+            logger.warning(f"Stream aborted: {e}")
+            yield StreamErrorEvent(
+                type="error",
+                error={
+                    "code": "LLM_TIMEOUT",
+                    "message": str(e),
+                    "status": "504",
+                },
+            )
+
         except Exception as e:
             logger.exception(f"Stream error: {e}")
             yield StreamErrorEvent(
@@ -333,6 +439,270 @@ class ChatOrchestrator:
                 },
             )
 
+        finally:
+            self._cancel_prefetch(prefetch_task)
+
+    async def _generate(
+        self,
+        conv_id: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        prompt_tokens: int,
+        phase: str,
+        use_cache: bool = True,
+    ) -> AsyncIterator[StreamQueuedEvent | ChatChunk]:
+        """Stream one LLM generation once admitted.
+
+        Yields queue position events while waiting for a slot, then the
+        model's chunks. The slot is held for the generation only, not for
+        the tool calls that follow. Closing this generator closes the
+        Ollama stream, which stops generation server-side. Responses
+        replayed from the LLM response cache skip admission.
+
+        Args:
+            conv_id: Conversation identifier (for fair scheduling).
+            model: Model name.
+            messages: Messages to send.
+            tools: Tools in Ollama format.
+            prompt_tokens: Estimated prompt tokens (sizes the context window).
+            phase: Generation phase ("tools" or "answer").
+            use_cache: Whether to look up the LLM response cache.
+
+        Yields:
+            Queue events, then chat chunks.
+
+        Raises:
+            AdmissionTimeoutError: If no slot frees up within the queue timeout.
+        """
+        entry = self.llm.lookup(messages, model, tools, phase) if use_cache else None
+        ticket = None
+        if entry is None:
+            ticket = self.llm.admission.request(model, conv_id, PRIORITY_INTERACTIVE)
+        try:
+            if ticket is not None:
+                async for position in self.llm.admission.wait(ticket):
+                    yield StreamQueuedEvent(
+                        type="queued",
+                        queue={"position": position, "model": model},
+                    )
+
+            if entry is not None:
+                llm_stream = self.llm.replay(entry, stream=True)
+            else:
+                llm_stream = await self.llm.chat(
+                    messages=messages,
+                    model=model,
+                    tools=tools,
+                    stream=True,
+                    conversation_id=conv_id,
+                    prompt_tokens=prompt_tokens,
+                    phase=phase,
+                    cache=False,
+                )
+            async with aclosing(llm_stream):
+                async for chunk in llm_stream:
+                    yield chunk
+        finally:
+            if ticket is not None:
+                self.llm.admission.release(ticket)
+
+    async def close(self) -> None:
+        """Cancel background work (schema prefetches) on shutdown."""
+        await self.prefetcher.close()
+
+    @staticmethod
+    def _cancel_prefetch(task: Optional[asyncio.Task]) -> None:
+        """Cancel a conversation's schema prefetch that was never consumed.
+
+        Args:
+            task: Prefetch task, None if already consumed.
+        """
+        if task is not None and not task.done():
+            task.cancel()
+
+    @staticmethod
+    def _phase(tools: Optional[List[Dict[str, Any]]], iteration: int) -> str:
+        """Get the generation phase of a tool loop iteration.
+
+        Turns that may call tools get a short generation limit; the client
+        extends it if the model answers in prose instead.
+
+        Args:
+            tools: Tools offered to the model.
+            iteration: Zero-based tool loop iteration.
+
+        Returns:
+            "tools" or "answer".
+        """
+        if tools and iteration < settings.conversation.max_tool_iterations - 1:
+            return "tools"
+        return "answer"
+
+    def _new_tool_batch(self, conv_id: str, servers: FrozenSet[str]) -> ToolBatch:
+        """Create a batch for the tool calls of one LLM turn.
+
+        Args:
+            conv_id: Conversation identifier (owner of the tool memo).
+            servers: Servers allowed for the request.
+
+        Returns:
+            Tool batch.
+        """
+        memo = None
+        if settings.conversation.tool_memo_max_entries > 0:
+            memo = self.conversations.get_tool_memo(conv_id)
+        return ToolBatch(
+            self.mcp,
+            servers,
+            max_parallel=settings.conversation.max_parallel_tool_calls,
+            memo=memo,
+        )
+
+    @staticmethod
+    def _append_tool_turn(
+        messages: List[Dict[str, Any]],
+        results: List[Tuple[Dict[str, Any], ToolExecution]],
+    ) -> None:
+        """Append an assistant tool-calling turn and its results to messages.
+
+        Args:
+            messages: Messages for the next LLM call.
+            results: (tool call, execution) pairs in call order.
+        """
+        messages.append({
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {"function": {"name": tc["name"], "arguments": tc["arguments"]}}
+                for tc, _ in results
+            ],
+        })
+        for tc, execution in results:
+            messages.append({
+                "role": "tool",
+                "tool_name": tc["name"],
+                "content": execution.result_preview,
+            })
+
+    def _record_prefetch(
+        self,
+        conv_id: str,
+        messages: List[Dict[str, Any]],
+        prefetched: PrefetchResults,
+        tool_executions: List[ToolExecution],
+    ) -> List[StreamEvent]:
+        """Add prefetched schemas to the context as a tool-calling turn.
+
+        Schemas the model already fetched itself in this turn are skipped.
+
+        Args:
+            conv_id: Conversation identifier.
+            messages: Messages for the next LLM call.
+            prefetched: Prefetched (tool call, execution) pairs.
+            tool_executions: Executions already run in this turn.
+
+        Returns:
+            Stream events describing the injected calls.
+        """
+        done = {make_cache_key("", e.name, e.arguments) for e in tool_executions}
+        results = [
+            (tc, execution) for tc, execution in prefetched
+            if make_cache_key("", tc["name"], tc["arguments"]) not in done
+        ]
+        if not results:
+            return []
+
+        self._append_tool_turn(messages, results)
+        self.conversations.add_tool_turn(conv_id, results)
+
+        # Later identical calls from the model reuse the prefetched schemas
+        batch = self._new_tool_batch(conv_id, frozenset())
+        for tc, execution in results:
+            batch.remember(batch.memo_key(tc), execution)
+
+        events: List[StreamEvent] = []
+        for tc, execution in results:
+            events.append(StreamToolCallEvent(
+                type="tool_call",
+                tool_call={
+                    "id": tc["id"],
+                    "name": tc["name"],
+                    "arguments": tc["arguments"],
+                    "mcp_server": execution.server_name,
+                    "prefetched": True,
+                },
+            ))
+            event = self._tool_result_event(tc, execution)
+            event.tool_result["prefetched"] = True
+            events.append(event)
+        return events
+
+    @staticmethod
+    def _tool_result_event(tc: Dict[str, Any], execution: ToolExecution) -> StreamToolResultEvent:
+        """Build the SSE event for a completed tool call.
+
+        Args:
+            tc: Tool call with its stream id.
+            execution: Tool execution result.
+
+        Returns:
+            Tool result event.
+        """
+        return StreamToolResultEvent(
+            type="tool_result",
+            tool_result={
+                "id": tc["id"],
+                "name": tc["name"],
+                "success": execution.success,
+                "preview": execution.result_preview,
+                "duration_ms": execution.duration_ms,
+                "mcp_server": execution.server_name,
+                "cached": execution.cached,
+                "reused": execution.reused,
+                "artifact_id": execution.artifact_id,
+                "result_size": execution.result_size,
+            },
+        )
+
+    def _resolve_servers(self, request: ChatRequest) -> FrozenSet[str]:
+        """Compute the MCP servers usable for a request.
+
+        The request can only narrow the globally enabled set, never widen it.
+
+        Args:
+            request: Chat request.
+
+        Returns:
+            Frozen set of server names.
+        """
+        enabled = self.mcp.get_enabled_servers()
+        if request.enabled_mcp_servers is None:
+            return enabled
+        return enabled & frozenset(request.enabled_mcp_servers)
+
+    def _get_tool_bundle(self, servers: FrozenSet[str]) -> Optional[List[Dict[str, Any]]]:
+        """Get the Ollama tool payload for a server subset.
+
+        Bundles are memoized and rebuilt only when the tools of one of the
+        subset's servers change.
+
+        Args:
+            servers: Server names to include.
+
+        Returns:
+            Tools in Ollama format, or None if there are none.
+        """
+        version = self.mcp.get_tools_version(servers)
+        cached = self._tool_bundles.get(servers)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        tools = self.mcp.get_all_tools(enabled_only=True, servers=servers)
+        bundle = mcp_tools_to_ollama_format(tools) if tools else None
+        self._tool_bundles[servers] = (version, bundle)
+        return bundle
+
     def _get_server_for_tool(self, tool_name: str) -> str:
         """Get the MCP server name for a tool.
 
@@ -342,8 +712,4 @@ class ChatOrchestrator:
         Returns:
             Server name or "unknown".
         """
-        tools = self.mcp.get_all_tools(enabled_only=False)
-        for tool in tools:
-            if tool.name == tool_name:
-                return tool.server_name
-        return "unknown"
+        return self.mcp.get_tool_server(tool_name) or "unknown"
@@ -0,0 +1,135 @@
+"""Speculative schema prefetch for new conversations."""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from app.config import settings
+from app.services.mcp.manager import MCPManager
+from app.api.schemas.mcp import ToolExecution
+
+logger = logging.getLogger(__name__)
+
+PrefetchResults = List[Tuple[Dict[str, Any], ToolExecution]]
+
+
+class SchemaPrefetcher:
+    """Fetches the schemas of the main tables ahead of the model.
+
+    A new conversation otherwise spends its first LLM iterations on schema
+    discovery. Results are injected as if the model had called the schema
+    tool itself, and cached across conversations until the server's tools
+    change or the TTL expires.
+    """
+
+    def __init__(self, mcp_manager: MCPManager):
+        """Initialize schema prefetcher.
+
+        Args:
+            mcp_manager: MCP manager routing the calls.
+        """
+        self.mcp = mcp_manager
+        # Server name -> (expires_at, server tools version, results)
+        self._cache: Dict[str, Tuple[float, Tuple, PrefetchResults]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+
+    def _server_for(self, servers: FrozenSet[str]) -> Optional[str]:
+        """Get the server providing the schema tool, if usable for the request."""
+        if not settings.conversation.schema_prefetch_tables:
+            return None
+        server = self.mcp.get_tool_server(settings.conversation.schema_prefetch_tool)
+        return server if server in servers else None
+
+    def get_cached(self, servers: FrozenSet[str]) -> Optional[PrefetchResults]:
+        """Get prefetched schemas without fetching.
+
+        Args:
+            servers: Servers allowed for the request.
+
+        Returns:
+            Results, or None if not cached.
+        """
+        server = self._server_for(servers)
+        entry = self._cache.get(server) if server else None
+        if entry is None:
+            return None
+        expires_at, version, results = entry
+        if expires_at <= time.time() or version != self.mcp.get_tools_version([server]):
+            del self._cache[server]
+            return None
+        return [
+            ({**tc, "id": str(uuid.uuid4())}, execution.model_copy(update={"cached": True}))
+            for tc, execution in results
+        ]
+
+    async def fetch(self, servers: FrozenSet[str]) -> PrefetchResults:
+        """Prefetch schemas, sharing a fetch already in progress.
+
+        The shared fetch is cancelled once every conversation waiting for it
+        has given up (cancelled or disconnected).
+
+        Args:
+            servers: Servers allowed for the request.
+
+        Returns:
+            Results of the successful schema calls (empty on failure).
+        """
+        server = self._server_for(servers)
+        if server is None:
+            return []
+        cached = self.get_cached(servers)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(server)
+        if task is None:
+            task = asyncio.create_task(self._fetch(server))
+            self._inflight[server] = task
+            task.add_done_callback(lambda _: self._inflight.pop(server, None))
+
+        self._waiters[server] = self._waiters.get(server, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[server] -= 1
+            if not self._waiters[server]:
+                del self._waiters[server]
+                if not task.done():
+                    task.cancel()
+
+    async def close(self) -> None:
+        """Cancel the fetches in progress."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch(self, server: str) -> PrefetchResults:
+        """Call the schema tool for every configured table."""
+        tool = settings.conversation.schema_prefetch_tool
+        version = self.mcp.get_tools_version([server])
+        calls = [
+            {"id": str(uuid.uuid4()), "name": tool, "arguments": {"table": table}}
+            for table in settings.conversation.schema_prefetch_tables
+        ]
+        try:
+            executions = await asyncio.gather(*(
+                self.mcp.call_tool(tc["name"], tc["arguments"], servers=frozenset({server}))
+                for tc in calls
+            ))
+        except Exception as e:
+            logger.warning(f"Schema prefetch failed: {e}")
+            return []
+
+        results = [(tc, ex) for tc, ex in zip(calls, executions) if ex.success]
+        if results:
+            self._cache[server] = (
+                time.time() + settings.conversation.schema_prefetch_ttl,
+                version,
+                results,
+            )
+            logger.info(f"Prefetched {len(results)}/{len(calls)} table schemas from '{server}'")
+        return results
@@ -0,0 +1,184 @@
+"""Concurrent execution of the tool calls of one LLM turn."""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, Tuple
+
+from app.config import settings
+from app.services.mcp.cache import make_cache_key
+from app.services.mcp.manager import MCPManager
+from app.api.schemas.mcp import ToolExecution
+
+logger = logging.getLogger(__name__)
+
+
+class ToolBatch:
+    """Runs the tool calls of one assistant turn concurrently.
+
+    Calls start as soon as they are submitted, bounded by a per-turn cap.
+    Results can be consumed in completion order (to stream them) while
+    `results()` always returns them in submission order, so the message
+    history does not depend on which server answered first.
+
+    With a memo, a call identical to an earlier one in the conversation (or
+    in the batch) returns that result instead of running again.
+    """
+
+    def __init__(
+        self,
+        mcp_manager: MCPManager,
+        servers: Optional[FrozenSet[str]],
+        max_parallel: int,
+        memo: Optional[Dict[Any, ToolExecution]] = None,
+    ):
+        """Initialize tool batch.
+
+        Args:
+            mcp_manager: MCP manager routing the calls.
+            servers: Servers allowed for this request.
+            max_parallel: Maximum calls running at once.
+            memo: Conversation's memoized results (None = no reuse).
+        """
+        self.mcp = mcp_manager
+        self.servers = servers
+        self._semaphore = asyncio.Semaphore(max(1, max_parallel))
+        self._calls: List[Dict[str, Any]] = []
+        self._tasks: List[asyncio.Task] = []
+        self._completed: asyncio.Queue = asyncio.Queue()
+        self._yielded = 0
+        self._memo = memo
+        self._inflight: Dict[Any, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def submit(self, tool_call: Dict[str, Any]) -> None:
+        """Start executing a tool call.
+
+        Args:
+            tool_call: Dict with id, name and arguments.
+        """
+        index = len(self._calls)
+        self._calls.append(tool_call)
+
+        key = self.memo_key(tool_call)
+        prior = self._inflight.get(key) if key is not None else None
+        if prior is not None:
+            task = asyncio.create_task(self._reuse(prior))
+        else:
+            task = asyncio.create_task(self._run(tool_call, key))
+            if key is not None:
+                self._inflight[key] = task
+        task.add_done_callback(lambda _: self._completed.put_nowait(index))
+        self._tasks.append(task)
+
+    def memo_key(self, tool_call: Dict[str, Any]) -> Optional[Any]:
+        """Get the memo key of a call, or None if it must not be reused.
+
+        Calls to a server that is disabled or not allowed for this request
+        are never reused, so they reach the manager and get refused there.
+
+        Args:
+            tool_call: Dict with name and arguments.
+
+        Returns:
+            Memo key (scoped to the tool's server) or None.
+        """
+        if self._memo is None or not self.mcp.is_memoizable(tool_call["name"]):
+            return None
+        server = self.mcp.get_tool_server(tool_call["name"])
+        if server is None or server not in self.mcp.get_enabled_servers():
+            return None
+        if self.servers is not None and server not in self.servers:
+            return None
+        return make_cache_key(server, tool_call["name"], tool_call["arguments"])
+
+    def remember(self, key: Any, execution: ToolExecution) -> None:
+        """Memoize a successful result, evicting the oldest beyond the cap.
+
+        Args:
+            key: Memo key.
+            execution: Tool execution.
+        """
+        if self._memo is None or key is None or not execution.success:
+            return
+        self._memo.pop(key, None)
+        self._memo[key] = execution
+        while len(self._memo) > settings.conversation.tool_memo_max_entries:
+            self._memo.pop(next(iter(self._memo)))
+
+    async def _run(self, tool_call: Dict[str, Any], key: Optional[Any]) -> ToolExecution:
+        """Execute one call under the concurrency cap, or reuse its memoized result."""
+        earlier = self._memo.get(key) if key is not None else None
+        if earlier is not None:
+            logger.info(f"Reusing earlier result of tool: {tool_call['name']}")
+            return earlier.model_copy(update={"reused": True, "duration_ms": 0})
+
+        async with self._semaphore:
+            logger.info(f"Executing tool: {tool_call['name']}")
+            execution = await self.mcp.call_tool(
+                tool_call["name"], tool_call["arguments"], servers=self.servers
+            )
+        self.remember(key, execution)
+        return execution
+
+    @staticmethod
+    async def _reuse(prior: asyncio.Task) -> ToolExecution:
+        """Share the result of an identical call submitted earlier in the batch."""
+        execution = await asyncio.shield(prior)
+        return execution.model_copy(update={"reused": True, "duration_ms": 0})
+
+    async def as_completed(self) -> AsyncIterator[Tuple[Dict[str, Any], ToolExecution]]:
+        """Yield submitted calls as they complete.
+
+        Yields:
+            (tool call, execution) pairs in completion order.
+        """
+        while self._yielded < len(self._calls):
+            index = await self._completed.get()
+            self._yielded += 1
+            yield self._calls[index], self._tasks[index].result()
+
+    def drain(self) -> List[Tuple[Dict[str, Any], ToolExecution]]:
+        """Collect calls that have completed, without waiting.
+
+        Returns:
+            (tool call, execution) pairs in completion order.
+        """
+        ready = []
+        while not self._completed.empty():
+            index = self._completed.get_nowait()
+            self._yielded += 1
+            ready.append((self._calls[index], self._tasks[index].result()))
+        return ready
+
+    async def wait(self) -> None:
+        """Wait for every submitted call to complete."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def results(self) -> List[Tuple[Dict[str, Any], ToolExecution]]:
+        """Get completed results in submission order.
+
+        Returns:
+            (tool call, execution) pairs.
+        """
+        return [(tc, task.result()) for tc, task in zip(self._calls, self._tasks)]
+
+    def completed_results(self) -> List[Tuple[Dict[str, Any], ToolExecution]]:
+        """Get the calls that completed, in submission order.
+
+        Returns:
+            (tool call, execution) pairs, skipping running or cancelled calls.
+        """
+        return [
+            (tc, task.result())
+            for tc, task in zip(self._calls, self._tasks)
+            if task.done() and not task.cancelled() and task.exception() is None
+        ]
+
+    def cancel(self) -> None:
+        """Cancel calls still running."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
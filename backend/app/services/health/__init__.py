@@ -0,0 +1,5 @@
+"""Health services module."""
+
+from app.services.health.prober import HealthProber
+
+__all__ = ["HealthProber"]
@@ -0,0 +1,133 @@
+"""Background health prober with cached component status."""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional
+
+from app.config import settings
+from app.services.mcp.manager import MCPManager
+from app.services.llm.ollama_client import OllamaClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProbeResult:
+    """Latest probe outcome for a component."""
+
+    healthy: bool
+    latency_ms: int
+    checked_at: datetime
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+class HealthProber:
+    """Periodically checks Ollama and MCP servers concurrently.
+
+    Health endpoints read the cached results instead of probing on every
+    request, so Kubernetes probes cost nothing downstream.
+    """
+
+    def __init__(
+        self,
+        mcp_manager: MCPManager,
+        ollama_client: OllamaClient,
+        interval: Optional[float] = None,
+    ):
+        """Initialize health prober.
+
+        Args:
+            mcp_manager: MCP manager instance.
+            ollama_client: Ollama client instance.
+            interval: Seconds between probes. Defaults to settings value.
+        """
+        self.mcp = mcp_manager
+        self.llm = ollama_client
+        self.interval = interval or settings.health.probe_interval
+        self.components: Dict[str, ProbeResult] = {}
+        self._history: Dict[str, Deque[int]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background probe loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="health-prober")
+            logger.info(f"Health prober started (interval {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the background probe loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Probe forever at the configured interval."""
+        while True:
+            try:
+                await self.probe_once()
+            except Exception as e:
+                logger.error(f"Health probe failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def probe_once(self) -> None:
+        """Check all components concurrently and cache the results."""
+        ollama_ms, mcp_status = await asyncio.gather(
+            self.llm.ping(),
+            self.mcp.get_health_status(),
+        )
+        now = datetime.now()
+
+        results = {
+            "ollama": ProbeResult(
+                healthy=ollama_ms >= 0,
+                latency_ms=ollama_ms,
+                checked_at=now,
+                details={"endpoints": self.llm.pool.status()},
+            ),
+        }
+        for name, status in mcp_status.items():
+            # Idle lazy servers are healthy: they start on demand
+            healthy = status["state"] == "idle" or (
+                status["connected"] and status["ping_ms"] >= 0
+            )
+            results[f"mcp:{name}"] = ProbeResult(
+                healthy=healthy,
+                latency_ms=status["ping_ms"],
+                checked_at=now,
+                details=status,
+            )
+
+        for key, result in results.items():
+            history = self._history.setdefault(
+                key, deque(maxlen=settings.health.history_size)
+            )
+            history.append(result.latency_ms)
+
+        # Drop components that no longer exist (e.g. deregistered servers)
+        for key in set(self._history) - set(results):
+            del self._history[key]
+
+        self.components = results
+
+    @property
+    def has_run(self) -> bool:
+        """Whether at least one probe has completed."""
+        return bool(self.components)
+
+    def get_latency_history(self, component: str) -> list:
+        """Get recent probe latencies for a component.
+
+        Args:
+            component: Component key (e.g. "ollama", "mcp:hive").
+
+        Returns:
+            Latencies in ms, oldest first. -1 marks a failed probe.
+        """
+        return list(self._history.get(component, []))
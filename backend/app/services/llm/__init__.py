@@ -1,6 +1,19 @@
 """LLM services module."""
 
-from app.services.llm.ollama_client import OllamaClient
+from app.services.llm.admission import AdmissionController, AdmissionTimeoutError
+from app.services.llm.ollama_client import LLMTimeoutError, OllamaClient
+from app.services.llm.pool import EndpointPool
+from app.services.llm.response_cache import LLMResponseCache
 from app.services.llm.tool_converter import mcp_tools_to_ollama_format
+from app.services.llm.warmup import ModelWarmer
 
-__all__ = ["OllamaClient", "mcp_tools_to_ollama_format"]
+__all__ = [
+    "AdmissionController",
+    "AdmissionTimeoutError",
+    "EndpointPool",
+    "LLMResponseCache",
+    "LLMTimeoutError",
+    "ModelWarmer",
+    "OllamaClient",
+    "mcp_tools_to_ollama_format",
+]
@@ -0,0 +1,283 @@
+"""Admission control and fair scheduling of LLM requests."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+from app.config import settings
+from app.services.llm.pool import normalize_model
+
+logger = logging.getLogger(__name__)
+
+# Scheduling priorities, lower is served first
+PRIORITY_INTERACTIVE = 0  # Streamed chat, someone is watching the tokens
+PRIORITY_BATCH = 1  # Non-streaming API calls
+PRIORITY_BACKGROUND = 2  # Model warmup and keep-alive refresh
+
+
+class AdmissionTimeoutError(RuntimeError):
+    """Raised when a request waited too long for an LLM slot."""
+
+
+@dataclass(eq=False)
+class AdmissionTicket:
+    """A request's place in a model's queue."""
+
+    model: str
+    conversation_id: str
+    priority: int  # Lower is served first
+    enqueued_at: float = field(default_factory=time.monotonic)
+    granted: bool = False
+    released: bool = False
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class _ModelQueue:
+    """Slots and waiters of one model."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self.waiters: Dict[str, Deque[AdmissionTicket]] = {}
+        self.rotation: Deque[str] = deque()  # Round-robin order of waiting conversations
+        self.total = 0
+        self.timeouts = 0
+        self.waits_ms: Deque[float] = deque(maxlen=256)
+
+    def order(self) -> List[AdmissionTicket]:
+        """Waiters in the order they would be admitted."""
+        waiters = {cid: deque(q) for cid, q in self.waiters.items()}
+        rotation = deque(self.rotation)
+        ordered = []
+        while rotation:
+            ticket = self._pick(waiters, rotation)
+            ordered.append(ticket)
+        return ordered
+
+    @staticmethod
+    def _pick(
+        waiters: Dict[str, Deque[AdmissionTicket]],
+        rotation: Deque[str],
+    ) -> AdmissionTicket:
+        """Pop the next ticket: best priority, round-robin between conversations."""
+        best = min(waiters[cid][0].priority for cid in rotation)
+        cid = next(cid for cid in rotation if waiters[cid][0].priority == best)
+        ticket = waiters[cid].popleft()
+        rotation.remove(cid)
+        if waiters[cid]:
+            rotation.append(cid)
+        else:
+            del waiters[cid]
+        return ticket
+
+    def pop_next(self) -> AdmissionTicket:
+        """Remove and return the next ticket to admit."""
+        return self._pick(self.waiters, self.rotation)
+
+    def remove(self, ticket: AdmissionTicket) -> None:
+        """Withdraw a waiting ticket."""
+        queue = self.waiters.get(ticket.conversation_id)
+        if queue is None or ticket not in queue:
+            return
+        queue.remove(ticket)
+        if not queue:
+            del self.waiters[ticket.conversation_id]
+            self.rotation.remove(ticket.conversation_id)
+
+
+class AdmissionController:
+    """Bounds concurrent LLM requests per model and schedules the rest fairly.
+
+    Waiting requests are served by priority, then round-robin between
+    conversations, so one conversation issuing many LLM calls cannot
+    starve the others.
+    """
+
+    def __init__(self, endpoints: int = 1):
+        """Initialize admission controller.
+
+        Args:
+            endpoints: Number of Ollama endpoints serving requests; per-model
+                limits apply to each endpoint.
+        """
+        self.endpoints = max(1, endpoints)
+        self._queues: Dict[str, _ModelQueue] = {}
+
+    def _queue(self, model: str) -> _ModelQueue:
+        """Get or create the queue of a model ("llama3" and "llama3:latest" share one)."""
+        model = normalize_model(model)
+        queue = self._queues.get(model)
+        if queue is None:
+            limits = {
+                normalize_model(name): limit
+                for name, limit in settings.ollama.model_concurrency.items()
+            }
+            limit = limits.get(model, settings.ollama.max_concurrent_requests)
+            queue = self._queues[model] = _ModelQueue(max(1, limit) * self.endpoints)
+        return queue
+
+    def request(
+        self,
+        model: str,
+        conversation_id: str,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> AdmissionTicket:
+        """Queue a request for a slot, granting it at once if one is free.
+
+        Args:
+            model: Model name.
+            conversation_id: Conversation the request belongs to.
+            priority: Scheduling priority (lower first), one of PRIORITY_*.
+
+        Returns:
+            Admission ticket, to be released after the request.
+        """
+        ticket = AdmissionTicket(
+            model=normalize_model(model),
+            conversation_id=conversation_id,
+            priority=priority,
+        )
+        queue = self._queue(model)
+        if conversation_id not in queue.waiters:
+            queue.waiters[conversation_id] = deque()
+            queue.rotation.append(conversation_id)
+        queue.waiters[conversation_id].append(ticket)
+        self._dispatch(queue)
+        return ticket
+
+    def position(self, ticket: AdmissionTicket) -> int:
+        """Get a ticket's 1-based queue position (0 once granted).
+
+        Args:
+            ticket: Admission ticket.
+
+        Returns:
+            Queue position.
+        """
+        if ticket.granted:
+            return 0
+        ordered = self._queue(ticket.model).order()
+        return ordered.index(ticket) + 1 if ticket in ordered else 0
+
+    async def wait(
+        self,
+        ticket: AdmissionTicket,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[int]:
+        """Wait for a ticket to be granted, reporting queue position changes.
+
+        Args:
+            ticket: Admission ticket.
+            timeout: Maximum wait in seconds. Defaults to settings value.
+
+        Yields:
+            Queue position each time it changes while waiting.
+
+        Raises:
+            AdmissionTimeoutError: If the ticket is not granted in time.
+        """
+        timeout = settings.ollama.queue_timeout if timeout is None else timeout
+        deadline = ticket.enqueued_at + timeout
+        last_position = 0
+        while not ticket.granted:
+            position = self.position(ticket)
+            if position != last_position:
+                last_position = position
+                yield position
+
+            ticket.changed.clear()
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(ticket.changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                if ticket.granted:
+                    break
+                queue = self._queue(ticket.model)
+                queue.timeouts += 1
+                self.release(ticket)
+                raise AdmissionTimeoutError(
+                    f"Model '{ticket.model}' is saturated "
+                    f"({queue.limit} requests in flight, waited {timeout:g}s)"
+                )
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        model: str,
+        conversation_id: str,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a request.
+
+        Args:
+            model: Model name.
+            conversation_id: Conversation the request belongs to.
+            priority: Scheduling priority (lower first), one of PRIORITY_*.
+
+        Raises:
+            AdmissionTimeoutError: If no slot frees up within the queue timeout.
+        """
+        ticket = self.request(model, conversation_id, priority)
+        try:
+            async for _ in self.wait(ticket):
+                pass
+            yield
+        finally:
+            self.release(ticket)
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free a ticket's slot, or withdraw it if still waiting.
+
+        Args:
+            ticket: Admission ticket.
+        """
+        if ticket.released:
+            return
+        ticket.released = True
+        queue = self._queue(ticket.model)
+        if ticket.granted:
+            queue.in_flight -= 1
+        else:
+            queue.remove(ticket)
+        self._dispatch(queue)
+
+    def _dispatch(self, queue: _ModelQueue) -> None:
+        """Grant free slots to the next waiters and notify the others."""
+        while queue.in_flight < queue.limit and queue.rotation:
+            ticket = queue.pop_next()
+            ticket.granted = True
+            queue.in_flight += 1
+            queue.total += 1
+            queue.waits_ms.append((time.monotonic() - ticket.enqueued_at) * 1000)
+            ticket.changed.set()
+        for waiting in queue.waiters.values():
+            for ticket in waiting:
+                ticket.changed.set()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-model queue metrics.
+
+        Returns:
+            Dict of model -> gauges and counters.
+        """
+        result = {}
+        for model, queue in self._queues.items():
+            waits = sorted(queue.waits_ms)
+            p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+            result[model] = {
+                "max_in_flight": queue.limit,
+                "in_flight": queue.in_flight,
+                "queue_depth": sum(len(q) for q in queue.waiters.values()),
+                "waiting_conversations": len(queue.rotation),
+                "total_requests": queue.total,
+                "queue_timeouts": queue.timeouts,
+                "wait_ms_p95": round(p95, 1),
+                "wait_ms_max": round(waits[-1], 1) if waits else 0.0,
+            }
+        return result
@@ -1,15 +1,49 @@
 """Async Ollama client with tool calling support."""
 
+import asyncio
 import logging
-from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Dict, List, Optional
+import random
+import re
+import time
+from contextlib import aclosing
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-from ollama import AsyncClient
+import httpx
+from ollama import ResponseError
 
 from app.config import settings
+from app.services.llm.admission import AdmissionController
+from app.services.llm.pool import EndpointPool, OllamaEndpoint, normalize_model
+from app.services.llm.response_cache import CachedResponse, LLMResponseCache, make_response_key
 
 logger = logging.getLogger(__name__)
 
+# Errors meaning the endpoint could not serve the request at all
+FAILOVER_ERRORS = (
+    ConnectionError,
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+class LLMTimeoutError(TimeoutError):
+    """Raised when Ollama did not answer or stream within a timeout."""
+
+
+@dataclass
+class RequestMetrics:
+    """Counters of LLM requests, retries and timeouts."""
+
+    requests: int = 0
+    retries: int = 0
+    continuations: int = 0
+    connect_timeouts: int = 0
+    read_timeouts: int = 0
+    first_token_timeouts: int = 0
+    stall_timeouts: int = 0
+
 
 @dataclass
 class ChatChunk:
@@ -20,6 +54,8 @@ class ChatChunk:
     done: bool = False
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    done_reason: str = ""
+    cached: bool = False
 
 
 @dataclass
@@ -31,19 +67,42 @@ class ChatResult:
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    done_reason: str = ""
+    cached: bool = False
 
 
 class OllamaClient:
-    """Async Ollama client with tool calling support."""
+    """Async Ollama client with tool calling support.
 
-    def __init__(self, base_url: Optional[str] = None):
+    Requests are routed across the endpoints of an EndpointPool and fail
+    over to the next endpoint on connection errors.
+    """
+
+    def __init__(self, endpoints: Optional[List[str]] = None):
         """Initialize Ollama client.
 
         Args:
-            base_url: Ollama server URL. Defaults to settings value.
+            endpoints: Ollama server URLs. Defaults to settings
+                `endpoints`, or `base_url` if none are configured.
         """
-        self.base_url = base_url or settings.ollama.base_url
-        self._client = AsyncClient(host=self.base_url)
+        self.pool = EndpointPool(
+            endpoints or settings.ollama.endpoints or [settings.ollama.base_url]
+        )
+        self.admission = AdmissionController(endpoints=len(self.pool))
+        self.metrics = RequestMetrics()
+        # Own RNG for retry jitter: tools running in-process may seed the global one
+        self._jitter = random.Random()
+
+        self.cache: Optional[LLMResponseCache] = None
+        if settings.llm_cache.enabled:
+            if settings.llm_cache.require_zero_temperature and settings.ollama.temperature != 0:
+                logger.warning("LLM response cache disabled: it requires OLLAMA_TEMPERATURE=0")
+            else:
+                self.cache = LLMResponseCache()
+        max_ctx = settings.ollama.num_ctx
+        self.num_ctx_buckets = sorted(
+            {b for b in settings.ollama.num_ctx_buckets if 0 < b < max_ctx} | {max_ctx}
+        )
 
     async def chat(
         self,
@@ -51,6 +110,10 @@ class OllamaClient:
         model: Optional[str] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         stream: bool = False,
+        conversation_id: Optional[str] = None,
+        prompt_tokens: Optional[int] = None,
+        phase: str = "answer",
+        cache: bool = True,
     ) -> ChatResult | AsyncIterator[ChatChunk]:
         """Send chat request to Ollama.
 
@@ -59,31 +122,418 @@ class OllamaClient:
             model: Model name. Defaults to settings value.
             tools: Available tools in Ollama format.
             stream: Whether to stream the response.
+            conversation_id: Conversation, to keep it on the same endpoint.
+            prompt_tokens: Estimated prompt tokens (tools included), used to
+                size num_ctx. None uses the largest context window.
+            phase: "tools" for a turn expected to call tools (short
+                num_predict, extended if the model answers instead), or
+                "answer" for a final answer.
+            cache: Look up the response cache (when enabled). False
+                bypasses it; the fresh response still refreshes the entry.
 
         Returns:
             ChatResult if not streaming, AsyncIterator[ChatChunk] if streaming.
         """
         model = model or settings.ollama.default_model
+        num_predict = self._num_predict(phase)
+
+        key = self._cache_key(messages, model, tools, phase)
+        if key is not None and cache:
+            entry = self._lookup(key)
+            if entry is not None:
+                return self.replay(entry, stream)
 
         kwargs: Dict[str, Any] = {
             "model": model,
             "messages": messages,
-            "options": {
-                "num_ctx": settings.ollama.num_ctx,
-                "num_predict": settings.ollama.num_predict,
-            },
+            "keep_alive": settings.ollama.keep_alive,
         }
         if tools:
             kwargs["tools"] = tools
 
         if stream:
-            return self._stream_chat(**kwargs)
+            chunks = self._stream_chat(conversation_id, prompt_tokens, num_predict, **kwargs)
+            return chunks if key is None else self._record(key, chunks)
+
+        start = time.monotonic()
+        result = await self._sync_chat(conversation_id, prompt_tokens, num_predict, **kwargs)
+        if key is not None:
+            self.cache.put(key, CachedResponse(
+                chunks=[{"content": result.content, "tool_calls": result.tool_calls}],
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+                done_reason=result.done_reason,
+                first_token_ms=0,
+                duration_ms=int((time.monotonic() - start) * 1000),
+            ))
+        return result
+
+    def lookup(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        phase: str = "answer",
+    ) -> Optional[CachedResponse]:
+        """Look up the response cache for a request.
+
+        Lets callers decide on admission from the entry they will serve:
+        replay it with replay(), or generate with chat(cache=False).
+
+        Args:
+            messages: Conversation messages.
+            model: Model name. Defaults to settings value.
+            tools: Available tools in Ollama format.
+            phase: Generation phase.
+
+        Returns:
+            Cached response, or None on a miss or if caching is off.
+        """
+        key = self._cache_key(messages, model or settings.ollama.default_model, tools, phase)
+        return self._lookup(key) if key is not None else None
+
+    def replay(
+        self,
+        entry: CachedResponse,
+        stream: bool = False,
+    ) -> ChatResult | AsyncIterator[ChatChunk]:
+        """Serve a cached response like chat() would.
+
+        Args:
+            entry: Response returned by lookup().
+            stream: Whether to replay it as a chunk stream.
+
+        Returns:
+            ChatResult if not streaming, AsyncIterator[ChatChunk] if streaming.
+        """
+        return self._replay(entry) if stream else self._cached_result(entry)
+
+    def _lookup(self, key: str) -> Optional[CachedResponse]:
+        """Get a live cache entry."""
+        entry = self.cache.get(key)
+        if entry is not None:
+            logger.debug(f"LLM response cache hit ({key[:12]})")
+        return entry
+
+    @staticmethod
+    def _num_predict(phase: str) -> int:
+        """Get the generation limit of a phase."""
+        if phase == "tools":
+            return settings.ollama.num_predict_tools
+        return settings.ollama.num_predict
+
+    @staticmethod
+    def _generation_options(num_predict: int) -> Dict[str, Any]:
+        """Options that affect the generated output."""
+        options: Dict[str, Any] = {"num_predict": num_predict}
+        if settings.ollama.temperature is not None:
+            options["temperature"] = settings.ollama.temperature
+        return options
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        tools: Optional[List[Dict[str, Any]]],
+        phase: str,
+    ) -> Optional[str]:
+        """Get the response cache key of a request, None if caching is off.
+
+        num_ctx is left out: it only sizes the KV cache.
+        """
+        if self.cache is None:
+            return None
+        return make_response_key(
+            normalize_model(model),
+            self._generation_options(self._num_predict(phase)),
+            messages,
+            tools,
+        )
+
+    @staticmethod
+    def _cached_result(entry: CachedResponse) -> ChatResult:
+        """Build a chat result from a cached response."""
+        return ChatResult(
+            content=entry.content,
+            tool_calls=entry.tool_calls,
+            prompt_tokens=entry.prompt_tokens,
+            completion_tokens=entry.completion_tokens,
+            total_tokens=entry.prompt_tokens + entry.completion_tokens,
+            done_reason=entry.done_reason,
+            cached=True,
+        )
+
+    async def _replay(self, entry: CachedResponse) -> AsyncIterator[ChatChunk]:
+        """Replay a cached response as a chunk stream.
+
+        In "paced" mode chunks are spaced like the original generation; a
+        response recorded without streaming is split into words.
+        """
+        chunks = entry.chunks
+        paced = settings.llm_cache.replay == "paced"
+        if paced and len(chunks) == 1 and chunks[0]["content"]:
+            words = re.findall(r"\s*\S+\s*", chunks[0]["content"]) or [chunks[0]["content"]]
+            chunks = [{"content": w, "tool_calls": []} for w in words]
+            chunks[-1]["tool_calls"] = entry.chunks[0]["tool_calls"]
+
+        if paced:
+            interval = max(0, entry.duration_ms - entry.first_token_ms) / 1000 / max(1, len(chunks))
+            await asyncio.sleep(entry.first_token_ms / 1000)
+        for i, chunk in enumerate(chunks):
+            if paced and i:
+                await asyncio.sleep(interval)
+            yield ChatChunk(
+                content=chunk["content"],
+                tool_calls=list(chunk["tool_calls"]),
+                cached=True,
+            )
+        yield ChatChunk(
+            done=True,
+            prompt_tokens=entry.prompt_tokens,
+            completion_tokens=entry.completion_tokens,
+            done_reason=entry.done_reason,
+            cached=True,
+        )
+
+    async def _record(
+        self,
+        key: str,
+        stream: AsyncIterator[ChatChunk],
+    ) -> AsyncIterator[ChatChunk]:
+        """Pass a stream through, caching it once complete."""
+        start = time.monotonic()
+        first_token_ms: Optional[int] = None
+        chunks: List[Dict[str, Any]] = []
+        async with aclosing(stream):
+            async for chunk in stream:
+                if first_token_ms is None:
+                    first_token_ms = int((time.monotonic() - start) * 1000)
+                if chunk.content or chunk.tool_calls:
+                    chunks.append({"content": chunk.content, "tool_calls": chunk.tool_calls})
+                if chunk.done:
+                    self.cache.put(key, CachedResponse(
+                        chunks=chunks,
+                        prompt_tokens=chunk.prompt_tokens,
+                        completion_tokens=chunk.completion_tokens,
+                        done_reason=chunk.done_reason,
+                        first_token_ms=first_token_ms,
+                        duration_ms=int((time.monotonic() - start) * 1000),
+                    ))
+                yield chunk
+
+    def _options(
+        self,
+        endpoint: OllamaEndpoint,
+        model: str,
+        prompt_tokens: Optional[int],
+        num_predict: int,
+    ) -> Dict[str, Any]:
+        """Build request options, sizing num_ctx for the endpoint.
+
+        num_ctx is the smallest bucket that fits the prompt and the
+        generation. Ollama reloads the model whenever num_ctx changes, so
+        the size the endpoint last loaded the model with is kept while it
+        fits: the window grows on demand, and shrinks back to the fitting
+        bucket after `num_ctx_shrink_after` consecutive requests that
+        would fit a smaller one.
+
+        Args:
+            endpoint: Endpoint the request is sent to.
+            model: Model name.
+            prompt_tokens: Estimated prompt tokens, None if unknown.
+            num_predict: Maximum tokens to generate.
+
+        Returns:
+            Ollama options.
+        """
+        name = normalize_model(model)
+        if prompt_tokens is None:
+            fitting = self.num_ctx_buckets[-1]
+        else:
+            needed = prompt_tokens + num_predict + settings.conversation.context_safety_tokens
+            fitting = next(
+                (b for b in self.num_ctx_buckets if b >= needed), self.num_ctx_buckets[-1]
+            )
+
+        num_ctx = fitting
+        loaded = endpoint.num_ctx.get(name, 0)
+        oversized = endpoint.num_ctx_oversized.get(name, 0) + 1 if loaded > fitting else 0
+        shrink_after = settings.ollama.num_ctx_shrink_after
+        if oversized and not (shrink_after and oversized >= shrink_after):
+            num_ctx = loaded  # Avoid a reload while the larger window is loaded
         else:
-            return await self._sync_chat(**kwargs)
+            oversized = 0
+        endpoint.num_ctx[name] = num_ctx
+        endpoint.num_ctx_oversized[name] = oversized
+        return {"num_ctx": num_ctx, **self._generation_options(num_predict)}
 
-    async def _sync_chat(self, **kwargs: Any) -> ChatResult:
-        """Non-streaming chat."""
-        response = await self._client.chat(**kwargs)
+    @staticmethod
+    def _truncated_answer(done_reason: str, tool_calls: Any, num_predict: int) -> bool:
+        """Whether a short tool-phase generation was cut off in a prose answer."""
+        return (
+            done_reason == "length"
+            and not tool_calls
+            and num_predict < settings.ollama.num_predict
+        )
+
+    @staticmethod
+    def _continuation(kwargs: Dict[str, Any], content: str) -> Dict[str, Any]:
+        """Request kwargs continuing a partial answer (assistant prefill)."""
+        return {
+            **kwargs,
+            "messages": [*kwargs["messages"], {"role": "assistant", "content": content}],
+        }
+
+    def _attempts(
+        self,
+        model: str,
+        conversation_id: Optional[str],
+    ) -> Iterator[Tuple[OllamaEndpoint, float]]:
+        """Plan the endpoints to try for a request.
+
+        Every candidate is tried once per round, failing over immediately.
+        Up to max_retries further rounds follow, each after an exponential
+        backoff with full jitter, with candidates re-ranked by then.
+
+        Args:
+            model: Model name.
+            conversation_id: Conversation, for sticky routing.
+
+        Yields:
+            Tuples of (endpoint, seconds to wait before trying it).
+        """
+        for round_ in range(settings.ollama.max_retries + 1):
+            delay = 0.0
+            if round_:
+                cap = settings.ollama.retry_backoff_base * 2 ** (round_ - 1)
+                delay = self._jitter.uniform(0, min(settings.ollama.retry_backoff_max, cap))
+            for endpoint in self.pool.candidates(model, conversation_id):
+                yield endpoint, delay
+                delay = 0.0
+
+    async def _before_attempt(
+        self,
+        attempt: int,
+        delay: float,
+        last_error: Optional[Exception],
+    ) -> None:
+        """Count a retry and back off, or give up when retrying cannot help.
+
+        Args:
+            attempt: Zero-based attempt number.
+            delay: Backoff before this attempt.
+            last_error: Error of the previous attempt.
+
+        Raises:
+            ResponseError: If a new round would only hit "model not found" again.
+        """
+        if not attempt:
+            return
+        if delay and isinstance(last_error, ResponseError):
+            raise last_error
+        self.metrics.retries += 1
+        if delay:
+            logger.info(f"Retrying Ollama request in {delay:.2f}s after: {last_error}")
+            await asyncio.sleep(delay)
+
+    def _failover(
+        self,
+        endpoint: OllamaEndpoint,
+        model: str,
+        error: Exception,
+    ) -> bool:
+        """Decide whether a failed request may be retried on another endpoint.
+
+        Args:
+            endpoint: Endpoint that failed.
+            model: Requested model.
+            error: Raised error.
+
+        Returns:
+            True to try the next endpoint.
+        """
+        if isinstance(error, ResponseError):
+            if error.status_code != 404:
+                return False
+            # Model not installed on this endpoint
+            self.pool.mark_missing(endpoint, model)
+        else:
+            if isinstance(error, httpx.ConnectTimeout):
+                self.metrics.connect_timeouts += 1
+            self.pool.mark_failure(endpoint, error)
+        if len(self.pool) > 1:
+            logger.warning(f"Ollama endpoint {endpoint.url} failed ({error}), failing over")
+        return True
+
+    async def _sync_chat(
+        self,
+        conversation_id: Optional[str],
+        prompt_tokens: Optional[int],
+        num_predict: int,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """Non-streaming chat, continuing answers cut off by a short tool-phase limit."""
+        result = await self._sync_once(conversation_id, prompt_tokens, num_predict, **kwargs)
+        if not self._truncated_answer(result.done_reason, result.tool_calls, num_predict):
+            return result
+
+        logger.debug(f"Answer cut at {num_predict} tokens, continuing")
+        self.metrics.continuations += 1
+        rest = await self._sync_once(
+            conversation_id,
+            None if prompt_tokens is None else prompt_tokens + result.completion_tokens,
+            settings.ollama.num_predict - result.completion_tokens,
+            **self._continuation(kwargs, result.content),
+        )
+        completion_tokens = result.completion_tokens + rest.completion_tokens
+        return ChatResult(
+            content=result.content + rest.content,
+            tool_calls=rest.tool_calls,
+            prompt_tokens=result.prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=result.prompt_tokens + completion_tokens,
+            done_reason=rest.done_reason,
+        )
+
+    async def _sync_once(
+        self,
+        conversation_id: Optional[str],
+        prompt_tokens: Optional[int],
+        num_predict: int,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """One non-streaming request, with failover and retries."""
+        self.metrics.requests += 1
+        last_error: Optional[Exception] = None
+        for attempt, (endpoint, delay) in enumerate(
+            self._attempts(kwargs["model"], conversation_id)
+        ):
+            await self._before_attempt(attempt, delay, last_error)
+            endpoint.in_flight += 1
+            endpoint.total_requests += 1
+            try:
+                response = await endpoint.client.chat(
+                    **kwargs,
+                    options=self._options(endpoint, kwargs["model"], prompt_tokens, num_predict),
+                )
+            except httpx.ReadTimeout as e:
+                self.metrics.read_timeouts += 1
+                self.pool.mark_failure(endpoint, e)
+                raise LLMTimeoutError(
+                    f"Ollama {endpoint.url} did not answer within "
+                    f"{settings.ollama.request_timeout:g}s"
+                ) from None
+            except (*FAILOVER_ERRORS, ResponseError) as e:
+                if not self._failover(endpoint, kwargs["model"], e):
+                    raise
+                last_error = e
+                continue
+            finally:
+                endpoint.in_flight -= 1
+            self.pool.mark_success(endpoint, conversation_id, kwargs["model"])
+            break
+        else:
+            raise last_error
 
         tool_calls = []
         if response.message.tool_calls:
@@ -99,63 +549,220 @@ class OllamaClient:
             prompt_tokens=response.prompt_eval_count or 0,
             completion_tokens=response.eval_count or 0,
             total_tokens=(response.prompt_eval_count or 0) + (response.eval_count or 0),
+            done_reason=response.done_reason or "",
         )
 
-    async def _stream_chat(self, **kwargs: Any) -> AsyncIterator[ChatChunk]:
-        """Streaming chat with tool call detection."""
-        async for chunk in await self._client.chat(**kwargs, stream=True):
-            message = chunk.get("message", {})
-
-            tool_calls = []
-            if message.get("tool_calls"):
-                for tc in message["tool_calls"]:
-                    tool_calls.append({
-                        "name": tc["function"]["name"],
-                        "arguments": tc["function"]["arguments"],
-                    })
-
-            # Extract token counts from final chunk
-            is_done = chunk.get("done", False)
-            prompt_tokens = 0
-            completion_tokens = 0
-            if is_done:
-                prompt_tokens = chunk.get("prompt_eval_count", 0) or 0
-                completion_tokens = chunk.get("eval_count", 0) or 0
+    async def _stream_chat(
+        self,
+        conversation_id: Optional[str],
+        prompt_tokens: Optional[int],
+        num_predict: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatChunk]:
+        """Streaming chat with tool call detection.
 
-            yield ChatChunk(
-                content=message.get("content", ""),
-                tool_calls=tool_calls,
-                done=is_done,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-            )
+        An answer cut off by a short tool-phase limit is continued in a
+        second request, transparently for the consumer.
+        """
+        content = ""
+        called = False
+        truncated: Optional[ChatChunk] = None
+        stream = self._stream_once(conversation_id, prompt_tokens, num_predict, **kwargs)
+        async with aclosing(stream):
+            async for chunk in stream:
+                content += chunk.content
+                called = called or bool(chunk.tool_calls)
+                if chunk.done and self._truncated_answer(chunk.done_reason, called, num_predict):
+                    truncated = chunk
+                    break
+                yield chunk
+        if truncated is None:
+            return
+
+        if truncated.content:
+            yield ChatChunk(content=truncated.content)
+        logger.debug(f"Answer cut at {num_predict} tokens, continuing")
+        self.metrics.continuations += 1
+        rest = self._stream_once(
+            conversation_id,
+            None if prompt_tokens is None else prompt_tokens + truncated.completion_tokens,
+            settings.ollama.num_predict - truncated.completion_tokens,
+            **self._continuation(kwargs, content),
+        )
+        async with aclosing(rest):
+            async for chunk in rest:
+                if chunk.done:
+                    chunk.prompt_tokens = truncated.prompt_tokens
+                    chunk.completion_tokens += truncated.completion_tokens
+                yield chunk
+
+    async def _stream_once(
+        self,
+        conversation_id: Optional[str],
+        prompt_tokens: Optional[int],
+        num_predict: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatChunk]:
+        """One streaming request, with failover and retries.
+
+        Fails over or retries only before the first chunk: a stream that
+        broke midway cannot be resumed elsewhere. The first chunk must
+        arrive within first_token_timeout and each next one within
+        stream_stall_timeout. Closing this generator closes the HTTP
+        stream, which stops the generation on the Ollama server.
+
+        Raises:
+            LLMTimeoutError: If the first chunk is late or the stream stalls.
+        """
+        self.metrics.requests += 1
+        last_error: Optional[Exception] = None
+        for attempt, (endpoint, delay) in enumerate(
+            self._attempts(kwargs["model"], conversation_id)
+        ):
+            await self._before_attempt(attempt, delay, last_error)
+            endpoint.in_flight += 1
+            endpoint.total_requests += 1
+            started = False
+            try:
+                stream = await endpoint.client.chat(
+                    **kwargs,
+                    options=self._options(endpoint, kwargs["model"], prompt_tokens, num_predict),
+                    stream=True,
+                )
+                async with aclosing(stream):
+                    while True:
+                        timeout = (
+                            settings.ollama.stream_stall_timeout if started
+                            else settings.ollama.first_token_timeout
+                        )
+                        try:
+                            async with asyncio.timeout(timeout):
+                                chunk = await anext(stream)
+                        except StopAsyncIteration:
+                            break
+                        except TimeoutError:
+                            if started:
+                                self.metrics.stall_timeouts += 1
+                                message = f"stalled for {timeout:g}s"
+                            else:
+                                self.metrics.first_token_timeouts += 1
+                                message = f"sent no token within {timeout:g}s"
+                            error = LLMTimeoutError(f"Ollama {endpoint.url} {message}")
+                            self.pool.mark_failure(endpoint, error)
+                            raise error from None
+                        if not started:
+                            started = True
+                            self.pool.mark_success(endpoint, conversation_id, kwargs["model"])
+                        yield self._parse_chunk(chunk)
+                return
+            except httpx.ReadTimeout as e:
+                self.metrics.read_timeouts += 1
+                self.pool.mark_failure(endpoint, e)
+                raise LLMTimeoutError(
+                    f"Ollama {endpoint.url} did not answer within "
+                    f"{settings.ollama.request_timeout:g}s"
+                ) from None
+            except (*FAILOVER_ERRORS, ResponseError) as e:
+                if started:
+                    if not isinstance(e, ResponseError):
+                        self.pool.mark_failure(endpoint, e)
+                    raise
+                if not self._failover(endpoint, kwargs["model"], e):
+                    raise
+                last_error = e
+            finally:
+                endpoint.in_flight -= 1
+        raise last_error
+
+    @staticmethod
+    def _parse_chunk(chunk: Any) -> ChatChunk:
+        """Convert an Ollama stream chunk."""
+        message = chunk.get("message", {})
+
+        tool_calls = []
+        if message.get("tool_calls"):
+            for tc in message["tool_calls"]:
+                tool_calls.append({
+                    "name": tc["function"]["name"],
+                    "arguments": tc["function"]["arguments"],
+                })
+
+        # Extract token counts from final chunk
+        is_done = chunk.get("done", False)
+        prompt_tokens = 0
+        completion_tokens = 0
+        if is_done:
+            prompt_tokens = chunk.get("prompt_eval_count", 0) or 0
+            completion_tokens = chunk.get("eval_count", 0) or 0
+
+        return ChatChunk(
+            content=message.get("content", ""),
+            tool_calls=tool_calls,
+            done=is_done,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            done_reason=(chunk.get("done_reason") or "") if is_done else "",
+        )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get request, retry and timeout counters.
+
+        Returns:
+            Metrics dictionary.
+        """
+        return asdict(self.metrics)
 
     async def list_models(self) -> List[Dict[str, Any]]:
-        """List available models."""
-        models = await self._client.list()
-        return [
-            {
-                "name": m.model,
-                "size": m.size,
-                "modified_at": str(m.modified_at) if m.modified_at else None,
-                "digest": m.digest,
-            }
-            for m in models.models
-        ]
+        """List models available on any endpoint."""
+        endpoints = [e for e in self.pool.endpoints if not e.ejected] or self.pool.endpoints
+        responses = await asyncio.gather(
+            *(e.client.list() for e in endpoints), return_exceptions=True
+        )
+        if all(isinstance(r, Exception) for r in responses):
+            raise responses[0]
+
+        models: Dict[str, Dict[str, Any]] = {}
+        for endpoint, response in zip(endpoints, responses):
+            if isinstance(response, Exception):
+                logger.warning(f"Listing models on {endpoint.url} failed: {response}")
+                continue
+            for m in response.models:
+                entry = models.setdefault(m.model, {
+                    "name": m.model,
+                    "size": m.size,
+                    "modified_at": str(m.modified_at) if m.modified_at else None,
+                    "digest": m.digest,
+                    "endpoints": [],
+                })
+                entry["endpoints"].append(endpoint.url)
+        return list(models.values())
 
     async def pull_model(self, name: str) -> AsyncIterator[Dict[str, Any]]:
-        """Pull/download a model with progress streaming."""
-        async for progress in await self._client.pull(name, stream=True):
-            yield {
-                "status": progress.get("status", ""),
-                "digest": progress.get("digest"),
-                "total": progress.get("total"),
-                "completed": progress.get("completed"),
-            }
+        """Pull/download a model on every endpoint with progress streaming."""
+        for endpoint in self.pool.endpoints:
+            async for progress in await endpoint.client.pull(name, stream=True):
+                yield {
+                    "status": progress.get("status", ""),
+                    "digest": progress.get("digest"),
+                    "total": progress.get("total"),
+                    "completed": progress.get("completed"),
+                    "endpoint": endpoint.url,
+                }
+            self.pool.mark_installed(endpoint, name)
 
     async def show_model(self, name: str) -> Dict[str, Any]:
         """Get model details."""
-        info = await self._client.show(name)
+        last_error: Optional[Exception] = None
+        for endpoint in self.pool.candidates(name):
+            try:
+                info = await endpoint.client.show(name)
+                break
+            except (*FAILOVER_ERRORS, ResponseError) as e:
+                if not self._failover(endpoint, name, e):
+                    raise
+                last_error = e
+        else:
+            raise last_error
         return {
             "modelfile": info.modelfile,
             "parameters": info.parameters,
@@ -164,10 +771,23 @@ class OllamaClient:
         }
 
     async def is_healthy(self) -> bool:
-        """Check if Ollama is reachable."""
-        try:
-            await self._client.list()
-            return True
-        except Exception as e:
-            logger.warning(f"Ollama health check failed: {e}")
-            return False
+        """Check if at least one Ollama endpoint is reachable."""
+        return await self.ping() >= 0
+
+    async def ping(self) -> int:
+        """Probe every endpoint, ejecting or readmitting them.
+
+        Returns:
+            Best latency in milliseconds among healthy endpoints, -1 if
+            none is reachable.
+        """
+        await self.pool.probe()
+        latencies = [
+            e.latency_ms for e in self.pool.endpoints
+            if e.latency_ms >= 0 and not e.ejected
+        ]
+        return min(latencies) if latencies else -1
+
+    async def close(self) -> None:
+        """Close underlying HTTP connections."""
+        await self.pool.close()
@@ -0,0 +1,254 @@
+"""Pool of Ollama endpoints with load-aware, sticky routing."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+from ollama import AsyncClient
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bound on remembered conversation -> endpoint bindings
+MAX_STICKY_CONVERSATIONS = 4096
+
+
+def normalize_model(name: str) -> str:
+    """Normalize a model name the way Ollama does ("llama3" -> "llama3:latest")."""
+    return name if ":" in name else f"{name}:latest"
+
+
+@dataclass(eq=False)
+class OllamaEndpoint:
+    """One Ollama host and its routing state."""
+
+    url: str
+    client: AsyncClient
+    http: httpx.AsyncClient
+    in_flight: int = 0
+    failures: int = 0  # Consecutive failures
+    ejected_until: float = 0.0
+    models: Optional[Set[str]] = None  # None until first probe: assume any model
+    latency_ms: int = -1
+    total_requests: int = 0
+    total_failures: int = 0
+    last_error: Optional[str] = field(default=None, repr=False)
+    last_used: Dict[str, float] = field(default_factory=dict)  # Model -> monotonic time
+    num_ctx: Dict[str, int] = field(default_factory=dict)  # Model -> context size last requested
+    num_ctx_oversized: Dict[str, int] = field(default_factory=dict)  # Model -> consecutive requests fitting a smaller num_ctx
+
+    @property
+    def ejected(self) -> bool:
+        """Whether the endpoint is currently skipped for routing."""
+        return self.ejected_until > time.monotonic()
+
+    def serves(self, model: str) -> bool:
+        """Whether the endpoint is known (or assumed) to have a model."""
+        return self.models is None or normalize_model(model) in self.models
+
+
+class EndpointPool:
+    """Routes LLM requests across Ollama endpoints.
+
+    Endpoints are ranked by model availability, then in-flight load and
+    probe latency. A conversation sticks to the endpoint that served it
+    last, so the host's prompt cache stays warm, unless that endpoint is
+    ejected or much busier than the others. Endpoints failing repeatedly
+    (requests or health probes) are ejected for a while.
+    """
+
+    def __init__(self, urls: List[str]):
+        """Initialize endpoint pool.
+
+        Args:
+            urls: Ollama server URLs.
+        """
+        self.endpoints = [
+            OllamaEndpoint(
+                url=url,
+                client=AsyncClient(
+                    host=url,
+                    timeout=httpx.Timeout(
+                        settings.ollama.request_timeout,
+                        connect=settings.ollama.connect_timeout,
+                    ),
+                ),
+                http=httpx.AsyncClient(base_url=url, timeout=settings.health.probe_timeout),
+            )
+            for url in dict.fromkeys(u.rstrip("/") for u in urls)
+        ]
+        self._sticky: "OrderedDict[str, OllamaEndpoint]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def candidates(
+        self,
+        model: str,
+        conversation_id: Optional[str] = None,
+    ) -> List[OllamaEndpoint]:
+        """Get the endpoints to try for a request, best first.
+
+        Args:
+            model: Model name.
+            conversation_id: Conversation, for sticky routing.
+
+        Returns:
+            Endpoints in failover order.
+        """
+        live = [e for e in self.endpoints if not e.ejected]
+        if not live:
+            # Everything is ejected: try anyway, soonest to recover first
+            return sorted(self.endpoints, key=lambda e: e.ejected_until)
+
+        # Endpoints without the model go last: it may have been pulled since the
+        # probe. Endpoints that failed recently come after healthy ones.
+        ranked = sorted(
+            live,
+            key=lambda e: (
+                not e.serves(model),
+                e.failures > 0,
+                e.in_flight,
+                e.latency_ms if e.latency_ms >= 0 else math.inf,
+            ),
+        )
+
+        sticky = self._sticky.get(conversation_id) if conversation_id else None
+        if (
+            sticky in ranked
+            and sticky.serves(model)
+            and sticky.in_flight <= ranked[0].in_flight + settings.ollama.sticky_max_imbalance
+        ):
+            ranked.remove(sticky)
+            ranked.insert(0, sticky)
+        return ranked
+
+    def mark_success(
+        self,
+        endpoint: OllamaEndpoint,
+        conversation_id: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        """Record a successful request and bind the conversation to the endpoint.
+
+        Args:
+            endpoint: Endpoint that served the request.
+            conversation_id: Conversation to bind.
+            model: Model used, which the request kept loaded.
+        """
+        endpoint.failures = 0
+        endpoint.ejected_until = 0.0
+        if model:
+            endpoint.last_used[normalize_model(model)] = time.monotonic()
+        if conversation_id:
+            self._sticky[conversation_id] = endpoint
+            self._sticky.move_to_end(conversation_id)
+            while len(self._sticky) > MAX_STICKY_CONVERSATIONS:
+                self._sticky.popitem(last=False)
+
+    def mark_failure(self, endpoint: OllamaEndpoint, error: Exception) -> None:
+        """Record a failed request or probe, ejecting the endpoint past the threshold.
+
+        Args:
+            endpoint: Endpoint that failed.
+            error: Failure cause.
+        """
+        endpoint.failures += 1
+        endpoint.total_failures += 1
+        endpoint.last_error = str(error) or type(error).__name__
+        if endpoint.failures >= settings.ollama.endpoint_failure_threshold and not endpoint.ejected:
+            endpoint.ejected_until = time.monotonic() + settings.ollama.endpoint_eject_seconds
+            logger.warning(
+                f"Ejecting Ollama endpoint {endpoint.url} for "
+                f"{settings.ollama.endpoint_eject_seconds:g}s after "
+                f"{endpoint.failures} failures: {endpoint.last_error}"
+            )
+
+    def mark_missing(self, endpoint: OllamaEndpoint, model: str) -> None:
+        """Record that an endpoint does not have a model.
+
+        Args:
+            endpoint: Endpoint that answered "model not found".
+            model: Model name.
+        """
+        if endpoint.models is not None:
+            endpoint.models.discard(normalize_model(model))
+
+    def mark_installed(self, endpoint: OllamaEndpoint, model: str) -> None:
+        """Record that a model was pulled on an endpoint.
+
+        Args:
+            endpoint: Endpoint the model was pulled on.
+            model: Model name.
+        """
+        if endpoint.models is not None:
+            endpoint.models.add(normalize_model(model))
+
+    async def probe(self) -> None:
+        """Check every endpoint concurrently, refreshing health, latency and models.
+
+        A successful probe readmits an ejected endpoint.
+        """
+        await asyncio.gather(*(self._probe(e) for e in self.endpoints))
+
+    async def _probe(self, endpoint: OllamaEndpoint) -> None:
+        """Probe one endpoint via its model list."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            response = await endpoint.http.get("/api/tags")
+            response.raise_for_status()
+            models = response.json().get("models") or []
+        except Exception as e:
+            endpoint.latency_ms = -1
+            logger.warning(f"Ollama endpoint {endpoint.url} probe failed: {e}")
+            self.mark_failure(endpoint, e)
+            return
+
+        endpoint.latency_ms = int((loop.time() - start) * 1000)
+        endpoint.models = {
+            normalize_model(m.get("model") or m.get("name", "")) for m in models
+        }
+        if endpoint.ejected:
+            logger.info(f"Readmitting Ollama endpoint {endpoint.url}")
+        endpoint.failures = 0
+        endpoint.ejected_until = 0.0
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Get routing state of every endpoint.
+
+        Returns:
+            One entry per endpoint.
+        """
+        now = time.monotonic()
+        return [
+            {
+                "url": e.url,
+                "healthy": not e.ejected and e.latency_ms >= 0,
+                "ejected_for_s": round(max(0.0, e.ejected_until - now), 1),
+                "latency_ms": e.latency_ms,
+                "in_flight": e.in_flight,
+                "total_requests": e.total_requests,
+                "total_failures": e.total_failures,
+                "models": sorted(e.models) if e.models is not None else None,
+                "last_error": e.last_error,
+            }
+            for e in self.endpoints
+        ]
+
+    async def close(self) -> None:
+        """Close the Ollama clients and probe connections of every endpoint."""
+        for endpoint in self.endpoints:
+            try:
+                # AsyncClient.close() only exists in recent ollama releases
+                close = getattr(endpoint.client, "close", None)
+                await (close() if close else endpoint.client._client.aclose())
+            except Exception as e:
+                logger.warning(f"Failed to close Ollama client for {endpoint.url}: {e}")
+            await endpoint.http.aclose()
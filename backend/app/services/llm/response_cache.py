@@ -0,0 +1,265 @@
+"""Response cache for deterministic LLM calls."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Message fields Ollama uses; others (timestamps, metadata) must not split keys
+MESSAGE_FIELDS = ("role", "content", "tool_calls", "tool_name", "images")
+# Disk tier is pruned every this many writes
+PRUNE_EVERY = 100
+
+
+@dataclass
+class CachedResponse:
+    """A recorded LLM response, replayable as a result or a chunk stream."""
+
+    chunks: List[Dict[str, Any]]  # {"content": str, "tool_calls": list} in stream order
+    prompt_tokens: int
+    completion_tokens: int
+    done_reason: str
+    first_token_ms: int  # Delay before the first chunk (0 for non-streaming)
+    duration_ms: int  # Total generation time
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def content(self) -> str:
+        """Full response text."""
+        return "".join(c["content"] for c in self.chunks)
+
+    @property
+    def tool_calls(self) -> List[Dict[str, Any]]:
+        """All tool calls, in order."""
+        return [tc for c in self.chunks for tc in c["tool_calls"]]
+
+    @property
+    def size(self) -> int:
+        """Approximate memory footprint in bytes."""
+        return len(json.dumps(self.chunks, ensure_ascii=False, default=str))
+
+
+def make_response_key(
+    model: str,
+    options: Dict[str, Any],
+    messages: List[Dict[str, Any]],
+    tools: Optional[List[Dict[str, Any]]],
+) -> str:
+    """Hash an LLM request into a cache key.
+
+    Args:
+        model: Model name.
+        options: Generation options that affect the output.
+        messages: Chat messages.
+        tools: Tools in Ollama format.
+
+    Returns:
+        Hex digest.
+    """
+    request = {
+        "model": model,
+        "options": options,
+        "messages": [
+            {k: m[k] for k in MESSAGE_FIELDS if m.get(k) not in (None, "", [])}
+            for m in messages
+        ],
+        "tools": tools or [],
+    }
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier LRU cache of LLM responses: memory, backed by JSON files.
+
+    Entries evicted from memory stay on disk and are promoted back on a
+    hit. The disk tier is bounded by total size, oldest files first.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """Initialize response cache.
+
+        Args:
+            max_entries: Maximum entries in memory. Defaults to settings value.
+            max_bytes: Maximum memory size. Defaults to settings value.
+            disk_dir: Directory of the disk tier, empty to disable.
+                Defaults to settings value.
+            disk_max_bytes: Maximum disk size. Defaults to settings value.
+            ttl_seconds: Entry lifetime, 0 for no expiry. Defaults to
+                settings value.
+        """
+        config = settings.llm_cache
+        self.max_entries = config.max_entries if max_entries is None else max_entries
+        self.max_bytes = config.max_bytes if max_bytes is None else max_bytes
+        disk_dir = config.disk_dir if disk_dir is None else disk_dir
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = config.disk_max_bytes if disk_max_bytes is None else disk_max_bytes
+        self.ttl = config.ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_disk()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a response, promoting disk entries to memory.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached response, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if not self._expired(entry):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self._remove(key)
+
+        entry = self._read(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._store(key, entry)
+        self.hits += 1
+        self.disk_hits += 1
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store a response in both tiers.
+
+        Args:
+            key: Cache key.
+            entry: Response to store.
+        """
+        self._store(key, entry)
+        self._write(key, entry)
+
+    def clear(self) -> None:
+        """Drop all cached responses, on disk too."""
+        self._entries.clear()
+        self._bytes = 0
+        if self.disk_dir:
+            for path in self.disk_dir.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict of counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    def _expired(self, entry: CachedResponse) -> bool:
+        return self.ttl > 0 and entry.created_at + self.ttl <= time.time()
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        size = entry.size
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        """Remove a memory entry and release its size."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _path(self, key: str) -> Optional[Path]:
+        """Get the disk path of a key (sharded by prefix)."""
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[CachedResponse]:
+        """Load an entry from disk, dropping it if expired or unreadable."""
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            entry = CachedResponse(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Dropping unreadable LLM cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        if self._expired(entry):
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # Disk tier is pruned by last use
+        return entry
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        """Persist an entry, pruning the disk tier from time to time."""
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(asdict(entry), ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to persist LLM cache entry: {e}")
+            return
+        self._writes += 1
+        if self._writes % PRUNE_EVERY == 0:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete files unused for the TTL, then the least recently used beyond the size cap."""
+        files = []
+        now = time.time()
+        for path in self.disk_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if self.ttl > 0 and stat.st_mtime + self.ttl <= now:
+                path.unlink(missing_ok=True)
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -5,6 +5,15 @@ from typing import Any, Dict, List
 from app.api.schemas.mcp import ToolInfo
 
 
+def _canonical(value: Any) -> Any:
+    """Recursively sort dict keys so equal schemas serialize identically."""
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    return value
+
+
 def mcp_tools_to_ollama_format(tools: List[ToolInfo]) -> List[Dict[str, Any]]:
     """Convert MCP tool definitions to Ollama tool format.
 
@@ -18,6 +27,11 @@ def mcp_tools_to_ollama_format(tools: List[ToolInfo]) -> List[Dict[str, Any]]:
         }
     }
 
+    Tools are sorted by name and their schemas canonicalized, so the
+    serialized prompt prefix is byte-identical across requests (whatever
+    order servers registered their tools in) and Ollama's prompt cache
+    can reuse it.
+
     Args:
         tools: List of MCP tools.
 
@@ -25,16 +39,16 @@ def mcp_tools_to_ollama_format(tools: List[ToolInfo]) -> List[Dict[str, Any]]:
         List of tools in Ollama format.
     """
     ollama_tools = []
-    for tool in tools:
+    for tool in sorted(tools, key=lambda t: t.name):
         ollama_tool = {
             "type": "function",
             "function": {
                 "name": tool.name,
-                "description": tool.description,
-                "parameters": tool.input_schema or {
+                "description": (tool.description or "").strip(),
+                "parameters": _canonical(tool.input_schema or {
                     "type": "object",
                     "properties": {},
-                },
+                }),
             },
         }
         ollama_tools.append(ollama_tool)
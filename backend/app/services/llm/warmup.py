@@ -0,0 +1,123 @@
+"""Background model warmup and keep-alive refresh."""
+
+import asyncio
+import logging
+import math
+import time
+from typing import List, Optional
+
+from app.config import settings
+from app.services.llm.admission import PRIORITY_BACKGROUND
+from app.services.llm.ollama_client import OllamaClient
+from app.services.llm.pool import OllamaEndpoint, normalize_model
+
+logger = logging.getLogger(__name__)
+
+
+class ModelWarmer:
+    """Keeps the warm models loaded on every Ollama endpoint.
+
+    Models are preloaded at startup so the first chat does not pay the
+    load time, then their keep_alive is refreshed on endpoints where no
+    request used them for a refresh interval (requests refresh it
+    themselves). Models are (re)loaded with the smallest context window,
+    so a window grown by a long conversation shrinks back while idle.
+    Loads go through admission control behind user requests.
+    """
+
+    def __init__(
+        self,
+        ollama_client: OllamaClient,
+        interval: Optional[float] = None,
+    ):
+        """Initialize model warmer.
+
+        Args:
+            ollama_client: Ollama client instance.
+            interval: Seconds between refreshes. Defaults to settings value.
+        """
+        self.llm = ollama_client
+        self.interval = (
+            settings.ollama.keep_alive_refresh_interval if interval is None else interval
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def models(self) -> List[str]:
+        """Models to keep loaded."""
+        names = [settings.ollama.default_model, *settings.ollama.warm_models]
+        return list(dict.fromkeys(normalize_model(name) for name in names))
+
+    async def start(self) -> None:
+        """Start the background warmup loop."""
+        if self._task is None and (settings.ollama.warmup_on_startup or self.interval > 0):
+            self._task = asyncio.create_task(self._run(), name="model-warmer")
+            logger.info(f"Model warmer started for {', '.join(self.models)}")
+
+    async def stop(self) -> None:
+        """Stop the background warmup loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Warm up once, then refresh at the configured interval."""
+        if settings.ollama.warmup_on_startup:
+            await self.warm(force=True)
+        if self.interval <= 0:
+            return
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.warm()
+            except Exception as e:
+                logger.error(f"Model keep-alive refresh failed: {e}")
+
+    async def warm(self, force: bool = False) -> int:
+        """Load the warm models on every live endpoint that has them.
+
+        Args:
+            force: Load even where a request used the model recently.
+
+        Returns:
+            Number of successful loads.
+        """
+        now = time.monotonic()
+        loads = []
+        for endpoint in self.llm.pool.endpoints:
+            if endpoint.ejected:
+                continue
+            for model in self.models:
+                if not endpoint.serves(model):
+                    continue
+                if not force and now - endpoint.last_used.get(model, -math.inf) < self.interval:
+                    continue
+                loads.append(self._load(endpoint, model))
+        results = await asyncio.gather(*loads)
+        return sum(results)
+
+    async def _load(self, endpoint: OllamaEndpoint, model: str) -> bool:
+        """Load a model on an endpoint with an empty generate request."""
+        num_ctx = self.llm.num_ctx_buckets[0]
+        try:
+            async with self.llm.admission.slot(model, "model-warmer", PRIORITY_BACKGROUND):
+                start = time.monotonic()
+                await endpoint.client.generate(
+                    model=model,
+                    options={"num_ctx": num_ctx},
+                    keep_alive=settings.ollama.keep_alive,
+                )
+        except Exception as e:
+            logger.warning(f"Warming {model} on {endpoint.url} failed: {e}")
+            return False
+        endpoint.last_used[model] = time.monotonic()
+        endpoint.num_ctx[model] = num_ctx
+        logger.info(
+            f"Model {model} loaded on {endpoint.url} "
+            f"in {int((time.monotonic() - start) * 1000)} ms"
+        )
+        return True
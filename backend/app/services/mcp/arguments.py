@@ -0,0 +1,270 @@
+"""Validation and safe coercion of tool arguments against their inputSchema.
+
+Schemas are compiled once into nested checker functions, which are cached
+in the tool registry. Only the JSON Schema subset used by tool definitions
+is interpreted (type, anyOf/oneOf, properties, required,
+additionalProperties, items, enum, minimum/maximum); other keywords are
+ignored. A value that already has one of the allowed types is kept as is;
+coercion is only a fallback.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A checker returns the (possibly coerced) value and appends to errors
+Checker = Callable[[Any, str, List[str]], Any]
+
+_INT_RE = re.compile(r"^[+-]?\d+$")
+_TRUE = {"true", "1", "yes", "oui"}
+_FALSE = {"false", "0", "no", "non"}
+
+
+class _Invalid(Exception):
+    """Internal signal that a value cannot be coerced to a type."""
+
+
+def _describe(value: Any) -> str:
+    """Short repr of a value for error messages."""
+    text = json.dumps(value, default=str, ensure_ascii=False)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+def _coerce_integer(value: Any) -> int:
+    if isinstance(value, bool):
+        raise _Invalid
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INT_RE.match(value.strip()):
+        return int(value.strip())
+    raise _Invalid
+
+
+def _coerce_number(value: Any) -> float:
+    if isinstance(value, bool):
+        raise _Invalid
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise _Invalid
+
+
+def _coerce_string(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise _Invalid
+
+
+def _coerce_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise _Invalid
+
+
+def _coerce_null(value: Any) -> None:
+    if value is None:
+        return None
+    raise _Invalid
+
+
+def _coerce_json(expected: type) -> Callable[[Any], Any]:
+    """Accept a value of `expected` type, or a JSON string encoding one."""
+
+    def coerce(value: Any) -> Any:
+        if isinstance(value, expected):
+            return value
+        if isinstance(value, str):
+            try:
+                parsed = json.loads(value)
+            except ValueError:
+                raise _Invalid
+            if isinstance(parsed, expected):
+                return parsed
+        raise _Invalid
+
+    return coerce
+
+
+_SCALARS: Dict[str, Callable[[Any], Any]] = {
+    "integer": _coerce_integer,
+    "number": _coerce_number,
+    "string": _coerce_string,
+    "boolean": _coerce_boolean,
+    "null": _coerce_null,
+    "object": _coerce_json(dict),
+    "array": _coerce_json(list),
+}
+
+
+# Exact type tests, tried before any coercion
+_MATCHES: Dict[str, Callable[[Any], bool]] = {
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+}
+
+
+def _matches(value: Any, types: List[str]) -> bool:
+    """Whether a value already has one of the given types (any if none)."""
+    return not types or any(_MATCHES[t](value) for t in types if t in _MATCHES)
+
+
+def _types_of(schema: Any) -> List[str]:
+    """Get the declared types of a schema node as a list."""
+    if not isinstance(schema, dict):
+        return []
+    types = schema.get("type")
+    if isinstance(types, str):
+        return [types]
+    return list(types or [])
+
+
+def _compile(schema: Dict[str, Any]) -> Checker:
+    """Compile a schema node into a checker function."""
+    if not isinstance(schema, dict):
+        return lambda value, path, errors: value
+
+    coercers = [(t, _SCALARS[t]) for t in _types_of(schema) if t in _SCALARS]
+    variants = [
+        (_types_of(sub), _compile(sub))
+        for sub in (schema.get("anyOf") or schema.get("oneOf") or [])
+        if isinstance(sub, dict)
+    ]
+
+    properties = {
+        name: _compile(sub) for name, sub in (schema.get("properties") or {}).items()
+    }
+    nullable = {
+        name for name, sub in (schema.get("properties") or {}).items()
+        if "null" in _types_of(sub)
+    }
+    required = list(schema.get("required") or [])
+    closed = schema.get("additionalProperties") is False
+    items = _compile(schema["items"]) if isinstance(schema.get("items"), dict) else None
+    enum = schema.get("enum")
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+
+    def check(value: Any, path: str, errors: List[str]) -> Any:
+        label = path or "arguments"
+
+        if coercers and not _matches(value, [t for t, _ in coercers]):
+            for _, coerce in coercers:
+                try:
+                    value = coerce(value)
+                    break
+                except _Invalid:
+                    continue
+            else:
+                expected = " or ".join(t for t, _ in coercers)
+                errors.append(f"{label}: expected {expected}, got {_describe(value)}")
+                return value
+
+        if variants:
+            # Variants the value already matches first, then coercing ones
+            ordered = [v for v in variants if _matches(value, v[0])]
+            ordered += [v for v in variants if v not in ordered]
+            first_errors: Optional[List[str]] = None
+            for _, variant in ordered:
+                variant_errors: List[str] = []
+                result = variant(value, path, variant_errors)
+                if not variant_errors:
+                    value = result
+                    break
+                if first_errors is None:
+                    first_errors = variant_errors
+            else:
+                errors.extend(first_errors or [])
+                return value
+
+        if isinstance(value, dict) and (properties or required or closed):
+            result = {}
+            for key, item in value.items():
+                child = f"{path}.{key}" if path else key
+                if key in properties:
+                    # LLMs often send null for optional arguments: drop them
+                    if item is None and key not in required and key not in nullable:
+                        continue
+                    result[key] = properties[key](item, child, errors)
+                elif closed:
+                    errors.append(f"{child}: unexpected argument")
+                else:
+                    result[key] = item
+            for key in required:
+                if key not in result:
+                    child = f"{path}.{key}" if path else key
+                    errors.append(f"{child}: missing required argument")
+            value = result
+
+        if isinstance(value, list) and items is not None:
+            value = [items(item, f"{label}[{i}]", errors) for i, item in enumerate(value)]
+
+        if enum is not None and value not in enum:
+            match = None
+            if isinstance(value, str):
+                match = next(
+                    (e for e in enum if isinstance(e, str) and e.lower() == value.lower()),
+                    None,
+                )
+            if match is None:
+                allowed = ", ".join(_describe(e) for e in enum)
+                errors.append(f"{label}: {_describe(value)} is not one of {allowed}")
+            else:
+                value = match
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if minimum is not None and value < minimum:
+                errors.append(f"{label}: {value} is below the minimum {minimum}")
+            if maximum is not None and value > maximum:
+                errors.append(f"{label}: {value} is above the maximum {maximum}")
+
+        return value
+
+    return check
+
+
+class ArgumentValidator:
+    """Compiled validator for a tool's inputSchema."""
+
+    def __init__(self, schema: Optional[Dict[str, Any]]):
+        """Compile a validator.
+
+        Args:
+            schema: Tool inputSchema.
+        """
+        schema = dict(schema or {})
+        schema.setdefault("type", "object")
+        self._check = _compile(schema)
+
+    def __call__(self, arguments: Any) -> Tuple[Dict[str, Any], List[str]]:
+        """Validate and coerce arguments.
+
+        Args:
+            arguments: Arguments sent by the LLM.
+
+        Returns:
+            Tuple of (coerced arguments, error messages).
+        """
+        errors: List[str] = []
+        value = self._check({} if arguments is None else arguments, "", errors)
+        return (value if isinstance(value, dict) else {}), errors
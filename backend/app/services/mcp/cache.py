@@ -0,0 +1,198 @@
+"""Tool result cache for deterministic MCP tools."""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from mcp.types import CallToolResult
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass
+class CacheEntry:
+    """A cached tool result."""
+
+    result: CallToolResult
+    preview: str
+    size: int
+    expires_at: float
+
+
+def make_cache_key(server_name: str, tool_name: str, arguments: Dict[str, Any]) -> CacheKey:
+    """Build a cache key from a tool call.
+
+    Arguments are serialized as canonical JSON so that key order and
+    whitespace do not produce distinct entries.
+
+    Args:
+        server_name: MCP server name.
+        tool_name: Tool name.
+        arguments: Tool arguments.
+
+    Returns:
+        Hashable cache key.
+    """
+    canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+    return (server_name, tool_name, canonical)
+
+
+def is_error_result(result: CallToolResult) -> bool:
+    """Check whether a tool result reports a failure.
+
+    Some servers report failures in the payload (`{"error": ...}`) rather
+    than with isError.
+
+    Args:
+        result: MCP call result.
+
+    Returns:
+        True if the call failed.
+    """
+    if result.isError:
+        return True
+    for content in result.content:
+        text = getattr(content, "text", "").lstrip()
+        if not text.startswith("{"):
+            continue
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            continue
+        if isinstance(payload, dict) and payload.get("error"):
+            return True
+    return False
+
+
+class ToolResultCache:
+    """LRU cache of tool results with per-entry TTL and a memory cap.
+
+    Only tools with a TTL declared in the server config are cached.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 32 * 1024 * 1024):
+        """Initialize tool result cache.
+
+        Args:
+            max_entries: Maximum number of cached results.
+            max_bytes: Maximum total size of cached result text.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cache entry or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: CacheKey, result: CallToolResult, preview: str, ttl: float) -> None:
+        """Store a tool result.
+
+        Args:
+            key: Cache key.
+            result: MCP call result.
+            preview: Text preview of the result.
+            ttl: Time to live in seconds.
+        """
+        if is_error_result(result):
+            return
+
+        size = self._result_size(result)
+        if size > self.max_bytes:
+            logger.debug(f"Tool result too large to cache: {key[0]}/{key[1]} ({size} bytes)")
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(
+            result=result,
+            preview=preview,
+            size=size,
+            expires_at=time.monotonic() + ttl,
+        )
+        self._bytes += size
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def invalidate_server(self, server_name: str) -> int:
+        """Drop all cached results from a server.
+
+        Args:
+            server_name: MCP server name.
+
+        Returns:
+            Number of entries removed.
+        """
+        keys = [k for k in self._entries if k[0] == server_name]
+        for key in keys:
+            self._remove(key)
+        if keys:
+            logger.info(f"Invalidated {len(keys)} cached results for '{server_name}'")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict of counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry and release its size."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    @staticmethod
+    def _result_size(result: CallToolResult) -> int:
+        """Approximate the memory footprint of a result by its text length."""
+        size = 0
+        for content in result.content:
+            text = getattr(content, "text", None)
+            if text is not None:
+                size += len(text)
+            else:
+                size += len(content.model_dump_json())
+        return size
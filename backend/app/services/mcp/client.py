@@ -2,19 +2,93 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
 
+import anyio
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from mcp.types import Tool, CallToolResult
+from mcp.shared.exceptions import McpError
+from mcp.shared.message import SessionMessage
+from mcp.types import (
+    CONNECTION_CLOSED,
+    CallToolResult,
+    CancelledNotification,
+    CancelledNotificationParams,
+    ClientNotification,
+    JSONRPCRequest,
+    RequestId,
+    ServerNotification,
+    Tool,
+    ToolListChangedNotification,
+)
 
-from app.config import MCPServerConfig
+from app.config import settings, MCPServerConfig
+from app.services.mcp.inprocess import inprocess_client, load_server
+from app.services.mcp.resilience import CircuitBreaker, ConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
+# Id of the last request the current task sent on a session
+_sent_request_id: ContextVar[Optional[RequestId]] = ContextVar("mcp_sent_request_id", default=None)
+
+
+class RequestIdTracker:
+    """Session write stream wrapper recording the id of each request sent.
+
+    The SDK assigns request ids internally and does not tell the server
+    when a request is abandoned. Seeing the ids at the transport boundary
+    lets the caller cancel exactly the request it sent.
+    """
+
+    def __init__(self, stream: Any):
+        """Initialize tracker.
+
+        Args:
+            stream: Transport write stream.
+        """
+        self._stream = stream
+
+    async def send(self, message: SessionMessage) -> None:
+        """Forward a message, recording request ids for the sending task."""
+        root = getattr(message.message, "root", None)
+        if isinstance(root, JSONRPCRequest):
+            _sent_request_id.set(root.id)
+        await self._stream.send(message)
+
+    async def __aenter__(self) -> "RequestIdTracker":
+        await self._stream.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> Optional[bool]:
+        return await self._stream.__aexit__(*exc_info)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """Check whether an exception means the session transport is gone.
+
+    Args:
+        exc: Exception raised by a session call.
+
+    Returns:
+        True if the server died or the streams were closed.
+    """
+    if isinstance(exc, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)):
+        return True
+    return isinstance(exc, McpError) and exc.error.code == CONNECTION_CLOSED
+
 
 class MCPClient:
-    """Wrapper for a single MCP server connection."""
+    """Wrapper for a single MCP server connection.
+
+    The session is owned by a supervisor task that detects a dead server
+    (failed call or missed heartbeat) and respawns it with exponential backoff.
+    Lazy servers are spawned on their first call and stopped after being idle.
+    """
 
     def __init__(self, config: MCPServerConfig):
         """Initialize MCP client.
@@ -24,64 +98,327 @@ class MCPClient:
         """
         self.config = config
         self._session: Optional[ClientSession] = None
-        self._read_stream = None
-        self._write_stream = None
-        self._context = None
+        self._runner: Optional[asyncio.Task] = None
+        self._session_ready = asyncio.Event()
+        self._lost = asyncio.Event()
+        self._closing = False
+        self._start_lock = asyncio.Lock()
         self.is_connected = False
+        self.reconnect_count = 0
         self._tools: List[Tool] = []
 
+        self.lazy = config.lazy if config.lazy is not None else settings.mcp.lazy_start
+        self.idle_timeout = config.idle_timeout or settings.mcp.idle_timeout
+        self._last_used = 0.0
+
+        self.limiter = ConcurrencyLimiter(
+            name=config.name,
+            max_in_flight=config.max_concurrency or settings.mcp.max_concurrent_calls,
+            queue_timeout=config.queue_timeout or settings.mcp.queue_timeout,
+        )
+        self.breaker = CircuitBreaker(
+            name=config.name,
+            failure_threshold=settings.mcp.breaker_failure_threshold,
+            reset_timeout=settings.mcp.breaker_reset_timeout,
+        )
+
+        # Called after the server has been (lazily) started
+        self.on_start: Optional[Callable[["MCPClient"], Awaitable[None]]] = None
+        # Called after the server has been respawned and its tools refreshed
+        self.on_reconnect: Optional[Callable[["MCPClient"], Awaitable[None]]] = None
+        # Called after a tools/list_changed notification refreshed the tools
+        self.on_tools_changed: Optional[Callable[["MCPClient"], Awaitable[None]]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._notify_tasks: Set[asyncio.Task] = set()
+
     @property
     def name(self) -> str:
         """Server name."""
         return self.config.name
 
-    async def connect(self) -> None:
-        """Establish connection to MCP server."""
-        try:
-            if self.config.transport == "stdio":
-                if not self.config.command:
-                    raise ValueError(f"No command specified for stdio transport: {self.name}")
+    @property
+    def state(self) -> str:
+        """Connection state: connected, idle (lazy, not running) or disconnected."""
+        if self.is_connected:
+            return "connected"
+        if self.lazy and not self._closing and (self._runner is None or self._runner.done()):
+            return "idle"
+        return "disconnected"
 
-                params = StdioServerParameters(
-                    command=self.config.command,
-                    args=self.config.args,
-                )
-                self._context = stdio_client(params)
-                self._read_stream, self._write_stream = await self._context.__aenter__()
-            else:
-                # HTTP transport - for future implementation
-                raise NotImplementedError(f"HTTP transport not yet implemented for {self.name}")
+    def preload_tools(self, tools: List[Tool]) -> None:
+        """Seed the tool list without spawning the server.
+
+        Args:
+            tools: Tool schemas from a previous session.
+        """
+        self._tools = list(tools)
 
-            self._session = ClientSession(self._read_stream, self._write_stream)
-            await self._session.__aenter__()
-            await self._session.initialize()
-            self.is_connected = True
+    async def connect(self) -> None:
+        """Establish connection to MCP server.
 
-            # Cache tools
-            result = await self._session.list_tools()
-            self._tools = result.tools
+        Raises if the first connection attempt fails; later crashes are
+        recovered in the background.
+        """
+        self._closing = False
+        self._last_used = asyncio.get_running_loop().time()
+        first_attempt = asyncio.get_running_loop().create_future()
+        self._runner = asyncio.create_task(self._run(first_attempt), name=f"mcp-{self.name}")
 
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(first_attempt),
+                timeout=settings.mcp.connection_timeout,
+            )
             logger.info(f"Connected to MCP server '{self.name}' with {len(self._tools)} tools")
-
         except Exception as e:
             logger.error(f"Failed to connect to MCP server '{self.name}': {e}")
-            self.is_connected = False
+            await self._stop_runner()
             raise
 
+        if self.on_start:
+            try:
+                await self.on_start(self)
+            except Exception as e:
+                logger.error(f"Start hook failed for '{self.name}': {e}")
+
     async def disconnect(self) -> None:
-        """Close connection."""
+        """Close connection and stop the supervisor."""
+        self._closing = True
+        await self._stop_runner()
+        logger.info(f"Disconnected from MCP server '{self.name}'")
+
+    async def _stop_runner(self) -> None:
+        """Stop the supervisor task, closing the session and server."""
+        self._lost.set()
         try:
-            if self._session:
-                await self._session.__aexit__(None, None, None)
-            if self._context:
-                await self._context.__aexit__(None, None, None)
+            if self._runner and not self._runner.done():
+                self._runner.cancel()
+                try:
+                    await self._runner
+                except asyncio.CancelledError:
+                    pass
         except Exception as e:
             logger.warning(f"Error disconnecting from '{self.name}': {e}")
         finally:
+            self._runner = None
+            self._mark_disconnected()
+
+    @asynccontextmanager
+    async def _open_session(self) -> AsyncIterator[ClientSession]:
+        """Spawn the server and open an initialized session."""
+        if self.config.transport == "stdio":
+            if not self.config.command:
+                raise ValueError(f"No command specified for stdio transport: {self.name}")
+
+            params = StdioServerParameters(
+                command=self.config.command,
+                args=self.config.args,
+            )
+            transport = stdio_client(params)
+        elif self.config.transport == "inprocess":
+            if not self.config.module:
+                raise ValueError(f"No module specified for inprocess transport: {self.name}")
+            transport = inprocess_client(load_server(self.config.module))
+        else:
+            # HTTP transport - for future implementation
+            raise NotImplementedError(f"HTTP transport not yet implemented for {self.name}")
+
+        async with transport as (read_stream, write_stream):
+            async with ClientSession(
+                read_stream,
+                RequestIdTracker(write_stream),
+                message_handler=self._handle_message,
+            ) as session:
+                await session.initialize()
+                yield session
+
+    async def _handle_message(self, message: Any) -> None:
+        """Handle incoming server messages.
+
+        A tools/list_changed notification schedules a tool refresh. The
+        refresh runs in its own task: awaiting a request from inside the
+        session's receive loop would deadlock.
+
+        Args:
+            message: Request responder, notification or exception.
+        """
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ToolListChangedNotification
+        ):
+            session = self._session
+            if session is None:
+                return
+            if self._refresh_task and not self._refresh_task.done():
+                self._refresh_task.cancel()
+            self._refresh_task = asyncio.create_task(self._refresh_tools(session))
+
+    async def _refresh_tools(self, session: ClientSession) -> None:
+        """Re-fetch the tool list after a list_changed notification.
+
+        Args:
+            session: Session that sent the notification.
+        """
+        try:
+            result = await session.list_tools()
+        except Exception as e:
+            logger.warning(f"Failed to refresh tools of '{self.name}': {e}")
+            return
+        if session is not self._session:
+            return
+
+        self._tools = result.tools
+        if self.on_tools_changed:
+            try:
+                await self.on_tools_changed(self)
+            except Exception as e:
+                logger.error(f"Tools-changed hook failed for '{self.name}': {e}")
+
+    async def _run(self, first_attempt: asyncio.Future) -> None:
+        """Supervise the session, respawning the server when it dies.
+
+        Args:
+            first_attempt: Resolved once the initial connection succeeds or fails.
+        """
+        loop = asyncio.get_running_loop()
+        attempt = 0
+
+        while not self._closing:
+            started_at = loop.time()
+            try:
+                async with self._open_session() as session:
+                    # Cache tools
+                    result = await session.list_tools()
+                    self._tools = result.tools
+
+                    self._session = session
+                    self._lost.clear()
+                    self.is_connected = True
+                    self._session_ready.set()
+
+                    if not first_attempt.done():
+                        first_attempt.set_result(None)
+                    else:
+                        self.reconnect_count += 1
+                        logger.info(
+                            f"Reconnected to MCP server '{self.name}' "
+                            f"with {len(self._tools)} tools"
+                        )
+                        if self.on_reconnect:
+                            try:
+                                await self.on_reconnect(self)
+                            except Exception as e:
+                                logger.error(f"Reconnect hook failed for '{self.name}': {e}")
+
+                    if await self._monitor(session) == "idle":
+                        return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not first_attempt.done():
+                    first_attempt.set_exception(e)
+                    return
+                logger.warning(f"MCP server '{self.name}' session error: {e}")
+            finally:
+                self._mark_disconnected()
+
+            if self._closing:
+                return
+
+            # Respawn immediately after a crash, then back off exponentially.
+            # The backoff only resets once a session has proven stable.
+            if loop.time() - started_at > settings.mcp.reconnect_max_delay:
+                attempt = 0
+            delay = 0.0
+            if attempt > 0:
+                delay = min(
+                    settings.mcp.reconnect_initial_delay * (2 ** (attempt - 1)),
+                    settings.mcp.reconnect_max_delay,
+                )
+            attempt += 1
+            logger.warning(f"MCP server '{self.name}' connection lost, respawning in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def _monitor(self, session: ClientSession) -> str:
+        """Wait until the session is lost, misses a heartbeat or goes idle.
+
+        Args:
+            session: Active session.
+
+        Returns:
+            "lost" if the server must be respawned, "idle" if a lazy server
+            should stop until its next call.
+        """
+        loop = asyncio.get_running_loop()
+        interval = settings.mcp.heartbeat_interval
+        if self.lazy:
+            interval = min(interval, self.idle_timeout)
+
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._lost.wait(), timeout=interval)
+                return "lost"
+            except asyncio.TimeoutError:
+                pass
+
+            if (
+                self.lazy
+                and self.limiter.in_flight == 0
+                and loop.time() - self._last_used >= self.idle_timeout
+            ):
+                logger.info(f"MCP server '{self.name}' idle for {self.idle_timeout:.0f}s, stopping")
+                return "idle"
+
+            try:
+                await asyncio.wait_for(session.send_ping(), timeout=settings.mcp.heartbeat_timeout)
+            except Exception as e:
+                logger.warning(f"MCP server '{self.name}' missed heartbeat: {e}")
+                return "lost"
+        return "lost"
+
+    def _mark_disconnected(self) -> None:
+        """Reset session state after the session ended."""
+        self.is_connected = False
+        self._session = None
+        self._session_ready.clear()
+
+    def _signal_lost(self, session: ClientSession) -> None:
+        """Report a dead session to the supervisor.
+
+        Args:
+            session: Session that failed. Ignored if already replaced.
+        """
+        if session is self._session:
             self.is_connected = False
-            self._session = None
-            self._context = None
-            logger.info(f"Disconnected from MCP server '{self.name}'")
+            self._session_ready.clear()
+            self._lost.set()
+
+    async def _get_session(self) -> ClientSession:
+        """Get the live session, waiting for a pending respawn if needed."""
+        if self._session is not None and self._session_ready.is_set():
+            return self._session
+
+        if self._closing:
+            raise RuntimeError(f"Not connected to '{self.name}'")
+
+        if self._runner is None or self._runner.done():
+            if not self.lazy:
+                raise RuntimeError(f"Not connected to '{self.name}'")
+            async with self._start_lock:
+                if self._runner is None or self._runner.done():
+                    logger.info(f"Starting lazy MCP server '{self.name}' on demand")
+                    await self.connect()
+
+        try:
+            await asyncio.wait_for(
+                self._session_ready.wait(),
+                timeout=settings.mcp.connection_timeout,
+            )
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"MCP server '{self.name}' did not recover in time")
+
+        if self._session is None:
+            raise RuntimeError(f"Not connected to '{self.name}'")
+        return self._session
 
     async def list_tools(self) -> List[Tool]:
         """Get available tools from this server.
@@ -89,13 +426,17 @@ class MCPClient:
         Returns:
             List of available tools.
         """
-        if not self._session:
+        if not self._session and not self._tools:
             raise RuntimeError(f"Not connected to '{self.name}'")
         return self._tools
 
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
         """Execute a tool on this server.
 
+        Calls are bounded by the server's concurrency limiter and rejected
+        immediately while its circuit breaker is open. A call that fails
+        because the server died is replayed once on the respawned session.
+
         Args:
             name: Tool name.
             arguments: Tool arguments.
@@ -103,22 +444,100 @@ class MCPClient:
         Returns:
             Tool execution result.
         """
-        if not self._session:
-            raise RuntimeError(f"Not connected to '{self.name}'")
-        return await self._session.call_tool(name, arguments=arguments)
+        async with self.breaker.guard():
+            async with self.limiter.slot():
+                try:
+                    return await self._call_with_replay(name, arguments)
+                finally:
+                    self._last_used = asyncio.get_running_loop().time()
+
+    async def _call_with_replay(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Call a tool, replaying it once if the server dies mid-flight."""
+        session = await self._get_session()
+        try:
+            return await self._session_call(session, name, arguments)
+        except Exception as e:
+            if not is_connection_error(e):
+                raise
+            logger.warning(f"MCP server '{self.name}' died during '{name}', replaying after respawn")
+            self._signal_lost(session)
+
+        session = await self._get_session()
+        return await self._session_call(session, name, arguments)
+
+    async def _session_call(
+        self,
+        session: ClientSession,
+        name: str,
+        arguments: Dict[str, Any],
+    ) -> CallToolResult:
+        """Call a tool, telling the server to stop if the call is cancelled."""
+        token = _sent_request_id.set(None)
+        try:
+            return await session.call_tool(name, arguments=arguments)
+        except asyncio.CancelledError:
+            request_id = _sent_request_id.get()
+            if request_id is not None:
+                self._notify_cancelled(session, request_id, name)
+            raise
+        finally:
+            _sent_request_id.reset(token)
+
+    def _notify_cancelled(self, session: ClientSession, request_id: RequestId, name: str) -> None:
+        """Send a cancellation notification for an abandoned request.
+
+        Runs in its own task since the calling task is being cancelled.
+        """
+
+        async def notify() -> None:
+            try:
+                await session.send_notification(
+                    ClientNotification(
+                        CancelledNotification(
+                            method="notifications/cancelled",
+                            params=CancelledNotificationParams(
+                                requestId=request_id,
+                                reason="Client cancelled the request",
+                            ),
+                        )
+                    )
+                )
+                logger.info(f"Cancelled '{name}' on MCP server '{self.name}'")
+            except Exception as e:
+                logger.debug(f"Could not notify '{self.name}' of cancellation: {e}")
+
+        task = asyncio.create_task(notify())
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get concurrency and breaker metrics.
+
+        Returns:
+            Dict of metrics.
+        """
+        return {
+            **self.limiter.metrics(),
+            "circuit": self.breaker.metrics(),
+            "reconnects": self.reconnect_count,
+        }
 
     async def ping(self) -> int:
-        """Ping the server and return latency in ms.
+        """Ping the server with an MCP ping request and return latency in ms.
 
         Returns:
-            Latency in milliseconds.
+            Latency in milliseconds, -1 if unreachable.
         """
-        if not self._session:
+        session = self._session
+        if not session:
             return -1
 
-        start = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         try:
-            await self._session.list_tools()
-            return int((asyncio.get_event_loop().time() - start) * 1000)
-        except Exception:
+            await asyncio.wait_for(session.send_ping(), timeout=settings.health.probe_timeout)
+            return int((loop.time() - start) * 1000)
+        except Exception as e:
+            if is_connection_error(e):
+                self._signal_lost(session)
             return -1
@@ -0,0 +1,97 @@
+"""In-process MCP transport over memory streams.
+
+Runs a trusted server module's `server` object inside the API process and
+connects it to a client session through anyio memory streams, skipping the
+subprocess, pipes and JSON-RPC framing of the stdio transport.
+"""
+
+import importlib
+import importlib.util
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Any, AsyncIterator, Dict, Iterator, Tuple
+
+import anyio
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams
+
+logger = logging.getLogger(__name__)
+
+# Imported server modules, keyed by the configured module reference
+_modules: Dict[str, ModuleType] = {}
+
+
+@contextmanager
+def _host_logging() -> Iterator[None]:
+    """Keep a server module's import-time `logging.basicConfig` from
+    reconfiguring the API process's root logger."""
+    basic_config = logging.basicConfig
+    logging.basicConfig = lambda *args, **kwargs: None
+    try:
+        yield
+    finally:
+        logging.basicConfig = basic_config
+
+
+def load_server(module_ref: str) -> Server:
+    """Import a server module and return its `server` object.
+
+    Args:
+        module_ref: Dotted module name or path to a `.py` file.
+
+    Returns:
+        The module's MCP server.
+    """
+    module = _modules.get(module_ref)
+    if module is None:
+        if module_ref.endswith(".py"):
+            path = Path(module_ref)
+            if not path.exists():
+                raise FileNotFoundError(f"MCP server module not found: {module_ref}")
+            module_name = f"mcp_inprocess_{path.parent.name}_{path.stem}".replace("-", "_")
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load MCP server module: {module_ref}")
+            module = importlib.util.module_from_spec(spec)
+            with _host_logging():
+                spec.loader.exec_module(module)
+        else:
+            with _host_logging():
+                module = importlib.import_module(module_ref)
+        _modules[module_ref] = module
+        logger.info(f"Loaded in-process MCP server module '{module_ref}'")
+
+    server = getattr(module, "server", None)
+    if not isinstance(server, Server):
+        raise TypeError(f"Module '{module_ref}' has no MCP `server` object")
+    return server
+
+
+@asynccontextmanager
+async def inprocess_client(server: Server) -> AsyncIterator[Tuple[Any, Any]]:
+    """Run a server in a task and yield the client side of its streams.
+
+    Mirrors `stdio_client` so both transports feed the same `ClientSession`.
+
+    Args:
+        server: MCP server to run.
+
+    Yields:
+        (read_stream, write_stream) for the client session.
+    """
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        server_read, server_write = server_streams
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(
+                lambda: server.run(
+                    server_read,
+                    server_write,
+                    server.create_initialization_options(),
+                )
+            )
+            try:
+                yield client_streams
+            finally:
+                tg.cancel_scope.cancel()
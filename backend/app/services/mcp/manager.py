@@ -3,15 +3,20 @@
 import asyncio
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from mcp.types import Tool, CallToolResult
 
 from app.config import settings, MCPServerConfig
+from app.services.artifacts import ArtifactStore
+from app.services.mcp.arguments import ArgumentValidator
+from app.services.mcp.cache import ToolResultCache, is_error_result, make_cache_key
 from app.services.mcp.client import MCPClient
+from app.services.mcp.render import render_result
+from app.services.mcp.schema_cache import ToolSchemaStore
 from app.api.schemas.mcp import ToolInfo, ToolExecution, MCPServerInfo
 
 logger = logging.getLogger(__name__)
@@ -24,6 +29,11 @@ class AggregatedTool:
     tool: Tool
     server_name: str
     server_client: MCPClient
+    validator: ArgumentValidator = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Compile the argument validator once per registered tool."""
+        self.validator = ArgumentValidator(self.tool.inputSchema)
 
 
 class MCPManager:
@@ -33,12 +43,55 @@ class MCPManager:
     to the appropriate server.
     """
 
-    def __init__(self):
-        """Initialize MCP manager."""
+    def __init__(self, artifact_store: Optional[ArtifactStore] = None):
+        """Initialize MCP manager.
+
+        Args:
+            artifact_store: Store for full tool results. Created if not provided.
+        """
         self._clients: Dict[str, MCPClient] = {}
         self._tools_map: Dict[str, AggregatedTool] = {}
         self._enabled_servers: set = set()
+        self._tools_version = 0
+        self._server_tools: Dict[str, List[str]] = {}  # Tool names per server
+        self._server_versions: Dict[str, int] = {}  # Registry version of each server's tools
+        self._last_ping: Dict[str, int] = {}
+        self._schema_store = ToolSchemaStore(settings.mcp.tool_schema_cache_file)
         self._lock = asyncio.Lock()
+        self._config_path: Optional[str] = None
+        self._configs: Dict[str, MCPServerConfig] = {}
+        self._config_mtime: Optional[int] = None
+        self._reload_lock = asyncio.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._result_cache = ToolResultCache(
+            max_entries=settings.mcp.tool_cache_max_entries,
+            max_bytes=settings.mcp.tool_cache_max_bytes,
+        )
+        self.artifact_store = artifact_store or ArtifactStore()
+
+    @property
+    def tools_version(self) -> int:
+        """Counter bumped whenever the tool registry changes.
+
+        Lets callers memoize anything derived from the tool list.
+        """
+        return self._tools_version
+
+    def get_tools_version(self, servers: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        """Get the registry version of a subset of servers.
+
+        Only changes when the tools of one of these servers change, so caches
+        keyed on it are invalidated precisely.
+
+        Args:
+            servers: Server names.
+
+        Returns:
+            Sorted (server, version) pairs.
+        """
+        return tuple(
+            (name, self._server_versions.get(name, -1)) for name in sorted(servers)
+        )
 
     async def initialize(self, config_file: Optional[str] = None) -> None:
         """Initialize manager and connect to configured servers.
@@ -51,16 +104,90 @@ class MCPManager:
             logger.warning("No MCP config file specified, starting without servers")
             return
 
+        self._config_path = config_path
         try:
-            configs = self._load_config(config_path)
-            for config in configs:
-                if config.enabled:
-                    await self.register_server(config)
+            await self.reload_config()
         except FileNotFoundError:
             logger.warning(f"MCP config file not found: {config_path}")
         except Exception as e:
             logger.error(f"Error loading MCP config: {e}")
 
+        if settings.mcp.config_watch_interval > 0:
+            self._watch_task = asyncio.create_task(self._watch_config(), name="mcp-config-watcher")
+
+    async def reload_config(self) -> Dict[str, List[str]]:
+        """Reconcile registered servers with the config file.
+
+        Added servers are registered, removed or disabled ones deregistered
+        and changed ones restarted. Unchanged servers keep their session,
+        caches and runtime toggle state.
+
+        Returns:
+            Server names per outcome.
+        """
+        if not self._config_path:
+            raise RuntimeError("No MCP config file specified")
+
+        async with self._reload_lock:
+            self._config_mtime = self._stat_config()
+            desired = {
+                c.name: c for c in self._load_config(self._config_path) if c.enabled
+            }
+
+            summary: Dict[str, List[str]] = {
+                "added": [], "removed": [], "restarted": [], "unchanged": [], "failed": [],
+            }
+
+            for name in list(self._clients):
+                if name not in desired:
+                    await self.deregister_server(name)
+                    self._configs.pop(name, None)
+                    summary["removed"].append(name)
+
+            for name, config in desired.items():
+                current = self._configs.get(name)
+                if name in self._clients and current is not None:
+                    if current.model_dump() == config.model_dump():
+                        summary["unchanged"].append(name)
+                        continue
+                    await self.deregister_server(name)
+                    outcome = "restarted"
+                else:
+                    outcome = "added"
+
+                if await self.register_server(config):
+                    self._configs[name] = config
+                    summary[outcome].append(name)
+                else:
+                    self._configs.pop(name, None)
+                    summary["failed"].append(name)
+
+            changes = {k: v for k, v in summary.items() if v and k != "unchanged"}
+            if changes:
+                logger.info(f"MCP config reconciled: {changes}")
+            return summary
+
+    def _stat_config(self) -> Optional[int]:
+        """Get the config file modification time, None if missing."""
+        try:
+            return Path(self._config_path).stat().st_mtime_ns
+        except (OSError, TypeError):
+            return None
+
+    async def _watch_config(self) -> None:
+        """Poll the config file and reload it when it changes."""
+        while True:
+            await asyncio.sleep(settings.mcp.config_watch_interval)
+            mtime = self._stat_config()
+            if mtime is None or mtime == self._config_mtime:
+                continue
+            logger.info(f"MCP config file changed: {self._config_path}")
+            try:
+                await self.reload_config()
+            except Exception as e:
+                # Keep running servers on a broken edit; retry on next change
+                logger.error(f"Error reloading MCP config: {e}")
+
     def _load_config(self, config_path: str) -> List[MCPServerConfig]:
         """Load MCP server configurations from file.
 
@@ -83,6 +210,9 @@ class MCPManager:
     async def register_server(self, config: MCPServerConfig) -> bool:
         """Dynamically register a new MCP server.
 
+        Lazy servers with cached tool schemas are registered without being
+        spawned; they start on their first tool call.
+
         Args:
             config: Server configuration.
 
@@ -95,28 +225,111 @@ class MCPManager:
                 return False
 
             client = MCPClient(config)
+            client.on_start = self._on_server_started
+            client.on_reconnect = self._on_server_reconnected
+            client.on_tools_changed = self._on_tools_changed
             try:
-                await client.connect()
+                cached_tools = self._schema_store.load(config) if client.lazy else None
+                if cached_tools is not None:
+                    client.preload_tools(cached_tools)
+                else:
+                    await client.connect()
                 self._clients[config.name] = client
+                self._result_cache.invalidate_server(config.name)
                 self._enabled_servers.add(config.name)
 
                 # Aggregate tools
                 tools = await client.list_tools()
-                for tool in tools:
-                    # Use tool name as key (may conflict if same name across servers)
-                    self._tools_map[tool.name] = AggregatedTool(
-                        tool=tool,
-                        server_name=config.name,
-                        server_client=client,
-                    )
-
-                logger.info(f"Registered MCP server '{config.name}' with {len(tools)} tools")
+                self._index_tools(client, tools)
+
+                logger.info(
+                    f"Registered MCP server '{config.name}' with {len(tools)} tools"
+                    f"{' (lazy, not started)' if cached_tools is not None else ''}"
+                )
                 return True
 
             except Exception as e:
                 logger.error(f"Failed to register server '{config.name}': {e}")
                 return False
 
+    def _index_tools(self, client: MCPClient, tools: List[Tool]) -> None:
+        """Replace a server's entries in the tool registry.
+
+        Only this server's entries are touched.
+
+        Args:
+            client: Server client.
+            tools: Tools currently exposed by the server.
+        """
+        self._drop_tools(client.name)
+        for tool in tools:
+            # Use tool name as key (may conflict if same name across servers)
+            self._tools_map[tool.name] = AggregatedTool(
+                tool=tool,
+                server_name=client.name,
+                server_client=client,
+            )
+        self._server_tools[client.name] = [t.name for t in tools]
+        self._tools_version += 1
+        self._server_versions[client.name] = self._tools_version
+
+    def _drop_tools(self, server_name: str) -> None:
+        """Remove a server's entries from the tool registry.
+
+        Args:
+            server_name: Server name.
+        """
+        for tool_name in self._server_tools.pop(server_name, []):
+            agg = self._tools_map.get(tool_name)
+            if agg and agg.server_name == server_name:
+                del self._tools_map[tool_name]
+
+    async def _on_tools_changed(self, client: MCPClient) -> None:
+        """Re-index a server's tools after a list_changed notification.
+
+        Args:
+            client: Server client whose tools changed.
+        """
+        if self._clients.get(client.name) is not client:
+            return
+        tools = await client.list_tools()
+        self._schema_store.save(client.config, tools)
+        self._index_tools(client, tools)
+        logger.info(f"Tool list of '{client.name}' changed, now {len(tools)} tools")
+
+    async def _on_server_started(self, client: MCPClient) -> None:
+        """Persist tool schemas and pick up tool changes when a server starts.
+
+        Args:
+            client: Server client that was started.
+        """
+        tools = await client.list_tools()
+        self._schema_store.save(client.config, tools)
+        if self._clients.get(client.name) is not client:
+            return
+
+        registered = []
+        for name in self._server_tools.get(client.name, []):
+            agg = self._tools_map.get(name)
+            if agg and agg.server_name == client.name:
+                registered.append(agg.tool.model_dump())
+        if registered != [t.model_dump() for t in tools]:
+            logger.info(f"Tools of '{client.name}' changed since cached, refreshing registry")
+            self._index_tools(client, tools)
+
+    async def _on_server_reconnected(self, client: MCPClient) -> None:
+        """Refresh tools and drop stale results after a server respawn.
+
+        Args:
+            client: Server client that was respawned.
+        """
+        if self._clients.get(client.name) is not client:
+            return
+        tools = await client.list_tools()
+        self._schema_store.save(client.config, tools)
+        self._result_cache.invalidate_server(client.name)
+        self._index_tools(client, tools)
+
     async def deregister_server(self, name: str) -> bool:
         """Remove an MCP server.
 
@@ -133,12 +346,13 @@ class MCPManager:
             await self._clients[name].disconnect()
             del self._clients[name]
             self._enabled_servers.discard(name)
+            self._last_ping.pop(name, None)
+            self._result_cache.invalidate_server(name)
 
             # Remove tools from this server
-            self._tools_map = {
-                k: v for k, v in self._tools_map.items()
-                if v.server_name != name
-            }
+            self._drop_tools(name)
+            self._server_versions.pop(name, None)
+            self._tools_version += 1
 
             logger.info(f"Deregistered MCP server '{name}'")
             return True
@@ -164,19 +378,62 @@ class MCPManager:
         logger.info(f"Server '{name}' {'enabled' if enabled else 'disabled'}")
         return True
 
-    def get_all_tools(self, enabled_only: bool = True) -> List[ToolInfo]:
+    def get_tool_server(self, tool_name: str) -> Optional[str]:
+        """Get the server that provides a tool.
+
+        Args:
+            tool_name: Tool name.
+
+        Returns:
+            Server name, or None if the tool is unknown.
+        """
+        agg = self._tools_map.get(tool_name)
+        return agg.server_name if agg else None
+
+    def is_memoizable(self, tool_name: str) -> bool:
+        """Check whether a tool's results may be reused within a conversation.
+
+        Args:
+            tool_name: Tool name.
+
+        Returns:
+            False for unknown tools and tools listed in `memoize_exclude`.
+        """
+        agg = self._tools_map.get(tool_name)
+        if agg is None:
+            return False
+        return tool_name not in agg.server_client.config.memoize_exclude
+
+    def get_enabled_servers(self) -> FrozenSet[str]:
+        """Get the names of globally enabled servers.
+
+        Returns:
+            Frozen set of server names.
+        """
+        return frozenset(self._enabled_servers)
+
+    def get_all_tools(
+        self,
+        enabled_only: bool = True,
+        servers: Optional[Iterable[str]] = None,
+    ) -> List[ToolInfo]:
         """Get aggregated tool list for LLM.
 
         Args:
             enabled_only: Only include tools from enabled servers.
+            servers: Optional subset of servers to include. None = all.
 
         Returns:
             List of available tools.
         """
+        server_filter = set(servers) if servers is not None else None
+
         tools = []
         for agg in self._tools_map.values():
             if enabled_only and agg.server_name not in self._enabled_servers:
                 continue
+            if server_filter is not None and agg.server_name not in server_filter:
+                continue
 
             tools.append(ToolInfo(
                 name=agg.tool.name,
@@ -191,12 +448,14 @@ class MCPManager:
         self,
         tool_name: str,
         arguments: Dict[str, Any],
+        servers: Optional[Iterable[str]] = None,
     ) -> ToolExecution:
         """Route tool call to appropriate MCP server.
 
         Args:
             tool_name: Tool name.
             arguments: Tool arguments.
+            servers: Optional subset of servers allowed for this call.
 
         Returns:
             Tool execution result.
@@ -226,19 +485,73 @@ class MCPManager:
                 server_name=agg.server_name,
             )
 
+        if servers is not None and agg.server_name not in servers:
+            return ToolExecution(
+                name=tool_name,
+                arguments=arguments,
+                success=False,
+                result_preview=f"Server '{agg.server_name}' is not enabled for this request",
+                duration_ms=0,
+                server_name=agg.server_name,
+            )
+
+        # Validate and coerce arguments before any round trip
+        if settings.mcp.validate_arguments:
+            arguments, errors = agg.validator(arguments)
+            if errors:
+                logger.info(f"Rejected arguments for '{tool_name}': {errors}")
+                return ToolExecution(
+                    name=tool_name,
+                    arguments=arguments,
+                    success=False,
+                    result_preview=(
+                        f"Invalid arguments for tool '{tool_name}':\n- "
+                        + "\n- ".join(errors)
+                    ),
+                    duration_ms=int((datetime.now() - start_time).total_seconds() * 1000),
+                    server_name=agg.server_name,
+                )
+
+        # Serve deterministic tools from the result cache
+        cache_ttl = self._get_cache_ttl(agg)
+        cache_key = None
+        if cache_ttl:
+            cache_key = make_cache_key(agg.server_name, tool_name, arguments)
+            entry = self._result_cache.get(cache_key)
+            if entry:
+                artifact_id, result_size = self._store_artifact(entry.result)
+                return ToolExecution(
+                    name=tool_name,
+                    arguments=arguments,
+                    success=True,
+                    result_preview=entry.preview,
+                    artifact_id=artifact_id,
+                    result_size=result_size,
+                    duration_ms=int((datetime.now() - start_time).total_seconds() * 1000),
+                    server_name=agg.server_name,
+                    cached=True,
+                )
+
         try:
             result = await agg.server_client.call_tool(tool_name, arguments)
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
-            # Extract result preview
-            preview = self._extract_preview(result)
+            # Render a compact, token-budgeted view for the LLM
+            preview = render_result(result, self._get_result_budget(agg))
+            artifact_id, result_size = self._store_artifact(result)
+
+            # Failures are neither cached, prefetched nor memoized
+            failed = is_error_result(result)
+            if cache_key and not failed:
+                self._result_cache.put(cache_key, result, preview, cache_ttl)
 
             return ToolExecution(
                 name=tool_name,
                 arguments=arguments,
-                success=True,
+                success=not failed,
                 result_preview=preview,
-                result_full=result,
+                artifact_id=artifact_id,
+                result_size=result_size,
                 duration_ms=duration_ms,
                 server_name=agg.server_name,
             )
@@ -256,24 +569,71 @@ class MCPManager:
                 server_name=agg.server_name,
             )
 
-    def _extract_preview(self, result: CallToolResult, max_len: int = 500) -> str:
-        """Extract text preview from MCP result.
+    def _get_cache_ttl(self, agg: AggregatedTool) -> int:
+        """Get the result cache TTL declared for a tool.
+
+        Args:
+            agg: Aggregated tool.
+
+        Returns:
+            TTL in seconds, 0 if the tool is not cacheable.
+        """
+        if not settings.mcp.tool_cache_enabled:
+            return 0
+        return agg.server_client.config.cache_ttl.get(agg.tool.name, 0)
+
+    def invalidate_cache(self, server_name: Optional[str] = None) -> None:
+        """Drop cached tool results.
+
+        Args:
+            server_name: Only drop results from this server. None = all.
+        """
+        if server_name is None:
+            self._result_cache.clear()
+        else:
+            self._result_cache.invalidate_server(server_name)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get tool result cache statistics.
+
+        Returns:
+            Dict of cache counters.
+        """
+        return self._result_cache.stats()
+
+    def _store_artifact(self, result: CallToolResult) -> Tuple[str, int]:
+        """Store the full result of a call in the artifact store.
+
+        Text-only results are stored as plain text, anything else as the
+        JSON-serialized MCP result.
 
         Args:
             result: MCP call result.
-            max_len: Maximum preview length.
 
         Returns:
-            Text preview.
+            Tuple of (artifact id, size in bytes).
+        """
+        if all(hasattr(content, "text") for content in result.content):
+            data = "\n".join(content.text for content in result.content).encode()
+            content_type = "text/plain; charset=utf-8"
+        else:
+            data = result.model_dump_json(exclude_none=True).encode()
+            content_type = "application/json"
+        meta = self.artifact_store.put(data, content_type)
+        return meta.artifact_id, meta.size
+
+    def _get_result_budget(self, agg: AggregatedTool) -> int:
+        """Get the token budget for a tool's rendered result.
+
+        Args:
+            agg: Aggregated tool.
+
+        Returns:
+            Token budget.
         """
-        texts = []
-        for content in result.content:
-            if hasattr(content, "text"):
-                texts.append(content.text)
-        full_text = "\n".join(texts)
-        if len(full_text) > max_len:
-            return full_text[:max_len] + "..."
-        return full_text
+        return agg.server_client.config.result_max_tokens.get(
+            agg.tool.name, settings.mcp.result_max_tokens
+        )
 
     def get_servers_info(self) -> List[MCPServerInfo]:
         """Get information about all registered servers.
@@ -283,45 +643,75 @@ class MCPManager:
         """
         servers = []
         for name, client in self._clients.items():
-            server_tools = [
-                t.tool.name for t in self._tools_map.values()
-                if t.server_name == name
-            ]
+            server_tools = list(self._server_tools.get(name, []))
             servers.append(MCPServerInfo(
                 name=name,
                 transport=client.config.transport,
                 connected=client.is_connected,
+                state=client.state,
                 enabled=name in self._enabled_servers,
                 tools_count=len(server_tools),
                 tools=server_tools,
+                last_ping_ms=self._last_ping.get(name),
             ))
         return servers
 
+    def get_server_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get concurrency, queueing and breaker metrics per server.
+
+        Returns:
+            Dict of server metrics.
+        """
+        return {name: client.get_metrics() for name, client in self._clients.items()}
+
     async def get_health_status(self) -> Dict[str, Dict[str, Any]]:
         """Check health of all MCP server connections.
 
+        Servers are pinged concurrently.
+
         Returns:
             Dict of server statuses.
         """
+        clients = list(self._clients.items())
+        pings = await asyncio.gather(*(
+            client.ping() if client.is_connected else asyncio.sleep(0, result=-1)
+            for _, client in clients
+        ))
+
         status = {}
-        for name, client in self._clients.items():
-            ping_ms = await client.ping() if client.is_connected else -1
-            tools_count = len([t for t in self._tools_map.values() if t.server_name == name])
+        for (name, client), ping_ms in zip(clients, pings):
+            self._last_ping[name] = ping_ms
+            tools_count = len(self._server_tools.get(name, []))
 
             status[name] = {
                 "connected": client.is_connected,
+                "state": client.state,
                 "enabled": name in self._enabled_servers,
                 "tools_count": tools_count,
                 "ping_ms": ping_ms,
+                "circuit": client.breaker.state,
             }
 
         return status
 
     async def shutdown(self) -> None:
         """Gracefully disconnect all servers."""
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
         for client in self._clients.values():
             await client.disconnect()
         self._clients.clear()
         self._tools_map.clear()
+        self._server_tools.clear()
+        self._server_versions.clear()
         self._enabled_servers.clear()
+        self._configs.clear()
+        self._result_cache.clear()
+        self._tools_version += 1
         logger.info("MCP Manager shutdown complete")
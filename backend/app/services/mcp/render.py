@@ -0,0 +1,244 @@
+"""Compact, token-budgeted rendering of tool results for the LLM.
+
+JSON results are re-rendered into dense forms: row sets become TSV tables,
+objects become `key: value` lines. A result that fits its token budget is
+rendered in full. Otherwise long cells are shortened and whole rows or
+lines are elided, with the omission stated with counts.
+"""
+
+import json
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp.types import CallToolResult
+
+# Rough token estimate, good enough for budgeting French/English text and data
+CHARS_PER_TOKEN = 4
+# Cell length cap, applied only when a result does not fit its budget
+MAX_CELL_CHARS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Approximate token count.
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _compact(value: Any) -> str:
+    """Serialize a value as compact single-line JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _cell(value: Any, max_len: Optional[int] = None) -> str:
+    """Render a scalar or nested value as a TSV cell, optionally shortened."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    text = value if isinstance(value, str) else (
+        str(value) if isinstance(value, (int, float)) else _compact(value)
+    )
+    text = " ".join(text.split())  # No tabs or newlines inside a cell
+    if max_len is not None and len(text) > max_len:
+        text = text[:max_len - 1] + "…"
+    return text
+
+
+def _fit_lines(header: List[str], lines: List[str], max_chars: float, unit: str) -> str:
+    """Keep as many lines as fit in a character budget.
+
+    Args:
+        header: Lines always kept.
+        lines: Lines kept in order while they fit.
+        max_chars: Character budget.
+        unit: Name of an elided line in the omission note ("rows", "lines"...).
+
+    Returns:
+        Rendered text.
+    """
+    kept = list(header)
+    used = sum(len(line) + 1 for line in kept)
+    total = len(lines)
+    note_len = 48
+    for i, line in enumerate(lines):
+        reserve = note_len if i < total - 1 else 0
+        if used + len(line) + 1 + reserve > max_chars:
+            kept.append(f"[... {total - i} more {unit} omitted, {total} total]")
+            break
+        kept.append(line)
+        used += len(line) + 1
+    return "\n".join(kept)
+
+
+def _table(
+    columns: List[str],
+    rows: List[List[Any]],
+    max_chars: float,
+    cell_max: Optional[int],
+) -> str:
+    """Render rows as a TSV table."""
+    header = ["\t".join(_cell(c, cell_max) for c in columns)]
+    lines = ["\t".join(_cell(v, cell_max) for v in row) for row in rows]
+    return _fit_lines(header, lines, max_chars, "rows")
+
+
+def _records_table(
+    records: List[Dict[str, Any]],
+    max_chars: float,
+    cell_max: Optional[int],
+) -> str:
+    """Render a list of objects as a TSV table over the union of their keys."""
+    columns: List[str] = []
+    for record in records:
+        for key in record:
+            if key not in columns:
+                columns.append(key)
+    rows = [[record.get(c) for c in columns] for record in records]
+    return _table(columns, rows, max_chars, cell_max)
+
+
+def _is_records(value: Any) -> bool:
+    """Whether a value is a non-empty list of objects."""
+    return isinstance(value, list) and bool(value) and all(isinstance(v, dict) for v in value)
+
+
+def _is_rowset(value: Any) -> bool:
+    """Whether a value is a `{"columns": [...], "rows": [[...]]}` result set."""
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("columns"), list)
+        and isinstance(value.get("rows"), list)
+        and all(isinstance(r, list) for r in value["rows"])
+    )
+
+
+def render_json(value: Any, max_chars: int) -> str:
+    """Render a parsed JSON value compactly within a character budget.
+
+    Args:
+        value: Parsed JSON value.
+        max_chars: Character budget.
+
+    Returns:
+        Rendered text.
+    """
+    if value == [] or value == {}:
+        return "[] (empty list)" if isinstance(value, list) else "{} (empty object)"
+    text = _render_json(value, math.inf, None)
+    if len(text) <= max_chars:
+        return text
+    return _render_json(value, max_chars, MAX_CELL_CHARS)
+
+
+def _render_json(value: Any, max_chars: float, cell_max: Optional[int]) -> str:
+    """Render a parsed JSON value, eliding rows and lines beyond the budget.
+
+    Args:
+        value: Parsed JSON value.
+        max_chars: Character budget (infinite for a full rendering).
+        cell_max: Cell length cap, None to keep cells whole.
+
+    Returns:
+        Rendered text.
+    """
+    if _is_rowset(value):
+        columns = [c.get("name", "") if isinstance(c, dict) else c for c in value["columns"]]
+        if not value["rows"]:
+            return "\t".join(_cell(c, cell_max) for c in columns) + "\n[0 rows]"
+        return _table(columns, value["rows"], max_chars, cell_max)
+
+    if _is_records(value):
+        return _records_table(value, max_chars, cell_max)
+
+    if isinstance(value, list):
+        return _fit_lines([], [_cell(v, cell_max) for v in value], max_chars, "items")
+
+    if isinstance(value, dict):
+        header: List[str] = []
+        sections: List[Tuple[str, Any]] = []
+        for key, item in value.items():
+            if _is_records(item) or _is_rowset(item):
+                sections.append((key, item))
+            else:
+                header.append(f"{key}: {_cell(item, cell_max)}")
+        text = _fit_lines([], header, max_chars, "fields")
+        for key, item in sections:
+            remaining = max_chars - len(text) - len(key) - 4
+            if remaining < 64:
+                text += f"\n[... {key} omitted]"
+                continue
+            count = len(item["rows"] if _is_rowset(item) else item)
+            text += f"\n{key} ({count}):\n" + _render_json(item, remaining, cell_max)
+        return text.lstrip("\n")
+
+    return _cell(value, cell_max)
+
+
+def render_result(result: CallToolResult, max_tokens: int) -> str:
+    """Render a tool result for the LLM within a token budget.
+
+    Args:
+        result: MCP call result.
+        max_tokens: Token budget for the rendered text.
+
+    Returns:
+        Rendered text.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    parts: List[str] = []
+    for content in result.content:
+        if hasattr(content, "text"):
+            parts.append(content.text)
+        else:
+            mime = getattr(content, "mimeType", None)
+            parts.append(f"[{content.type} content{f' ({mime})' if mime else ''}]")
+
+    rendered: List[str] = []
+    remaining = max_chars
+    for i, part in enumerate(parts):
+        # Share what is left of the budget evenly among remaining parts
+        share = remaining // (len(parts) - i)
+        text = _render_text(part, share)
+        rendered.append(text)
+        remaining -= len(text) + 1
+    return "\n".join(rendered)
+
+
+def render_text(text: str, max_tokens: int) -> str:
+    """Shorten an already rendered text to a token budget.
+
+    Args:
+        text: Rendered text (e.g. a result preview).
+        max_tokens: Token budget.
+
+    Returns:
+        Text cut at line or word boundaries, with an omission note.
+    """
+    return _render_text(text, max_tokens * CHARS_PER_TOKEN)
+
+
+def _render_text(text: str, max_chars: int) -> str:
+    """Render one text content block, as JSON when it parses."""
+    stripped = text.strip()
+    value: Optional[Any] = None
+    if stripped[:1] in ("{", "["):
+        try:
+            value = json.loads(stripped)
+        except ValueError:
+            value = None
+    if value is not None:
+        return render_json(value, max_chars)
+
+    if len(stripped) <= max_chars:
+        return stripped
+    lines = stripped.splitlines()
+    if len(lines) > 1:
+        return _fit_lines([], lines, max_chars, "lines")
+    kept = stripped[:max_chars].rsplit(" ", 1)[0]
+    return kept + f" [... {len(stripped) - len(kept)} more characters omitted]"
@@ -0,0 +1,205 @@
+"""Per-server concurrency limiting and circuit breaking."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is short-circuited by an open breaker."""
+
+
+class QueueTimeoutError(RuntimeError):
+    """Raised when a call waited too long for a concurrency slot."""
+
+
+class ConcurrencyLimiter:
+    """Bounds in-flight calls to a server and queues the rest.
+
+    Tracks queue depth and wait times so capacity can be sized.
+    """
+
+    def __init__(self, name: str, max_in_flight: int, queue_timeout: float):
+        """Initialize concurrency limiter.
+
+        Args:
+            name: Server name (for logs and errors).
+            max_in_flight: Maximum concurrent calls.
+            queue_timeout: Maximum seconds a call may wait for a slot.
+        """
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.total_calls = 0
+        self.queue_timeouts = 0
+        self._waits_ms: Deque[float] = deque(maxlen=256)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the duration of a call.
+
+        Raises:
+            QueueTimeoutError: If no slot frees up within the queue timeout.
+        """
+        start = time.monotonic()
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.queue_timeouts += 1
+            raise QueueTimeoutError(
+                f"Server '{self.name}' is saturated "
+                f"({self.max_in_flight} calls in flight, waited {self.queue_timeout:.0f}s)"
+            )
+        finally:
+            self.queued -= 1
+
+        self._waits_ms.append((time.monotonic() - start) * 1000)
+        self.total_calls += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get queueing metrics.
+
+        Returns:
+            Dict of gauges and counters.
+        """
+        waits = sorted(self._waits_ms)
+        p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queued,
+            "max_queue_depth": self.max_queued,
+            "total_calls": self.total_calls,
+            "queue_timeouts": self.queue_timeouts,
+            "wait_ms_avg": round(sum(waits) / len(waits), 1) if waits else 0.0,
+            "wait_ms_p95": round(p95, 1),
+            "wait_ms_max": round(waits[-1], 1) if waits else 0.0,
+        }
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed -> open after `failure_threshold` consecutive failures;
+    open -> half_open after `reset_timeout`, letting a single trial call through;
+    half_open -> closed on success, back to open on failure.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Server name (for logs and errors).
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds before an open circuit allows a trial call.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.short_circuited = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def before_call(self) -> None:
+        """Admit or reject a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        if self.state == "closed":
+            return
+
+        if self.state == "open":
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                self.short_circuited += 1
+                raise CircuitOpenError(
+                    f"Server '{self.name}' circuit open after "
+                    f"{self.consecutive_failures} failures, retry in {remaining:.0f}s"
+                )
+            self.state = "half_open"
+            logger.info(f"Circuit for '{self.name}' half-open, allowing a trial call")
+
+        if self._trial_in_flight:
+            self.short_circuited += 1
+            raise CircuitOpenError(f"Server '{self.name}' circuit half-open, trial call in progress")
+        self._trial_in_flight = True
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """Admit a call and record its outcome.
+
+        Saturation and cancellation are not server failures and leave the
+        failure count untouched.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        self.before_call()
+        try:
+            yield
+        except QueueTimeoutError:
+            self._trial_in_flight = False
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            self._trial_in_flight = False
+            raise
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state != "closed":
+            logger.info(f"Circuit for '{self.name}' closed")
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(
+                    f"Circuit for '{self.name}' opened after "
+                    f"{self.consecutive_failures} consecutive failures"
+                )
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get breaker state.
+
+        Returns:
+            Dict of state and counters.
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "short_circuited": self.short_circuited,
+        }
@@ -0,0 +1,103 @@
+"""On-disk cache of MCP tool schemas, used to expose lazy servers' tools."""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from mcp.types import Tool
+
+from app.config import MCPServerConfig
+
+logger = logging.getLogger(__name__)
+
+
+def config_fingerprint(config: MCPServerConfig) -> str:
+    """Hash the parts of a server config that determine its tools.
+
+    Args:
+        config: Server configuration.
+
+    Returns:
+        Hex digest.
+    """
+    identity = {
+        "transport": config.transport,
+        "command": config.command,
+        "args": config.args,
+        "module": config.module,
+        "url": config.url,
+    }
+    return hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class ToolSchemaStore:
+    """JSON file mapping server name to its last known tool schemas.
+
+    Entries are tied to a fingerprint of the server command, so editing a
+    server's config invalidates its cached schemas.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """Initialize schema store.
+
+        Args:
+            path: JSON file path. None disables persistence.
+        """
+        self.path = Path(path) if path else None
+
+    def load(self, config: MCPServerConfig) -> Optional[List[Tool]]:
+        """Load cached tools for a server.
+
+        Args:
+            config: Server configuration.
+
+        Returns:
+            Tool list, or None if missing or stale.
+        """
+        entry = self._read().get(config.name)
+        if not entry or entry.get("fingerprint") != config_fingerprint(config):
+            return None
+        try:
+            return [Tool.model_validate(t) for t in entry.get("tools", [])]
+        except Exception as e:
+            logger.warning(f"Ignoring invalid cached tool schemas for '{config.name}': {e}")
+            return None
+
+    def save(self, config: MCPServerConfig, tools: List[Tool]) -> None:
+        """Persist a server's tools.
+
+        Args:
+            config: Server configuration.
+            tools: Tools exposed by the server.
+        """
+        if not self.path:
+            return
+
+        data = self._read()
+        data[config.name] = {
+            "fingerprint": config_fingerprint(config),
+            "tools": [t.model_dump(mode="json", exclude_none=True) for t in tools],
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic replace: several API workers may share the file
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist tool schemas to {self.path}: {e}")
+
+    def _read(self) -> Dict[str, Dict]:
+        """Read the whole store, tolerating a missing or corrupt file."""
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read tool schema cache {self.path}: {e}")
+            return {}
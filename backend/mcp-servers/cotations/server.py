@@ -13,7 +13,6 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 server = Server("mcp-cotations")
@@ -35,11 +34,11 @@ ESG_CRITERIA = [
 
 def generate_mock_cotation(engagement_id: int) -> dict:
     """Generate mock ESG cotation data."""
-    random.seed(engagement_id)  # Deterministic for same ID
+    rng = random.Random(engagement_id)  # Local RNG: deterministic without reseeding the host process
 
     scores = {}
     for criterion in ESG_CRITERIA:
-        score = random.randint(40, 100)
+        score = rng.randint(40, 100)
         scores[criterion] = {
             "score": score,
             "class": (
@@ -153,7 +152,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         await asyncio.sleep(0.3)  # Simulate PDF extraction
         cotation = generate_mock_cotation(engagement_id)
-        return [TextContent(type="text", text=json.dumps(cotation, indent=2))]
+        return [TextContent(type="text", text=json.dumps(cotation, ensure_ascii=False))]
 
     elif name == "search_cotations":
         min_score = arguments.get("min_score", 0)
@@ -174,7 +173,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                     if len(results) >= limit:
                         break
 
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+        return [TextContent(type="text", text=json.dumps(results, ensure_ascii=False))]
 
     return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
@@ -187,4 +186,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Only when run standalone: in-process servers share the API logging
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
@@ -11,9 +11,8 @@ from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import CallToolResult, Tool, TextContent
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Hive connection settings from environment
@@ -35,6 +34,14 @@ def get_hive_connection():
     )
 
 
+def error_result(message: str) -> CallToolResult:
+    """Build a failed tool result, so clients do not cache or reuse it."""
+    return CallToolResult(
+        content=[TextContent(type="text", text=json.dumps({"error": message}))],
+        isError=True,
+    )
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available Hive tools."""
@@ -171,7 +178,7 @@ def run_hive_query(query: str, database: str = None) -> list[dict]:
 
 
 @server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent] | CallToolResult:
     """Execute a Hive tool."""
     logger.info(f"Tool called: {name} with args: {arguments}")
 
@@ -185,10 +192,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
             # Security: Only allow SELECT queries
             if not query.upper().startswith("SELECT"):
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({"error": "Only SELECT queries are allowed"}),
-                )]
+                return error_result("Only SELECT queries are allowed")
 
             # Add LIMIT if not present (but not if already has one)
             if "LIMIT" not in query.upper():
@@ -255,14 +259,11 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 text=json.dumps({"columns": [], "rows": []}),
             )]
 
-        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return error_result(f"Unknown tool: {name}")
 
     except Exception as e:
         logger.error(f"Error executing {name}: {e}")
-        return [TextContent(
-            type="text",
-            text=json.dumps({"error": str(e)}),
-        )]
+        return error_result(str(e))
 
 
 async def main():
@@ -273,4 +274,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Only when run standalone: in-process servers share the API logging
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
@@ -13,7 +13,6 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 server = Server("mcp-insee")
@@ -27,16 +26,16 @@ REGIONS = [
 
 def generate_mock_qpv(qpv_id: int) -> dict:
     """Generate mock QPV data."""
-    random.seed(qpv_id)
+    rng = random.Random(qpv_id)  # Local RNG: deterministic without reseeding the host process
     return {
         "code_qpv": f"QP0{qpv_id:05d}",
         "nom_qpv": f"Quartier {qpv_id}",
         "commune": f"Commune {qpv_id % 100}",
-        "region": random.choice(REGIONS),
-        "population_2024": random.randint(2000, 50000),
-        "superficie_ha": random.randint(10, 500),
-        "taux_pauvrete": round(random.uniform(25, 55), 1),
-        "taux_chomage": round(random.uniform(15, 35), 1),
+        "region": rng.choice(REGIONS),
+        "population_2024": rng.randint(2000, 50000),
+        "superficie_ha": rng.randint(10, 500),
+        "taux_pauvrete": round(rng.uniform(25, 55), 1),
+        "taux_chomage": round(rng.uniform(15, 35), 1),
     }
 
 
@@ -120,7 +119,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         await asyncio.sleep(0.2)
         qpv = generate_mock_qpv(qpv_id)
         qpv["code_qpv"] = code
-        return [TextContent(type="text", text=json.dumps(qpv, indent=2))]
+        return [TextContent(type="text", text=json.dumps(qpv, ensure_ascii=False))]
 
     elif name == "search_qpv_by_region":
         region = arguments.get("region", "")
@@ -134,7 +133,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 if len(results) >= limit:
                     break
 
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+        return [TextContent(type="text", text=json.dumps(results, ensure_ascii=False))]
 
     elif name == "get_qpv_statistics":
         region_filter = arguments.get("region")
@@ -154,7 +153,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             "average_population": total_pop // count if count > 0 else 0,
             "region_filter": region_filter,
         }
-        return [TextContent(type="text", text=json.dumps(stats, indent=2))]
+        return [TextContent(type="text", text=json.dumps(stats, ensure_ascii=False))]
 
     return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
@@ -167,4 +166,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Only when run standalone: in-process servers share the API logging
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
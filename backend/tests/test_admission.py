@@ -0,0 +1,135 @@
+"""Tests for LLM admission control."""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.services.llm.admission import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdmissionController,
+    AdmissionTimeoutError,
+)
+
+
+@pytest.fixture(autouse=True)
+def one_slot(monkeypatch):
+    monkeypatch.setattr(settings.ollama, "max_concurrent_requests", 1)
+    monkeypatch.setattr(settings.ollama, "model_concurrency", {})
+
+
+def grant_order(controller, tickets):
+    """Release slots one by one and record the order tickets are granted in."""
+    order = []
+    pending = list(tickets)
+    while pending:
+        granted = [t for t in pending if t.granted]
+        assert len(granted) == 1
+        order.append(granted[0])
+        pending.remove(granted[0])
+        controller.release(granted[0])
+    return order
+
+
+def test_grants_immediately_when_free():
+    controller = AdmissionController()
+
+    ticket = controller.request("m", "c1")
+
+    assert ticket.granted
+    assert controller.position(ticket) == 0
+
+
+def test_round_robin_between_conversations():
+    controller = AdmissionController()
+    running = controller.request("m", "busy")
+    a1, a2, a3 = (controller.request("m", "a") for _ in range(3))
+    b1 = controller.request("m", "b")
+
+    assert [controller.position(t) for t in (a1, b1, a2, a3)] == [1, 2, 3, 4]
+    controller.release(running)
+    assert grant_order(controller, [a1, a2, a3, b1]) == [a1, b1, a2, a3]
+
+
+def test_priority_is_served_first():
+    controller = AdmissionController()
+    running = controller.request("m", "busy")
+    background = controller.request("m", "warmer", PRIORITY_BACKGROUND)
+    batch = controller.request("m", "api", PRIORITY_BATCH)
+    interactive = controller.request("m", "ui", PRIORITY_INTERACTIVE)
+
+    controller.release(running)
+
+    assert grant_order(controller, [background, batch, interactive]) == [
+        interactive, batch, background,
+    ]
+
+
+def test_model_names_are_normalized():
+    controller = AdmissionController()
+    first = controller.request("devstral", "c1")
+    second = controller.request("devstral:latest", "c2")
+
+    assert first.granted and not second.granted
+    assert list(controller.metrics()) == ["devstral:latest"]
+
+
+def test_per_model_limit_uses_normalized_names(monkeypatch):
+    monkeypatch.setattr(settings.ollama, "model_concurrency", {"devstral": 2})
+    controller = AdmissionController(endpoints=2)
+
+    assert controller.metrics() == {}
+    controller.request("devstral:latest", "c1")
+    assert controller.metrics()["devstral:latest"]["max_in_flight"] == 4
+
+
+def test_withdrawn_ticket_frees_its_place():
+    controller = AdmissionController()
+    running = controller.request("m", "busy")
+    waiting = controller.request("m", "a")
+    other = controller.request("m", "b")
+
+    controller.release(waiting)
+    controller.release(running)
+
+    assert other.granted
+    assert controller.metrics()["m:latest"]["in_flight"] == 1
+
+
+def test_wait_times_out_and_withdraws():
+    controller = AdmissionController()
+    controller.request("m", "busy")
+
+    async def main():
+        ticket = controller.request("m", "a")
+        positions = []
+        with pytest.raises(AdmissionTimeoutError):
+            async for position in controller.wait(ticket, timeout=0.01):
+                positions.append(position)
+        return positions
+
+    assert asyncio.run(main()) == [1]
+    metrics = controller.metrics()["m:latest"]
+    assert metrics["queue_timeouts"] == 1
+    assert metrics["queue_depth"] == 0
+
+
+def test_slot_bounds_concurrency():
+    controller = AdmissionController()
+    peak = 0
+
+    async def call(conversation):
+        nonlocal peak
+        async with controller.slot("m", conversation):
+            peak = max(peak, controller.metrics()["m:latest"]["in_flight"])
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(call(f"c{i % 2}") for i in range(4)))
+
+    asyncio.run(main())
+
+    assert peak == 1
+    assert controller.metrics()["m:latest"]["in_flight"] == 0
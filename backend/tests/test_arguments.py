@@ -0,0 +1,99 @@
+"""Tests for tool argument validation and coercion."""
+
+from app.services.mcp.arguments import ArgumentValidator
+
+
+def validate(schema, arguments):
+    return ArgumentValidator({"type": "object", "properties": {"v": schema}})({"v": arguments})
+
+
+def test_coerces_scalars_from_strings():
+    validator = ArgumentValidator({
+        "type": "object",
+        "properties": {
+            "limit": {"type": "integer"},
+            "ratio": {"type": "number"},
+            "flag": {"type": "boolean"},
+            "name": {"type": "string"},
+        },
+    })
+
+    arguments, errors = validator({"limit": "10", "ratio": "0.5", "flag": "oui", "name": 42})
+
+    assert errors == []
+    assert arguments == {"limit": 10, "ratio": 0.5, "flag": True, "name": "42"}
+
+
+def test_parses_json_encoded_containers():
+    arguments, errors = validate({"type": "array", "items": {"type": "integer"}}, '["1", 2]')
+
+    assert errors == []
+    assert arguments == {"v": [1, 2]}
+
+
+def test_reports_uncoercible_values():
+    arguments, errors = validate({"type": "integer"}, "abc")
+
+    assert errors == ['v: expected integer, got "abc"']
+
+
+def test_required_and_closed_objects():
+    validator = ArgumentValidator({
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+        "required": ["query"],
+        "additionalProperties": False,
+    })
+
+    _, errors = validator({"qeury": "SELECT 1"})
+
+    assert errors == ["qeury: unexpected argument", "query: missing required argument"]
+
+
+def test_drops_null_optional_arguments():
+    validator = ArgumentValidator({
+        "type": "object",
+        "properties": {"database": {"type": "string"}, "note": {"type": ["string", "null"]}},
+    })
+
+    arguments, errors = validator({"database": None, "note": None})
+
+    assert errors == []
+    assert arguments == {"note": None}
+
+
+def test_enum_is_matched_case_insensitively():
+    arguments, errors = validate({"type": "string", "enum": ["Emploi", "Habitat"]}, "emploi")
+
+    assert errors == []
+    assert arguments == {"v": "Emploi"}
+
+
+def test_bounds():
+    _, errors = validate({"type": "integer", "minimum": 1, "maximum": 20}, "50")
+
+    assert errors == ["v: 50 is above the maximum 20"]
+
+
+def test_type_list_keeps_values_that_already_match():
+    assert validate({"type": ["string", "integer"]}, 5) == ({"v": 5}, [])
+    assert validate({"type": ["integer", "string"]}, "007") == ({"v": "007"}, [])
+
+
+def test_type_list_coerces_as_a_fallback():
+    assert validate({"type": ["integer", "null"]}, "7") == ({"v": 7}, [])
+
+
+def test_any_of_prefers_the_matching_variant():
+    schema = {"anyOf": [{"type": "string"}, {"type": "integer"}]}
+
+    assert validate(schema, 5) == ({"v": 5}, [])
+    assert validate(schema, "5") == ({"v": "5"}, [])
+
+
+def test_any_of_falls_back_to_a_coercing_variant():
+    schema = {"anyOf": [{"type": "integer", "minimum": 1}, {"type": "boolean"}]}
+
+    assert validate(schema, "3") == ({"v": 3}, [])
+    assert validate(schema, "oui") == ({"v": True}, [])
+    assert validate(schema, "abc")[1] == ['v: expected integer, got "abc"']
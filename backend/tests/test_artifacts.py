@@ -0,0 +1,103 @@
+"""Tests for the artifact store and its endpoints."""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_artifact_store
+from app.api.routes import artifacts
+from app.services.artifacts import ArtifactStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ArtifactStore(memory_max_bytes=64, spill_dir=str(tmp_path), ttl_seconds=60)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def client(store):
+    app = FastAPI()
+    app.include_router(artifacts.router)
+    app.dependency_overrides[get_artifact_store] = lambda: store
+    return TestClient(app)
+
+
+def read(store, artifact_id, start=0, end=None):
+    return b"".join(store.iter_range(artifact_id, start, end))
+
+
+def test_put_deduplicates_by_content(store):
+    assert store.put(b"abc").artifact_id == store.put(b"abc").artifact_id
+    assert store.stats()["artifacts"] == 1
+
+
+def test_large_and_evicted_artifacts_spill_to_disk(store):
+    large = store.put(b"x" * 32)
+    first = store.put(b"a" * 12)
+    for i in range(5):
+        store.put(bytes([i]) * 12)
+
+    assert store.stats()["spilled"] >= 2
+    assert read(store, large.artifact_id) == b"x" * 32
+    assert read(store, first.artifact_id, 2, 5) == b"aaa"
+
+
+def test_stream_survives_eviction(store):
+    meta = store.put(b"0123456789")
+    content = store.iter_range(meta.artifact_id, chunk_size=4)
+    store.close()
+
+    assert b"".join(content) == b"0123456789"
+
+
+def test_expired_artifact_is_reported_as_expired(store):
+    meta = store.put(b"abc")
+    meta.expires_at = time.time() - 1
+
+    assert store.get_meta(meta.artifact_id) is None
+    assert store.is_expired(meta.artifact_id)
+    with pytest.raises(KeyError):
+        store.iter_range(meta.artifact_id)
+
+
+def test_missing_spill_file_raises_key_error(store, tmp_path):
+    meta = store.put(b"y" * 32)
+    store._path(meta.artifact_id).unlink()
+
+    with pytest.raises(KeyError):
+        store.iter_range(meta.artifact_id)
+    assert store.is_expired(meta.artifact_id)
+
+
+def test_get_artifact_with_range(client, store):
+    meta = store.put(b"0123456789")
+
+    response = client.get(f"/artifacts/{meta.artifact_id}", headers={"Range": "bytes=2-4"})
+
+    assert response.status_code == 206
+    assert response.content == b"234"
+    assert response.headers["Content-Range"] == "bytes 2-4/10"
+
+
+def test_unknown_artifact_is_404(client):
+    assert client.get("/artifacts/unknown").status_code == 404
+    assert client.get("/artifacts/unknown/meta").status_code == 404
+
+
+def test_expired_artifact_is_410(client, store):
+    meta = store.put(b"abc")
+    meta.expires_at = time.time() - 1
+
+    assert client.get(f"/artifacts/{meta.artifact_id}").status_code == 410
+    assert client.get(f"/artifacts/{meta.artifact_id}/meta").status_code == 410
+
+
+def test_lost_spill_file_is_410_not_a_server_error(client, store):
+    meta = store.put(b"y" * 32)
+    store._path(meta.artifact_id).unlink()
+
+    assert client.get(f"/artifacts/{meta.artifact_id}").status_code == 410
@@ -0,0 +1,57 @@
+"""Tests for conversation history limits."""
+
+from app.api.schemas.mcp import ToolExecution
+from app.config import settings
+from app.services.chat.conversation import ConversationManager
+
+
+def tool_results(count):
+    return [
+        (
+            {"name": "get_table_schema", "arguments": {"table": f"t{i}"}},
+            ToolExecution(
+                name="get_table_schema",
+                arguments={"table": f"t{i}"},
+                success=True,
+                result_preview="col\tstring",
+                duration_ms=0,
+                server_name="hive",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def add_turn(manager, conv_id, n, tool_calls=0):
+    manager.add_message(conv_id, "user", f"question {n}")
+    manager.add_tool_turn(conv_id, tool_results(tool_calls))
+    manager.add_message(conv_id, "assistant", f"answer {n}")
+
+
+def test_tool_messages_do_not_push_out_conversation(monkeypatch):
+    monkeypatch.setattr(settings.conversation, "max_history_messages", 6)
+    monkeypatch.setattr(settings.conversation, "tool_history_turns", 3)
+    manager = ConversationManager()
+    for n in range(3):
+        add_turn(manager, "c", n, tool_calls=4)
+
+    messages = manager.get_messages("c")
+
+    assert [m["content"] for m in messages if m["role"] in ("user", "assistant") and m["content"]] == [
+        "question 0", "answer 0", "question 1", "answer 1", "question 2", "answer 2",
+    ]
+    assert sum(m["role"] == "tool" for m in messages) == 12
+
+
+def test_trim_starts_on_a_conversational_message(monkeypatch):
+    monkeypatch.setattr(settings.conversation, "max_history_messages", 3)
+    monkeypatch.setattr(settings.conversation, "tool_history_turns", 3)
+    manager = ConversationManager()
+    for n in range(3):
+        add_turn(manager, "c", n, tool_calls=2)
+
+    messages = manager.get_messages("c")
+
+    assert messages[0]["content"] == "answer 1"
+    assert [m["content"] for m in messages if m["role"] == "user"] == ["question 2"]
+    assert sum(m["role"] == "tool" for m in messages) == 2
@@ -0,0 +1,34 @@
+"""Tests for loading in-process MCP server modules."""
+
+import logging
+import random
+from pathlib import Path
+
+from app.services.mcp import inprocess
+
+SERVERS_DIR = Path(__file__).resolve().parents[1] / "mcp-servers"
+
+
+def test_load_server_keeps_host_logging():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+
+    inprocess.load_server(str(SERVERS_DIR / "insee" / "server.py"))
+
+    assert root.handlers == handlers
+    assert root.level == level
+    assert logging.basicConfig.__module__ == "logging"
+
+
+def test_mock_servers_do_not_reseed_global_random():
+    ref = str(SERVERS_DIR / "insee" / "server.py")
+    inprocess.load_server(ref)
+    module = inprocess._modules[ref]
+
+    random.seed(1)
+    expected = random.random()
+    random.seed(1)
+    first = module.generate_mock_qpv(5)
+
+    assert random.random() == expected
+    assert module.generate_mock_qpv(5) == first
@@ -0,0 +1,52 @@
+"""Tests for the MCP manager tool registry."""
+
+import asyncio
+from types import SimpleNamespace
+
+from mcp.types import Tool
+
+from app.services.artifacts import ArtifactStore
+from app.services.mcp.manager import MCPManager
+
+
+def make_tool(name: str, description: str = "") -> Tool:
+    return Tool(name=name, description=description, inputSchema={"type": "object"})
+
+
+class FakeClient:
+    """Server client stub exposing a fixed tool list."""
+
+    def __init__(self, name: str, tools):
+        self.name = name
+        self.config = SimpleNamespace(name=name)
+        self.tools = tools
+
+    async def list_tools(self):
+        return self.tools
+
+
+def make_manager(tmp_path) -> MCPManager:
+    manager = MCPManager(artifact_store=ArtifactStore(spill_dir=str(tmp_path)))
+    manager._schema_store = SimpleNamespace(save=lambda config, tools: None)
+    return manager
+
+
+def test_start_hook_ignores_tools_claimed_by_another_server(tmp_path):
+    manager = make_manager(tmp_path)
+    first = FakeClient("hive", [make_tool("query"), make_tool("list_tables")])
+    second = FakeClient("insee", [make_tool("query")])
+    for client in (first, second):
+        manager._clients[client.name] = client
+        manager._index_tools(client, client.tools)
+    manager._drop_tools("insee")  # "query" is no longer in the registry at all
+    version = manager.tools_version
+
+    asyncio.run(manager._on_server_started(first))
+
+    assert manager.get_tool_server("list_tables") == "hive"
+    assert manager.tools_version > version  # "query" vanished: re-indexed
+
+    version = manager.tools_version
+    asyncio.run(manager._on_server_started(first))
+    assert manager.tools_version == version
+
@@ -0,0 +1,58 @@
+"""Tests for MCP client call cancellation."""
+
+import asyncio
+import textwrap
+
+from app.config import MCPServerConfig
+from app.services.mcp import inprocess
+from app.services.mcp.client import MCPClient
+
+SERVER = textwrap.dedent('''
+    import asyncio
+
+    from mcp.server import Server
+    from mcp.types import TextContent, Tool
+
+    server = Server("slow")
+    cancelled = []
+
+    @server.list_tools()
+    async def list_tools():
+        return [Tool(name="wait", description="Wait", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name, arguments):
+        try:
+            await asyncio.sleep(float(arguments.get("seconds", 0)))
+        except asyncio.CancelledError:
+            cancelled.append(arguments)
+            raise
+        return [TextContent(type="text", text="done")]
+''')
+
+
+def test_cancelled_call_is_cancelled_on_the_server(tmp_path):
+    path = tmp_path / "slow_server.py"
+    path.write_text(SERVER)
+    client = MCPClient(MCPServerConfig(
+        name="slow", transport="inprocess", module=str(path), lazy=False,
+    ))
+
+    async def main():
+        await client.connect()
+        try:
+            assert (await client.call_tool("wait", {"seconds": 0})).content[0].text == "done"
+
+            # A concurrent call must not be the one cancelled
+            other = asyncio.create_task(client.call_tool("wait", {"seconds": 0.2, "id": 1}))
+            call = asyncio.create_task(client.call_tool("wait", {"seconds": 30, "id": 2}))
+            await asyncio.sleep(0.1)
+            call.cancel()
+            await asyncio.gather(call, return_exceptions=True)
+            await asyncio.sleep(0.05)
+            assert (await other).content[0].text == "done"
+            assert inprocess._modules[str(path)].cancelled == [{"seconds": 30, "id": 2}]
+        finally:
+            await client.disconnect()
+
+    asyncio.run(main())
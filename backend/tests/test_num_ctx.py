@@ -0,0 +1,52 @@
+"""Tests for per-request num_ctx sizing."""
+
+from app.config import settings
+from app.services.llm.ollama_client import OllamaClient
+
+MODEL = "qwen2.5:7b"
+
+
+def num_ctx(client, endpoint, prompt_tokens):
+    return client._options(endpoint, MODEL, prompt_tokens, num_predict=0)["num_ctx"]
+
+
+def make_client(monkeypatch, shrink_after):
+    monkeypatch.setattr(settings.ollama, "num_ctx", 16384)
+    monkeypatch.setattr(settings.ollama, "num_ctx_buckets", [4096, 8192, 16384])
+    monkeypatch.setattr(settings.ollama, "num_ctx_shrink_after", shrink_after)
+    monkeypatch.setattr(settings.conversation, "context_safety_tokens", 0)
+    client = OllamaClient()
+    return client, client.pool.endpoints[0]
+
+
+def test_smallest_fitting_bucket(monkeypatch):
+    client, endpoint = make_client(monkeypatch, shrink_after=3)
+
+    assert num_ctx(client, endpoint, 1000) == 4096
+    assert num_ctx(client, endpoint, 6000) == 8192
+    assert num_ctx(client, endpoint, None) == 16384
+
+
+def test_loaded_window_is_kept_then_shrinks(monkeypatch):
+    client, endpoint = make_client(monkeypatch, shrink_after=3)
+    assert num_ctx(client, endpoint, 12000) == 16384
+
+    assert [num_ctx(client, endpoint, 1000) for _ in range(3)] == [16384, 16384, 4096]
+    assert num_ctx(client, endpoint, 1000) == 4096
+
+
+def test_larger_request_resets_the_shrink_count(monkeypatch):
+    client, endpoint = make_client(monkeypatch, shrink_after=3)
+    num_ctx(client, endpoint, 12000)
+    num_ctx(client, endpoint, 1000)
+    num_ctx(client, endpoint, 1000)
+
+    assert num_ctx(client, endpoint, 12000) == 16384
+    assert [num_ctx(client, endpoint, 1000) for _ in range(3)] == [16384, 16384, 4096]
+
+
+def test_shrinking_can_be_disabled(monkeypatch):
+    client, endpoint = make_client(monkeypatch, shrink_after=0)
+    num_ctx(client, endpoint, 12000)
+
+    assert {num_ctx(client, endpoint, 1000) for _ in range(20)} == {16384}
@@ -0,0 +1,15 @@
+"""Tests for the Ollama endpoint pool."""
+
+import asyncio
+
+from app.services.llm.pool import EndpointPool
+
+
+def test_close_closes_ollama_and_probe_clients():
+    pool = EndpointPool(["http://127.0.0.1:1", "http://127.0.0.1:2"])
+
+    asyncio.run(pool.close())
+
+    for endpoint in pool.endpoints:
+        assert endpoint.client._client.is_closed
+        assert endpoint.http.is_closed
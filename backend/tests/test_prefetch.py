@@ -0,0 +1,100 @@
+"""Tests for speculative schema prefetch."""
+
+import asyncio
+
+from app.api.schemas.mcp import ToolExecution
+from app.services.chat.prefetch import SchemaPrefetcher
+
+SERVERS = frozenset({"hive"})
+
+
+class FakeManager:
+    """MCP manager stub whose schema calls take `delay` seconds."""
+
+    def __init__(self, delay: float = 0.0, success: bool = True):
+        self.delay = delay
+        self.success = success
+        self.started = 0
+        self.finished = 0
+
+    def get_tool_server(self, tool_name):
+        return "hive"
+
+    def get_tools_version(self, servers):
+        return (1,)
+
+    async def call_tool(self, name, arguments, servers=None):
+        self.started += 1
+        await asyncio.sleep(self.delay)
+        self.finished += 1
+        return ToolExecution(
+            name=name,
+            arguments=arguments,
+            success=self.success,
+            result_preview="col\tstring",
+            duration_ms=0,
+            server_name="hive",
+        )
+
+
+def test_fetch_caches_successful_schemas():
+    manager = FakeManager()
+    prefetcher = SchemaPrefetcher(manager)
+
+    results = asyncio.run(prefetcher.fetch(SERVERS))
+
+    assert results and manager.finished == len(results)
+    assert prefetcher.get_cached(SERVERS) is not None
+
+
+def test_failed_schemas_are_not_cached():
+    prefetcher = SchemaPrefetcher(FakeManager(success=False))
+
+    assert asyncio.run(prefetcher.fetch(SERVERS)) == []
+    assert prefetcher.get_cached(SERVERS) is None
+
+
+def test_fetch_is_cancelled_when_its_only_waiter_leaves():
+    manager = FakeManager(delay=10)
+    prefetcher = SchemaPrefetcher(manager)
+
+    async def main():
+        waiter = asyncio.create_task(prefetcher.fetch(SERVERS))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.sleep(0.01)
+        return dict(prefetcher._inflight)
+
+    assert asyncio.run(main()) == {}
+    assert manager.started > 0 and manager.finished == 0
+
+
+def test_shared_fetch_survives_while_a_waiter_remains():
+    manager = FakeManager(delay=0.05)
+    prefetcher = SchemaPrefetcher(manager)
+
+    async def main():
+        first = asyncio.create_task(prefetcher.fetch(SERVERS))
+        second = asyncio.create_task(prefetcher.fetch(SERVERS))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main())
+    assert manager.finished == manager.started
+
+
+def test_close_cancels_fetches_in_progress():
+    manager = FakeManager(delay=10)
+    prefetcher = SchemaPrefetcher(manager)
+
+    async def main():
+        waiter = asyncio.create_task(prefetcher.fetch(SERVERS))
+        await asyncio.sleep(0.01)
+        await prefetcher.close()
+        await asyncio.gather(waiter, return_exceptions=True)
+        return waiter.cancelled()
+
+    assert asyncio.run(main())
+    assert manager.finished == 0
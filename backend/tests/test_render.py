@@ -0,0 +1,94 @@
+"""Tests for budgeted tool result rendering."""
+
+import json
+
+from mcp.types import CallToolResult, TextContent
+
+from app.services.mcp.render import (
+    CHARS_PER_TOKEN,
+    MAX_CELL_CHARS,
+    render_json,
+    render_result,
+    render_text,
+)
+
+
+def make_result(*texts: str) -> CallToolResult:
+    return CallToolResult(content=[TextContent(type="text", text=t) for t in texts])
+
+
+def test_records_render_as_tsv():
+    text = render_json([{"a": 1, "b": "x"}, {"a": 2, "c": True}], 1000)
+
+    assert text == "a\tb\tc\n1\tx\t\n2\t\ttrue"
+
+
+def test_rowset_renders_as_tsv():
+    text = render_json({"columns": ["id", "name"], "rows": [[1, "a"], [2, None]]}, 1000)
+
+    assert text == "id\tname\n1\ta\n2\t"
+
+
+def test_object_with_nested_rows():
+    text = render_json({"status": "success", "rows": 2, "data": [{"id": 1}, {"id": 2}]}, 1000)
+
+    assert text == "status: success\nrows: 2\ndata (2):\nid\n1\n2"
+
+
+def test_empty_containers_are_explicit():
+    assert render_json([], 1000) == "[] (empty list)"
+    assert render_json({}, 1000) == "{} (empty object)"
+    assert render_result(make_result("[]"), 100) == "[] (empty list)"
+
+
+def test_long_cells_are_kept_when_within_budget():
+    criteria = {f"criterion_{i}": {"score": 50 + i, "class": "C"} for i in range(12)}
+    payload = {"engagement_id": 7, "criteria": criteria}
+
+    text = render_json(payload, 4000)
+
+    assert len(json.dumps(criteria)) > MAX_CELL_CHARS
+    assert "…" not in text
+    assert json.loads(text.split("criteria: ", 1)[1]) == criteria
+
+
+def test_long_cells_are_shortened_when_over_budget():
+    records = [{"id": i, "text": "word " * 100} for i in range(10)]
+
+    text = render_json(records, 1000)
+
+    assert len(text) <= 1000
+    assert "…" in text
+    assert all(len(cell) <= MAX_CELL_CHARS for line in text.splitlines() for cell in line.split("\t"))
+
+
+def test_rows_beyond_budget_are_elided_with_counts():
+    records = [{"id": i, "value": f"v{i}"} for i in range(500)]
+
+    text = render_json(records, 200)
+
+    assert len(text) <= 200
+    assert text.startswith("id\tvalue\n0\tv0\n")
+    assert text.endswith("more rows omitted, 500 total]")
+
+
+def test_render_result_respects_token_budget():
+    rows = json.dumps({"columns": ["n"], "rows": [[i] for i in range(2000)]})
+
+    text = render_result(make_result(rows), max_tokens=50)
+
+    assert len(text) <= 50 * CHARS_PER_TOKEN
+    assert "2000 total" in text
+
+
+def test_render_result_shares_budget_between_parts():
+    text = render_result(make_result("a " * 300, "b " * 300), max_tokens=50)
+
+    assert "a a" in text and "b b" in text
+    assert len(text) <= 50 * CHARS_PER_TOKEN + 80
+
+
+def test_plain_text_is_cut_at_word_boundary():
+    text = render_text("alpha beta gamma delta", max_tokens=3)
+
+    assert text == "alpha beta [... 12 more characters omitted]"
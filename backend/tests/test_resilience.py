@@ -0,0 +1,124 @@
+"""Tests for per-server concurrency limiting and circuit breaking."""
+
+import asyncio
+
+import pytest
+
+from app.services.mcp.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ConcurrencyLimiter,
+    QueueTimeoutError,
+)
+
+
+def fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker("hive", failure_threshold=3, reset_timeout=60)
+    fail(breaker, 2)
+    assert breaker.state == "closed"
+
+    fail(breaker)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.metrics()["short_circuited"] == 1
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker("hive", failure_threshold=2, reset_timeout=60)
+    fail(breaker)
+    breaker.before_call()
+    breaker.record_success()
+    fail(breaker)
+
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_a_single_trial():
+    breaker = CircuitBreaker("hive", failure_threshold=1, reset_timeout=0)
+    fail(breaker)
+    assert breaker.state == "open"
+
+    breaker.before_call()
+
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_closes_on_success():
+    breaker = CircuitBreaker("hive", failure_threshold=1, reset_timeout=0)
+    fail(breaker)
+    breaker.before_call()
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_half_open_reopens_on_failure():
+    breaker = CircuitBreaker("hive", failure_threshold=5, reset_timeout=0)
+    fail(breaker, 5)
+    fail(breaker)
+
+    assert breaker.state == "open"
+
+
+def test_guard_ignores_saturation_and_cancellation():
+    breaker = CircuitBreaker("hive", failure_threshold=1, reset_timeout=60)
+
+    async def run(error: BaseException) -> None:
+        with pytest.raises(type(error)):
+            async with breaker.guard():
+                raise error
+
+    asyncio.run(run(QueueTimeoutError("saturated")))
+    asyncio.run(run(asyncio.CancelledError()))
+    assert breaker.state == "closed"
+
+    asyncio.run(run(ConnectionError("down")))
+    assert breaker.state == "open"
+
+
+def test_limiter_bounds_in_flight_calls():
+    limiter = ConcurrencyLimiter("hive", max_in_flight=2, queue_timeout=5)
+    peak = 0
+
+    async def call() -> None:
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def main() -> None:
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2
+    metrics = limiter.metrics()
+    assert metrics["total_calls"] == 6
+    assert metrics["in_flight"] == 0
+    assert metrics["max_queue_depth"] >= 4
+
+
+def test_limiter_times_out_when_saturated():
+    limiter = ConcurrencyLimiter("hive", max_in_flight=1, queue_timeout=0.01)
+
+    async def main() -> None:
+        async with limiter.slot():
+            with pytest.raises(QueueTimeoutError):
+                async with limiter.slot():
+                    pass
+
+    asyncio.run(main())
+
+    assert limiter.metrics()["queue_timeouts"] == 1
+    assert limiter.queued == 0
@@ -0,0 +1,84 @@
+"""Tests for the LLM response cache."""
+
+import time
+
+from app.services.llm.response_cache import CachedResponse, LLMResponseCache, make_response_key
+
+
+def make_entry(content="hello", age=0.0) -> CachedResponse:
+    return CachedResponse(
+        chunks=[{"content": content, "tool_calls": []}],
+        prompt_tokens=10,
+        completion_tokens=2,
+        done_reason="stop",
+        first_token_ms=0,
+        duration_ms=100,
+        created_at=time.time() - age,
+    )
+
+
+def make_cache(tmp_path=None, **kwargs) -> LLMResponseCache:
+    options = {"max_entries": 10, "max_bytes": 10_000, "disk_max_bytes": 10_000, "ttl_seconds": 60}
+    options.update(kwargs)
+    return LLMResponseCache(disk_dir=str(tmp_path) if tmp_path else "", **options)
+
+
+def test_key_ignores_extra_message_fields():
+    options = {"num_predict": 10}
+    plain = [{"role": "user", "content": "hi"}]
+    extra = [{"role": "user", "content": "hi", "timestamp": "2024-01-01", "tool_calls": []}]
+
+    assert make_response_key("m", options, plain, None) == make_response_key("m", options, extra, [])
+    assert make_response_key("m", options, plain, None) != make_response_key("n", options, plain, None)
+
+
+def test_memory_hit():
+    cache = make_cache()
+    cache.put("k", make_entry())
+
+    assert cache.get("k").content == "hello"
+    assert cache.stats()["hits"] == 1
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = make_cache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, make_entry())
+    cache.get("a")
+    cache.put("c", make_entry())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    small = make_cache(max_bytes=make_entry().size * 2)
+    for key in ("a", "b", "c"):
+        small.put(key, make_entry())
+    assert small.stats()["entries"] == 2
+    assert small.get("a") is None
+
+
+def test_expired_memory_entry_misses():
+    cache = make_cache()
+    cache.put("k", make_entry(age=120))
+
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_disk_entry_is_promoted(tmp_path):
+    make_cache(tmp_path).put("k", make_entry())
+    cache = make_cache(tmp_path)
+
+    assert cache.get("k").content == "hello"
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_expired_disk_entry_misses_and_is_deleted(tmp_path):
+    make_cache(tmp_path).put("k", make_entry(age=120))
+    cache = make_cache(tmp_path)
+    path = tmp_path / "k" / "k.json"
+    assert path.exists()
+
+    assert cache.get("k") is None
+    assert not path.exists()
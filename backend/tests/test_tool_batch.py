@@ -0,0 +1,90 @@
+"""Tests for tool batch memoization."""
+
+import asyncio
+
+from app.api.schemas.mcp import ToolExecution
+from app.services.chat.tool_batch import ToolBatch
+
+CALL = {"id": "1", "name": "list_tables", "arguments": {}}
+
+
+class FakeManager:
+    """MCP manager stub serving one tool from `server`, refusing like the real one."""
+
+    def __init__(self, server: str = "hive"):
+        self.server = server
+        self.enabled = {"hive", "insee"}
+        self.calls = 0
+
+    def is_memoizable(self, tool_name):
+        return True
+
+    def get_tool_server(self, tool_name):
+        return self.server
+
+    def get_enabled_servers(self):
+        return frozenset(self.enabled)
+
+    async def call_tool(self, name, arguments, servers=None):
+        self.calls += 1
+        allowed = self.server in self.enabled and (servers is None or self.server in servers)
+        return ToolExecution(
+            name=name,
+            arguments=arguments,
+            success=allowed,
+            result_preview="tables" if allowed else f"Server '{self.server}' is not allowed",
+            duration_ms=0,
+            server_name=self.server,
+        )
+
+
+def run_call(manager, servers, memo):
+    async def main():
+        batch = ToolBatch(manager, servers, max_parallel=4, memo=memo)
+        batch.submit(dict(CALL))
+        await batch.wait()
+        return batch.results()[0][1]
+
+    return asyncio.run(main())
+
+
+def test_identical_call_is_reused():
+    manager, memo = FakeManager(), {}
+    run_call(manager, frozenset({"hive"}), memo)
+
+    execution = run_call(manager, frozenset({"hive"}), memo)
+
+    assert execution.reused and execution.success
+    assert manager.calls == 1
+
+
+def test_memo_is_not_used_for_a_server_outside_the_request():
+    manager, memo = FakeManager(), {}
+    run_call(manager, frozenset({"hive"}), memo)
+
+    execution = run_call(manager, frozenset({"insee"}), memo)
+
+    assert not execution.success and not execution.reused
+    assert manager.calls == 2
+
+
+def test_memo_is_not_used_for_a_disabled_server():
+    manager, memo = FakeManager(), {}
+    run_call(manager, None, memo)
+    manager.enabled.discard("hive")
+
+    execution = run_call(manager, None, memo)
+
+    assert not execution.success and not execution.reused
+    assert manager.calls == 2
+
+
+def test_memo_is_scoped_to_the_tool_server():
+    manager, memo = FakeManager(), {}
+    run_call(manager, None, memo)
+    manager.server = "insee"
+
+    execution = run_call(manager, None, memo)
+
+    assert not execution.reused
+    assert manager.calls == 2
@@ -0,0 +1,91 @@
+"""Tests for the MCP tool result cache."""
+
+import json
+
+from mcp.types import CallToolResult, TextContent
+
+from app.services.mcp.cache import ToolResultCache, is_error_result, make_cache_key
+
+
+def make_result(payload, is_error=False) -> CallToolResult:
+    text = payload if isinstance(payload, str) else json.dumps(payload)
+    return CallToolResult(content=[TextContent(type="text", text=text)], isError=is_error)
+
+
+def test_cache_key_ignores_argument_order():
+    assert make_cache_key("hive", "t", {"a": 1, "b": 2}) == make_cache_key("hive", "t", {"b": 2, "a": 1})
+    assert make_cache_key("hive", "t", {"a": 1}) != make_cache_key("hive", "t", {"a": 2})
+
+
+def test_get_returns_stored_result():
+    cache = ToolResultCache()
+    key = make_cache_key("hive", "list_tables", {})
+    cache.put(key, make_result(["a", "b"]), "a\nb", ttl=60)
+
+    entry = cache.get(key)
+
+    assert entry is not None
+    assert entry.preview == "a\nb"
+    assert cache.stats()["hits"] == 1
+
+
+def test_expired_entry_misses():
+    cache = ToolResultCache()
+    key = make_cache_key("hive", "list_tables", {})
+    cache.put(key, make_result(["a"]), "a", ttl=0)
+
+    assert cache.get(key) is None
+    assert cache.stats() == {"entries": 0, "bytes": 0, "hits": 0, "misses": 1}
+
+
+def test_evicts_least_recently_used():
+    cache = ToolResultCache(max_entries=2)
+    keys = [make_cache_key("hive", "t", {"i": i}) for i in range(3)]
+    cache.put(keys[0], make_result([0]), "0", ttl=60)
+    cache.put(keys[1], make_result([1]), "1", ttl=60)
+    cache.get(keys[0])
+    cache.put(keys[2], make_result([2]), "2", ttl=60)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_memory_cap_evicts_and_rejects_oversized():
+    cache = ToolResultCache(max_bytes=10)
+    small = make_cache_key("hive", "t", {"i": 1})
+    large = make_cache_key("hive", "t", {"i": 2})
+    cache.put(small, make_result("12345"), "", ttl=60)
+    cache.put(large, make_result("x" * 11), "", ttl=60)
+
+    assert cache.get(large) is None
+    assert cache.get(small) is not None
+    assert cache.stats()["bytes"] == 5
+
+
+def test_invalidate_server():
+    cache = ToolResultCache()
+    cache.put(make_cache_key("hive", "t", {}), make_result([1]), "", ttl=60)
+    cache.put(make_cache_key("insee", "t", {}), make_result([1]), "", ttl=60)
+
+    assert cache.invalidate_server("hive") == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_error_results_are_not_cached():
+    cache = ToolResultCache()
+    flagged = make_cache_key("hive", "t", {"i": 1})
+    in_payload = make_cache_key("hive", "t", {"i": 2})
+    cache.put(flagged, make_result("boom", is_error=True), "boom", ttl=60)
+    cache.put(in_payload, make_result({"error": "Hive unavailable"}), "error", ttl=60)
+
+    assert cache.get(flagged) is None
+    assert cache.get(in_payload) is None
+
+
+def test_is_error_result():
+    assert is_error_result(make_result("boom", is_error=True))
+    assert is_error_result(make_result({"error": "Hive unavailable"}))
+    assert not is_error_result(make_result({"status": "success", "error": None}))
+    assert not is_error_result(make_result([{"error": "a column value"}]))
+    assert not is_error_result(make_result("error: not JSON"))
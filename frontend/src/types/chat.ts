@@ -63,6 +63,10 @@ export interface ToolExecution {
   result_preview: string;
   duration_ms: number;
   success: boolean;
+  cached?: boolean;
+  reused?: boolean;
+  artifact_id?: string | null; // Full result, served by /artifacts/{id}
+  result_size?: number; // Full result size in bytes
 }
 
 export interface TokenUsage {
@@ -72,7 +76,7 @@ export interface TokenUsage {
 }
 
 // SSE Stream Events
-export type StreamEventType = 'content' | 'tool_call' | 'tool_result' | 'done' | 'error';
+export type StreamEventType = 'content' | 'tool_call' | 'tool_result' | 'queued' | 'done' | 'error';
 
 export interface StreamContentEvent {
   type: 'content';
@@ -86,6 +90,7 @@ export interface StreamToolCallEvent {
     name: string;
     arguments: Record<string, unknown>;
     mcp_server?: string; // MCP server handling this tool
+    prefetched?: boolean; // Injected by the backend schema prefetch, not requested by the model
   };
 }
 
@@ -98,6 +103,19 @@ export interface StreamToolResultEvent {
     preview: string;
     duration_ms: number;
     mcp_server?: string; // MCP server that handled this tool
+    cached?: boolean; // Served from the backend tool result cache
+    reused?: boolean; // Same call already made earlier in this conversation
+    artifact_id?: string | null; // Full result, served by /artifacts/{id}
+    result_size?: number; // Full result size in bytes
+    prefetched?: boolean; // Injected by the backend schema prefetch, not requested by the model
+  };
+}
+
+export interface StreamQueuedEvent {
+  type: 'queued';
+  queue: {
+    position: number; // 1 = next to be served
+    model: string;
   };
 }
 
@@ -116,6 +134,7 @@ export interface StreamErrorEvent {
   error: {
     code: string;
     message: string;
+    status?: string; // HTTP-like status, e.g. "503" on QUEUE_TIMEOUT
   };
 }
 
@@ -123,5 +142,6 @@ export type StreamEvent =
   | StreamContentEvent
   | StreamToolCallEvent
   | StreamToolResultEvent
+  | StreamQueuedEvent
   | StreamDoneEvent
   | StreamErrorEvent;